@@ -1,23 +1,17 @@
 from __future__ import annotations
 
+import importlib
 from typing import Dict, Type
 
 from .base import BaseAIProvider, ProviderNotAvailable
 from .mock_provider import MockProvider
 
-PROVIDERS: Dict[str, Type[BaseAIProvider]] = {
+# "module:Class" entries are imported on first use so the optional SDKs load only when needed.
+PROVIDERS: Dict[str, Type[BaseAIProvider] | str] = {
     "mock": MockProvider,
+    "openai": "openai_provider:OpenAIProvider",
 }
 
-try:  # pragma: no cover - optional dependency
-    from .openai_provider import OpenAIProvider
-
-    PROVIDERS["openai"] = OpenAIProvider
-except ProviderNotAvailable:
-    pass
-except Exception:  # ImportError
-    pass
-
 
 def get_provider(name: str, **kwargs) -> BaseAIProvider:
     name = name.lower()
@@ -25,4 +19,8 @@ def get_provider(name: str, **kwargs) -> BaseAIProvider:
         raise ProviderNotAvailable(
             f"Unknown AI provider '{name}'. Available: {', '.join(PROVIDERS)}"
         )
-    return PROVIDERS[name](**kwargs)
+    provider = PROVIDERS[name]
+    if isinstance(provider, str):
+        module_name, _, class_name = provider.partition(":")
+        provider = getattr(importlib.import_module(f".{module_name}", __name__), class_name)
+    return provider(**kwargs)
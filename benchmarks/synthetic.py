@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+import pytest
+from homelab_cost_optimizer.config import ElectricityConfig, ScenarioConfig
+from homelab_cost_optimizer.consolidators.heuristic_consolidator import HeuristicConsolidator
+from homelab_cost_optimizer.estimators.cost_estimator import CostReport, estimate_cost
+from homelab_cost_optimizer.estimators.power_estimator import PowerReport, build_power_report
+from homelab_cost_optimizer.models import ConsolidationPlan, Inventory, PowerProfile
+
+FIXTURES = Path(__file__).parent / "fixtures"
+WORKLOAD_COUNTS = tuple(10**exponent for exponent in range(2, 7))
+MAX_WORKLOADS = int(os.environ.get("BENCHMARK_MAX_WORKLOADS", 10**4))
+WORKLOADS_PER_NODE = 10
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+ELECTRICITY = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+SCENARIO = ScenarioConfig(
+    name="benchmark", cpu_threshold=0.3, ram_threshold=0.3, max_node_utilization=0.8
+)
+
+T = TypeVar("T")
+
+
+def workload_counts(counts: Sequence[int] = WORKLOAD_COUNTS, argname: str = "workloads"):
+    """Parametrize ``argname`` over ``counts``; sizes above ``BENCHMARK_MAX_WORKLOADS`` skip."""
+    return pytest.mark.parametrize(
+        argname,
+        [
+            pytest.param(
+                count,
+                id=f"{count:.0e}".replace("+0", ""),
+                marks=pytest.mark.skipif(
+                    count > MAX_WORKLOADS, reason="raise BENCHMARK_MAX_WORKLOADS to run"
+                ),
+            )
+            for count in counts
+        ],
+    )
+
+
+def inventory_dict(workloads: int, seed: int = 0) -> Dict[str, Any]:
+    """Serialized inventory with ``WORKLOADS_PER_NODE`` workloads per node on average."""
+    rng = random.Random(seed)
+    node_count = max(workloads // WORKLOADS_PER_NODE, 1)
+    profile = {
+        "name": PROFILE.name,
+        "base_idle_watts": PROFILE.base_idle_watts,
+        "watts_per_cpu_core": PROFILE.watts_per_cpu_core,
+        "watts_per_gb_ram": PROFILE.watts_per_gb_ram,
+    }
+    nodes = [
+        {
+            "name": f"node-{index}",
+            "kind": "hypervisor",
+            "total_cpu": rng.choice((16, 32, 64)),
+            "total_memory_gb": rng.choice((64, 128, 256)),
+            "power_profile": profile,
+        }
+        for index in range(node_count)
+    ]
+    return {
+        "nodes": nodes,
+        "workloads": [
+            {
+                "name": f"vm-{index}",
+                "workload_type": rng.choice(("vm", "lxc", "container")),
+                "vcpus": rng.choice((1, 2, 4)),
+                "memory_gb": rng.choice((1, 2, 4, 8)),
+                "utilization_cpu": round(rng.betavariate(1.5, 6), 3),
+                "utilization_memory": round(rng.betavariate(2, 4), 3),
+                "node": f"node-{rng.randrange(node_count)}",
+                "uptime_hours": rng.randrange(24 * 90),
+                "labels": {"tier": rng.choice(("prod", "lab"))},
+            }
+            for index in range(workloads)
+        ],
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def synthetic_inventory(workloads: int) -> Inventory:
+    return Inventory.from_dict(inventory_dict(workloads))
+
+
+@functools.lru_cache(maxsize=None)
+def analysis(workloads: int) -> Tuple[Inventory, PowerReport, CostReport, ConsolidationPlan]:
+    """Inventory plus the reports and plan the reporters render, computed once per size."""
+    inventory = synthetic_inventory(workloads)
+    power_report = build_power_report(inventory)
+    cost_report = estimate_cost(power_report, ELECTRICITY)
+    plan = HeuristicConsolidator(SCENARIO, ELECTRICITY).build_plan(inventory)
+    return inventory, power_report, cost_report, plan
+
+
+def fixture_text(name: str) -> str:
+    return (FIXTURES / name).read_text()
+
+
+def fixture_json(name: str) -> Any:
+    return json.loads(fixture_text(name))
+
+
+def repeat(records: Sequence[T], count: int, rename: Callable[[T, int], T]) -> List[T]:
+    """Cycle recorded ``records`` up to ``count`` entries, giving each copy a unique name."""
+    return [rename(records[index % len(records)], index) for index in range(count)]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+
+from homelab_cost_optimizer.collectors.docker_collector import DockerCollector
+from homelab_cost_optimizer.collectors.k8s_collector import KubernetesCollector
+from homelab_cost_optimizer.collectors.libvirt_collector import LibvirtCollector
+from homelab_cost_optimizer.collectors.proxmox_collector import ProxmoxCollector
+from synthetic import PROFILE, fixture_json, fixture_text, repeat, workload_counts
+
+COLLECTOR_COUNTS = (10**2, 10**3, 10**4, 10**5)
+
+
+def _renamed(item: dict, index: int, key: str = "name") -> dict:
+    return {**item, key: f"{item[key]}-{index}"}
+
+
+def _renamed_row(row: str, index: int) -> str:
+    domain_id, name, state = row.split(maxsplit=2)
+    return f" {domain_id:<4} {name}-{index:<12} {state}"
+
+
+@workload_counts(COLLECTOR_COUNTS)
+def test_proxmox_parser(benchmark, workloads):
+    resources = fixture_json("proxmox_resources.json")["data"]
+    payloads = {
+        "/api2/json/nodes": fixture_json("proxmox_nodes.json"),
+        "/api2/json/cluster/resources?type=vm": {"data": repeat(resources, workloads, _renamed)},
+    }
+    collector = ProxmoxCollector(
+        base_url="https://pve.local:8006",
+        token_id="bench@pam!token",
+        token_secret="secret",
+        power_profile=PROFILE,
+    )
+    collector._get = payloads.__getitem__
+    inventory = benchmark(collector.collect)
+    assert len(inventory.workloads) == workloads
+
+
+@workload_counts(COLLECTOR_COUNTS)
+def test_docker_parser(benchmark, workloads):
+    lines = fixture_text("docker_stats.txt").splitlines()
+    stats = "\n".join(repeat(lines, workloads, lambda line, index: f"{index:012x}{line[12:]}"))
+    collector = DockerCollector(power_profile=PROFILE, runner=lambda args: stats)
+    inventory = benchmark(collector.collect)
+    assert len(inventory.workloads) == workloads
+
+
+@workload_counts(COLLECTOR_COUNTS)
+def test_kubernetes_parser(benchmark, workloads):
+    nodes_output = fixture_text("kubectl_nodes.json")
+    pods = fixture_json("kubectl_pods.json")
+    pods["items"] = repeat(
+        pods["items"],
+        workloads,
+        lambda item, index: {**item, "metadata": _renamed(item["metadata"], index)},
+    )
+    pods_output = json.dumps(pods)
+    collector = KubernetesCollector(
+        power_profile=PROFILE,
+        runner=lambda args: nodes_output if "nodes" in args else pods_output,
+    )
+    inventory = benchmark(collector.collect)
+    assert len(inventory.workloads) == workloads * 3 // 4
+
+
+@workload_counts(COLLECTOR_COUNTS)
+def test_libvirt_domstats_parser(benchmark, workloads):
+    blocks = fixture_text("virsh_domstats.txt").strip().split("\n\n")
+    output = "\n\n".join(
+        repeat(blocks, workloads, lambda block, index: block.replace("'\n", f"-{index}'\n", 1))
+    )
+    collector = LibvirtCollector(power_profile=PROFILE, runner=lambda args: output, batched=True)
+    inventory = benchmark(collector.collect)
+    assert len(inventory.workloads) == workloads
+
+
+@workload_counts(COLLECTOR_COUNTS)
+def test_libvirt_list_parser(benchmark, workloads):
+    header, separator, *rows = fixture_text("virsh_list.txt").splitlines()
+    output = "\n".join([header, separator] + repeat(rows, workloads, _renamed_row))
+    domains = benchmark(LibvirtCollector._domains_from_list, output)
+    assert len(domains) == workloads
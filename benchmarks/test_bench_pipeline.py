@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from homelab_cost_optimizer.consolidators.heuristic_consolidator import HeuristicConsolidator
+from homelab_cost_optimizer.estimators.cost_estimator import estimate_cost
+from homelab_cost_optimizer.estimators.power_estimator import build_power_report
+from homelab_cost_optimizer.frame import InventoryFrame
+from homelab_cost_optimizer.models import Inventory
+from synthetic import (
+    ELECTRICITY,
+    SCENARIO,
+    analysis,
+    inventory_dict,
+    synthetic_inventory,
+    workload_counts,
+)
+
+
+@workload_counts()
+def test_inventory_from_dict(benchmark, workloads):
+    data = inventory_dict(workloads)
+    inventory = benchmark(Inventory.from_dict, data)
+    assert len(inventory.workloads) == workloads
+
+
+@workload_counts()
+def test_build_power_report(benchmark, workloads):
+    inventory = synthetic_inventory(workloads)
+    report = benchmark(build_power_report, inventory)
+    assert len(report.per_node) == len(inventory.nodes)
+
+
+@workload_counts()
+def test_build_power_report_frame(benchmark, workloads):
+    frame = InventoryFrame.from_inventory(synthetic_inventory(workloads))
+    report = benchmark(build_power_report, frame)
+    assert len(report.per_node) == len(frame.nodes)
+
+
+@workload_counts()
+def test_estimate_cost(benchmark, workloads):
+    _, power_report, _, _ = analysis(workloads)
+    report = benchmark(estimate_cost, power_report, ELECTRICITY)
+    assert len(report.per_node) == len(power_report.per_node)
+
+
+@workload_counts()
+def test_build_plan(benchmark, workloads):
+    inventory = synthetic_inventory(workloads)
+    consolidator = HeuristicConsolidator(SCENARIO, ELECTRICITY)
+    plan = benchmark(consolidator.build_plan, inventory)
+    assert plan.estimated_watts_saved >= 0
+
+
+@workload_counts()
+def test_build_plan_frame(benchmark, workloads):
+    frame = InventoryFrame.from_inventory(synthetic_inventory(workloads))
+    consolidator = HeuristicConsolidator(SCENARIO, ELECTRICITY)
+    plan = benchmark(consolidator.build_plan, frame)
+    assert plan.estimated_watts_saved >= 0
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from homelab_cost_optimizer.reporters import (
+    generate_ai_report,
+    generate_markdown_report,
+    generate_sweep_report,
+    generate_text_report,
+    iter_markdown_report,
+    iter_prometheus_metrics,
+    write_lines,
+    write_structured_report,
+)
+from homelab_cost_optimizer.sweep import SweepResult
+from synthetic import SCENARIO, analysis, workload_counts
+
+from ai_providers.mock_provider import MockProvider
+
+
+@workload_counts()
+def test_text_report(benchmark, workloads):
+    report = benchmark(generate_text_report, *analysis(workloads))
+    assert report.startswith("Homelab Cost Optimizer Report")
+
+
+@workload_counts()
+def test_markdown_report(benchmark, workloads):
+    report = benchmark(generate_markdown_report, *analysis(workloads))
+    assert report.startswith("# Homelab Cost Optimizer Summary")
+
+
+@workload_counts()
+def test_ai_report(benchmark, workloads):
+    report = benchmark(generate_ai_report, MockProvider(), *analysis(workloads))
+    assert report.startswith("Mock report")
+
+
+@workload_counts((10**2, 10**3, 10**4), argname="count")
+def test_sweep_report(benchmark, count):
+    results = [
+        SweepResult(
+            scenario=SCENARIO,
+            powered_down=index % 7,
+            moves=index % 13,
+            estimated_watts_saved=float(index % 7 * 60),
+            estimated_monthly_savings=float(index % 7 * 8.76),
+            headroom=(index % 10) / 10,
+        )
+        for index in range(count)
+    ]
+    report = benchmark(generate_sweep_report, results, "USD")
+    assert report.startswith("#")
+
+
+@workload_counts()
+def test_markdown_report_streamed(benchmark, workloads, tmp_path):
+    output = tmp_path / "report.md"
+    inputs = analysis(workloads)
+    benchmark(lambda: write_lines(iter_markdown_report(*inputs), output))
+    assert output.read_text().startswith("# Homelab Cost Optimizer Summary")
+
+
+@workload_counts()
+def test_csv_report(benchmark, workloads, tmp_path):
+    output = tmp_path / "report.csv"
+    _, power_report, cost_report, plan = analysis(workloads)
+    benchmark(write_structured_report, "csv", power_report, cost_report, plan, output)
+    assert output.read_text().startswith("record,node,")
+
+
+@workload_counts()
+def test_prometheus_metrics(benchmark, workloads):
+    _, power_report, cost_report, plan = analysis(workloads)
+    text = benchmark(lambda: "\n".join(iter_prometheus_metrics(power_report, cost_report, plan)))
+    assert text.startswith("# HELP")
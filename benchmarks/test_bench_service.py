@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from itertools import cycle
+
+from homelab_cost_optimizer.models import Inventory
+from homelab_cost_optimizer.service import OptimizerService
+from synthetic import ELECTRICITY, synthetic_inventory, workload_counts
+
+
+@workload_counts()
+def test_service_refresh_one_changed_workload(benchmark, workloads):
+    inventory = synthetic_inventory(workloads)
+    changed = Inventory(nodes=inventory.nodes, workloads=list(inventory.workloads))
+    changed.workloads[0] = replace(changed.workloads[0], utilization_cpu=0.99)
+    snapshots = cycle([changed, inventory])
+    service = OptimizerService(lambda: next(snapshots), ELECTRICITY)
+    service.refresh()
+    benchmark(service.refresh)
+    assert service.state.generation > 1
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Fastest of several cold interpreter starts, including the interpreter's own start-up time.
+STARTUP_BUDGET_SECONDS = {"import": 0.3, "help": 0.8, "collect-help": 0.8, "collect-docker": 0.8}
+# A full docker collect to JSON with `docker stats` stubbed out, so only our own imports count
+COLLECT_DOCKER = (
+    "import tempfile\n"
+    "from homelab_cost_optimizer.cli import app\n"
+    "from homelab_cost_optimizer.collectors.docker_collector import DockerCollector\n"
+    "DockerCollector._run_command = lambda self, args: 'abc,12.5%,512MiB / 2GiB\\n'\n"
+    "with tempfile.TemporaryDirectory() as directory:\n"
+    "    output = directory + '/inventory.json'\n"
+    "    app(['collect', '--source', 'docker', '--output', output], standalone_mode=False)\n"
+)
+COMMANDS = {
+    "import": ["-c", "import homelab_cost_optimizer.cli"],
+    "help": ["-m", "homelab_cost_optimizer.cli", "--help"],
+    "collect-help": ["-m", "homelab_cost_optimizer.cli", "collect", "--help"],
+    "collect-docker": ["-c", COLLECT_DOCKER],
+}
+
+
+@pytest.mark.parametrize("command", list(COMMANDS))
+def test_cli_startup_within_budget(benchmark, command):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT / "optimizer"), str(ROOT)])}
+    durations: List[float] = []
+
+    def start() -> None:
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *COMMANDS[command]],
+            cwd=ROOT,  # collect reads the default config/optimizer.example.yaml
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+        durations.append(time.perf_counter() - started)
+
+    benchmark.pedantic(start, rounds=5, iterations=1)
+    assert min(durations) < STARTUP_BUDGET_SECONDS[command]
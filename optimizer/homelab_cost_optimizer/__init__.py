@@ -1,12 +1,27 @@
 """homelab-cost-optimizer Python package."""
 
+from typing import TYPE_CHECKING
+
 from .models import Inventory, Node, PowerProfile, Workload
 
+if TYPE_CHECKING:
+    from .frame import InventoryFrame
+
 __all__ = [
     "Inventory",
+    "InventoryFrame",
     "Node",
     "PowerProfile",
     "Workload",
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    # InventoryFrame pulls in numpy; defer it so light entry points (CLI --help) stay fast.
+    if name == "InventoryFrame":
+        from .frame import InventoryFrame
+
+        return InventoryFrame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import __version__
+from .estimators.cost_estimator import CostBreakdown, CostReport
+from .estimators.power_estimator import NodePowerUsage, PowerReport
+from .models import Node
+
+# Bump whenever the cached payload's shape or the estimators' results change; entries written
+# under another schema are never read back.
+CACHE_SCHEMA = 1
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Entries carry their own suffix so eviction never touches other files in a shared directory
+ENTRY_SUFFIX = ".hco-cache.json"
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(files: Sequence[Optional[Path]], settings: Any) -> str:
+    """Key derived from the bytes of ``files`` (``None`` entries allowed) and ``settings``.
+
+    ``settings`` is JSON encoded after converting dataclasses. ``CACHE_SCHEMA`` and the package
+    version are mixed in, so a change to the estimators invalidates old entries only if it bumps
+    one of them.
+    """
+    digest = hashlib.sha256(f"{CACHE_SCHEMA}:{__version__}".encode())
+    for path in files:
+        digest.update(b"\0" + (file_digest(path).encode() if path is not None else b"-"))
+    digest.update(
+        json.dumps(
+            settings,
+            sort_keys=True,
+            default=lambda value: asdict(value) if is_dataclass(value) else str(value),
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """JSON results in a directory, evicted least-recently-used beyond a count or size limit.
+
+    Reads refresh an entry's modification time, which serves as its recency. Only files named
+    with ``ENTRY_SUFFIX`` are read, evicted or dropped; anything else in the directory is left alone.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text())
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except ValueError:  # truncated entry; drop it and recompute
+            path.unlink(missing_ok=True)
+            return None
+        return data
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        partial = path.with_name(path.name + ".partial")
+        partial.write_text(json.dumps(value))
+        os.replace(partial, path)
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort(reverse=True)
+        total = 0
+        for position, (_, size, path) in enumerate(entries):
+            total += size
+            if position >= self.max_entries or (position and total > self.max_bytes):
+                path.unlink(missing_ok=True)
+
+
+def reports_to_dict(power_report: PowerReport, cost_report: CostReport) -> Dict[str, Any]:
+    return {
+        "watts": [entry.watts for entry in power_report.per_node],
+        "currency": cost_report.currency,
+        "kwh_month": [entry.kwh_month for entry in cost_report.per_node],
+        "monthly_cost": [entry.monthly_cost for entry in cost_report.per_node],
+    }
+
+
+def reports_from_dict(data: Dict[str, Any], nodes: List[Node]) -> Tuple[PowerReport, CostReport]:
+    """Rebuild cached reports for ``nodes``, which must be the inventory the key was built from."""
+    if len(data["watts"]) != len(nodes):
+        raise ValueError("Cached reports do not match the inventory's nodes")
+    power_report = PowerReport(
+        per_node=[
+            NodePowerUsage(node=node, watts=watts)
+            for node, watts in zip(nodes, data["watts"], strict=True)
+        ]
+    )
+    cost_report = CostReport(
+        currency=data["currency"],
+        per_node=[
+            CostBreakdown(node=node.name, kwh_month=kwh, monthly_cost=cost)
+            for node, kwh, cost in zip(nodes, data["kwh_month"], data["monthly_cost"], strict=True)
+        ],
+    )
+    return power_report, cost_report
@@ -1,35 +1,311 @@
 from __future__ import annotations
 
+import functools
 import json
+import time
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Callable, Collection, List, NamedTuple, Optional
 
 import typer
-from rich.console import Console
 
-from ai_providers import ProviderNotAvailable, get_provider
+from .profiling import Instrumentation, instrument, phase, profile_to
 
-from .collectors import collect as run_collector
-from .config import load_electricity_config, load_optimizer_config
-from .consolidators.heuristic_consolidator import HeuristicConsolidator
-from .estimators.cost_estimator import estimate_cost
-from .estimators.power_estimator import build_power_report
-from .models import Inventory
-from .reporters import generate_ai_report, generate_markdown_report, generate_text_report
+# Subcommands import what they use when they run, so `--help` and a cron-driven
+# `collect --source docker` do not pay for requests, rich, numpy-heavy planners or AI providers.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .config import CollectionConfig, ElectricityConfig, OptimizerConfig
+    from .delta import InventoryDelta
+    from .estimators.cost_estimator import CostReport
+    from .estimators.power_estimator import PowerReport
+    from .frame import InventoryFrame
+    from .history import UtilizationHistory
+    from .models import Inventory
 
 app = typer.Typer(help="Homelab cost optimizer CLI")
-console = Console()
 
 
-def _load_inventory(path: Path) -> Inventory:
-    data = json.loads(path.read_text())
-    return Inventory.from_dict(data)
+@functools.lru_cache(maxsize=None)
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    timings: Annotated[
+        Optional[Path],
+        typer.Option(help="Write wall time and call counts per pipeline phase as JSON"),
+    ] = None,
+    trace_memory: Annotated[
+        bool, typer.Option(help="Add peak memory per phase to --timings (tracemalloc; slower)")
+    ] = False,
+    profile: Annotated[
+        Optional[Path], typer.Option(help="Write cProfile statistics (pstats format)")
+    ] = None,
+) -> None:
+    if trace_memory and timings is None:
+        raise typer.BadParameter("--trace-memory requires --timings")
+    if timings is None and profile is None:
+        return
+    stack = ExitStack()
+    if profile is not None:
+        stack.enter_context(profile_to(profile))
+    instrumentation = stack.enter_context(instrument(trace_memory=trace_memory))
+
+    def finish() -> None:
+        stack.close()
+        if profile is not None:
+            _console().print(f"Profile written to {profile} (inspect with python -m pstats)")
+        if timings is not None:
+            _write_timings(instrumentation, ctx.invoked_subcommand, timings)
+
+    ctx.call_on_close(finish)
+
+
+def _write_timings(instrumentation: Instrumentation, command: Optional[str], path: Path) -> None:
+    from rich.table import Table
+
+    summary = {"command": command, **instrumentation.summary()}
+    path.write_text(json.dumps(summary, indent=2))
+    table = Table("Phase", "Calls", "Wall (s)", "Peak memory (MiB)", title="Timings")
+    for stats in instrumentation.phases.values():
+        peak = stats.peak_memory_bytes
+        table.add_row(
+            stats.name,
+            str(stats.calls),
+            f"{stats.wall_seconds:.3f}",
+            f"{peak / 2**20:.1f}" if peak is not None else "-",
+        )
+    _console().print(table)
+    _console().print(f"Total {summary['total_seconds']:.3f}s; timings written to {path}")
+
+
+class _AppliedDelta(NamedTuple):
+    """A ``--delta`` file and the base inventory it was applied to."""
+
+    path: Path
+    base: Inventory
+    delta: InventoryDelta
+
+
+def _load_inventory(path: Path) -> Inventory | InventoryFrame:
+    from .inventory_io import load_inventory
+
+    with phase("load_inventory"):
+        return load_inventory(path)
+
+
+def _load_with_delta(
+    path: Path, delta: Optional[Path]
+) -> tuple[Inventory | InventoryFrame, Optional[_AppliedDelta]]:
+    """The inventory at ``path`` with ``delta`` applied, plus what is needed to reuse base results.
+
+    The delta's base is checked by hashing the file's bytes; deltas written without a
+    ``base_file_digest`` fall back to the digest of the parsed inventory.
+    """
+    from .cache import file_digest
+    from .delta import apply_delta, load_delta
+    from .frame import as_inventory
+
+    if delta is None:
+        return _load_inventory(path), None
+    changes = load_delta(delta)
+    if changes.base_file_digest and file_digest(path) != changes.base_file_digest:
+        raise ValueError("Inventory delta was computed against a different base snapshot")
+    base = as_inventory(_load_inventory(path))
+    with phase("apply_delta"):
+        inventory = apply_delta(base, changes, verify=not changes.base_file_digest)
+    return inventory, _AppliedDelta(delta, base, changes)
+
+
+def _save_inventory(inventory: Inventory, path: Path) -> None:
+    """Plain JSON is written here so that a JSON collect never imports numpy via ``inventory_io``."""
+    if path.suffix.lower() == ".json":
+        path.write_text(json.dumps(inventory.to_dict(), indent=2))
+        return
+    from .inventory_io import save_inventory
+
+    save_inventory(inventory, path)
+
+
+def _store_collection(
+    inventory: Inventory, output: Path, delta_from: Optional[Path], history: Optional[Path]
+) -> None:
+    # Each option imports only what it needs; the history, delta and binary paths load numpy
+    if history is not None:
+        from .history import record_history
+
+        with phase("record_history"):
+            record_history(inventory, history)
+    if delta_from is None:
+        with phase("save_inventory"):
+            _save_inventory(inventory, output)
+        _console().print(f"Inventory saved to {output}")
+        return
+    from .cache import file_digest
+    from .delta import diff_inventories, save_delta
+    from .frame import as_inventory
+    from .inventory_io import load_inventory
+
+    with phase("diff_inventories"):
+        delta = diff_inventories(as_inventory(load_inventory(delta_from)), inventory)
+        delta.base_file_digest = file_digest(delta_from)
+    with phase("save_inventory"):
+        save_delta(delta, output)
+    _console().print(
+        f"Inventory delta saved to {output} ({len(delta.touched_nodes())} nodes touched)"
+    )
+
+
+def _percentile_view(
+    inventory: Inventory | InventoryFrame,
+    store: Optional[UtilizationHistory],
+    percentile: float,
+    window_hours: float,
+) -> Inventory | InventoryFrame:
+    if store is None:
+        return inventory
+    with phase("percentiles"):
+        return store.with_percentile(inventory, percentile, window_hours * 3600)
+
+
+def _estimate_cost(
+    inventory: Inventory | InventoryFrame,
+    power_report: PowerReport,
+    electricity: ElectricityConfig,
+    store: Optional[UtilizationHistory],
+    window_hours: float,
+    previous: Optional[CostReport] = None,
+    touched: Collection[str] = (),
+) -> CostReport:
+    """Price against the tariff hours using the history's hour-of-week profile when available.
+
+    A steady-draw ``previous`` report for the same tariff is reused for nodes not in ``touched``.
+    """
+    from .estimators.cost_estimator import estimate_cost, update_cost_report
+    from .estimators.power_estimator import build_hourly_watts
+
+    if store is None or not electricity.time_of_use:
+        with phase("cost"):
+            if previous is not None:
+                return update_cost_report(previous, power_report, electricity, touched)
+            return estimate_cost(power_report, electricity)
+    with phase("hourly_power"):
+        cpu, memory = store.hourly_utilization(
+            inventory, window_hours * 3600, utc_offset_seconds=time.localtime().tm_gmtoff
+        )
+        hourly_watts = build_hourly_watts(inventory, cpu, memory)
+    with phase("cost"):
+        return estimate_cost(power_report, electricity, hourly_watts=hourly_watts)
+
+
+def _power_and_cost(
+    inventory: Inventory | InventoryFrame,
+    electricity: ElectricityConfig,
+    store: Optional[UtilizationHistory],
+    window_hours: float,
+    cache_dir: Optional[Path],
+    input: Path,
+    history: Optional[Path],
+    applied: Optional[_AppliedDelta] = None,
+) -> tuple[PowerReport, CostReport]:
+    """Power and cost reports, served from ``cache_dir`` when the input files are unchanged.
+
+    With a delta applied and the base inventory's reports in the cache, only the nodes the delta
+    touches are re-estimated.
+    """
+    from .cache import ResultCache, cache_key, reports_from_dict, reports_to_dict
+    from .estimators.power_estimator import build_power_report, update_power_report
+    from .history import POWER_PERCENTILE
+
+    cache = ResultCache(cache_dir) if cache_dir is not None else None
+    base_reports = None
+    if cache is not None:
+        with phase("cache"):
+            settings = [electricity, window_hours, time.localtime().tm_gmtoff]
+            key = cache_key([input, applied.path if applied else None, history], settings)
+            cached = cache.get(key)
+            if cached is not None:
+                return reports_from_dict(cached, list(inventory.nodes))
+            if applied is not None:
+                base_cached = cache.get(cache_key([input, None, history], settings))
+                if base_cached is not None:
+                    base_reports = reports_from_dict(base_cached, applied.base.nodes)
+    power_inventory = _percentile_view(inventory, store, POWER_PERCENTILE, window_hours)
+    touched = applied.delta.touched_nodes() if applied else set()
+    with phase("power"):
+        if base_reports is None:
+            power_report = build_power_report(power_inventory)
+        else:
+            power_report = update_power_report(base_reports[0], power_inventory, touched)
+    cost_report = _estimate_cost(
+        inventory,
+        power_report,
+        electricity,
+        store,
+        window_hours,
+        previous=base_reports[1] if base_reports else None,
+        touched=touched,
+    )
+    if cache is not None:
+        with phase("cache"):
+            cache.put(key, reports_to_dict(power_report, cost_report))
+    return power_report, cost_report
+
+
+def _profile_assigner(optimizer_conf: OptimizerConfig) -> Callable[[Inventory], Inventory]:
+    """The config's ``power_profile_rules``, compiled once; unmatched nodes keep their profile."""
+    if not optimizer_conf.profile_rules:
+        return lambda inventory: inventory
+    from .profiles import ProfileAssigner
+
+    assigner = ProfileAssigner(optimizer_conf.profile_rules, optimizer_conf.power_profiles)
+
+    def assign(inventory: Inventory) -> Inventory:
+        with phase("assign_profiles"):
+            return assigner.apply(inventory)
+
+    return assign
+
+
+def _source_specs(collection: CollectionConfig, optimizer_conf: OptimizerConfig) -> List[dict]:
+    return [
+        {
+            "source": item.source,
+            "power_profile": optimizer_conf.get_power_profile(item.power_profile),
+            **item.options,
+        }
+        for item in collection.sources
+    ]
 
 
 @app.command()
 def collect(
-    source: Annotated[str, typer.Option(help="Source platform: proxmox|libvirt|docker|k8s")],
-    output: Annotated[Path, typer.Option(help="Destination JSON file")],
+    output: Annotated[
+        Path, typer.Option(help="Destination inventory file (.json, .jsonl or .hcoi)")
+    ],
+    source: Annotated[
+        Optional[str], typer.Option(help="Source platform: proxmox|libvirt|docker|k8s")
+    ] = None,
+    sources_config: Annotated[
+        Optional[Path],
+        typer.Option(help="YAML list of sources to collect concurrently and merge"),
+    ] = None,
+    use_asyncio: Annotated[
+        bool, typer.Option("--asyncio", help="Poll --sources-config sources from one event loop")
+    ] = False,
+    delta_from: Annotated[
+        Optional[Path],
+        typer.Option(help="Base inventory; write only the changes against it to --output"),
+    ] = None,
+    history: Annotated[
+        Optional[Path], typer.Option(help="Utilization history store (.npz) to append to")
+    ] = None,
     optimizer_config: Annotated[Path, typer.Option(help="Optimizer config")] = Path(
         "config/optimizer.example.yaml"
     ),
@@ -40,13 +316,44 @@ def collect(
     token_id: Annotated[Optional[str], typer.Option(help="Proxmox API token ID")] = None,
     token_secret: Annotated[Optional[str], typer.Option(help="Proxmox API token secret")] = None,
     verify_ssl: Annotated[bool, typer.Option(help="Verify TLS certificates")] = True,
+    proxmox_node_details: Annotated[
+        bool, typer.Option(help="Fetch per-node status and RRD utilization from Proxmox")
+    ] = False,
     uri: Annotated[str, typer.Option(help="Libvirt connection URI")] = "qemu:///system",
+    libvirt_workers: Annotated[
+        int, typer.Option(help="Concurrent virsh dominfo calls for libvirt")
+    ] = 1,
+    libvirt_domstats: Annotated[
+        bool, typer.Option(help="Fetch all libvirt domains with one virsh domstats call")
+    ] = False,
     host_name: Annotated[
         str, typer.Option(help="Local host name for libvirt/docker")
     ] = "edge-host",
     context: Annotated[Optional[str], typer.Option(help="Kubernetes context name")] = None,
 ) -> None:
+    from .collectors import collect_many, create_collector
+    from .config import load_collection_config, load_optimizer_config
+
     optimizer_conf = load_optimizer_config(optimizer_config)
+    assign_profiles = _profile_assigner(optimizer_conf)
+    if sources_config:
+        collection = load_collection_config(sources_config)
+        specs = _source_specs(collection, optimizer_conf)
+        with phase("collect"):
+            if use_asyncio:
+                import asyncio
+
+                from .collectors import acollect_many
+
+                inventory = asyncio.run(
+                    acollect_many(specs, max_concurrency=collection.max_workers)
+                )
+            else:
+                inventory = collect_many(specs, max_workers=collection.max_workers)
+        _store_collection(assign_profiles(inventory), output, delta_from, history)
+        return
+    if not source:
+        raise typer.BadParameter("either --source or --sources-config is required")
     power_profile = optimizer_conf.get_power_profile(power_profile_name)
     kwargs = {"power_profile": power_profile}
     if source == "proxmox":
@@ -60,50 +367,111 @@ def collect(
                 "token_id": token_id,
                 "token_secret": token_secret,
                 "verify_ssl": verify_ssl,
+                "fetch_node_details": proxmox_node_details,
             }
         )
     elif source == "libvirt":
-        kwargs.update({"uri": uri, "host_name": host_name})
+        kwargs.update(
+            {
+                "uri": uri,
+                "host_name": host_name,
+                "max_workers": libvirt_workers,
+                "batched": libvirt_domstats,
+            }
+        )
     elif source == "docker":
         kwargs.update({"host_name": host_name})
     elif source == "k8s":
         kwargs.update({"context": context})
-    inventory = run_collector(source, **kwargs)
-    output.write_text(json.dumps(inventory.to_dict(), indent=2))
-    console.print(f"Inventory saved to {output}")
+    with phase("collect"):
+        inventory = create_collector(source, **kwargs).collect()
+    _store_collection(assign_profiles(inventory), output, delta_from, history)
+
+
+@app.command()
+def convert(
+    input: Annotated[Path, typer.Option(help="Existing inventory (.json, .jsonl or .hcoi)")],
+    output: Annotated[Path, typer.Option(help="Destination inventory (.json, .jsonl or .hcoi)")],
+) -> None:
+    from .inventory_io import save_inventory
+
+    inventory = _load_inventory(input)
+    with phase("save_inventory"):
+        save_inventory(inventory, output)
+    _console().print(f"Inventory converted to {output}")
 
 
 @app.command()
 def analyze(
-    input: Annotated[Path, typer.Option(help="Inventory JSON from the collect step")],
+    input: Annotated[
+        Path, typer.Option(help="Inventory (.json, .jsonl or .hcoi) from the collect step")
+    ],
     electricity_config: Annotated[Path, typer.Option(help="Electricity tariff configuration")],
     optimizer_config: Annotated[Path, typer.Option(help="Optimizer config")] = Path(
         "config/optimizer.example.yaml"
     ),
     scenario: Annotated[Optional[str], typer.Option(help="Scenario name to evaluate")] = None,
-    report_format: Annotated[str, typer.Option(help="Report style: text or markdown")] = "text",
+    report_format: Annotated[
+        str,
+        typer.Option(help="Report style: text, markdown, jsonl, csv, parquet or prometheus"),
+    ] = "text",
     output: Annotated[Path, typer.Option(help="Output file path")] = Path("report.txt"),
+    delta: Annotated[
+        Optional[Path], typer.Option(help="Delta from collect --delta-from to apply to --input")
+    ] = None,
+    history: Annotated[
+        Optional[Path], typer.Option(help="Utilization history from collect --history")
+    ] = None,
+    window_hours: Annotated[
+        float, typer.Option(help="History window used for the p50/p95 utilization")
+    ] = 168.0,
+    cache_dir: Annotated[
+        Optional[Path], typer.Option(help="Reuse power/cost results for unchanged inputs")
+    ] = None,
 ) -> None:
-    inventory = _load_inventory(input)
-    electricity = load_electricity_config(electricity_config)
-    optimizer_conf = load_optimizer_config(optimizer_config)
+    from .config import load_electricity_config, load_optimizer_config
+    from .consolidators import create_consolidator
+    from .history import PLANNING_PERCENTILE, load_history
+    from .reporters import (
+        STRUCTURED_WRITERS,
+        iter_markdown_report,
+        iter_prometheus_metrics,
+        iter_text_report,
+        write_lines,
+        write_structured_report,
+    )
+
+    inventory, applied = _load_with_delta(input, delta)
+    with phase("load_config"):
+        store = load_history(history) if history else None
+        electricity = load_electricity_config(electricity_config)
+        optimizer_conf = load_optimizer_config(optimizer_config)
 
-    power_report = build_power_report(inventory)
-    cost_report = estimate_cost(power_report, electricity)
+    power_report, cost_report = _power_and_cost(
+        inventory, electricity, store, window_hours, cache_dir, input, history, applied
+    )
 
     plan = None
     if scenario:
         scenario_conf = optimizer_conf.get_scenario(scenario)
-        consolidator = HeuristicConsolidator(scenario_conf, electricity)
-        plan = consolidator.build_plan(inventory)
+        consolidator = create_consolidator(scenario_conf, electricity)
+        plan_inventory = _percentile_view(inventory, store, PLANNING_PERCENTILE, window_hours)
+        with phase("plan"):
+            plan = consolidator.build_plan(plan_inventory)
 
-    if report_format == "markdown":
-        content = generate_markdown_report(inventory, power_report, cost_report, plan)
-    else:
-        content = generate_text_report(inventory, power_report, cost_report, plan)
-
-    output.write_text(content)
-    console.print(f"Report written to {output}")
+    report_format = report_format.lower()
+    with phase("render"):
+        if report_format in STRUCTURED_WRITERS:
+            try:
+                write_structured_report(report_format, power_report, cost_report, plan, output)
+            except ImportError as exc:
+                raise typer.BadParameter(str(exc), param_hint="--report-format") from exc
+        elif report_format == "prometheus":
+            write_lines(iter_prometheus_metrics(power_report, cost_report, plan), output)
+        else:
+            render = iter_markdown_report if report_format == "markdown" else iter_text_report
+            write_lines(render(inventory, power_report, cost_report, plan), output)
+    _console().print(f"Report written to {output}")
 
 
 @app.command()
@@ -118,33 +486,176 @@ def suggest(
     ai_report: Annotated[bool, typer.Option(help="Generate AI report")] = False,
     ai_provider: Annotated[str, typer.Option(help="AI provider name")] = "mock",
     ai_output: Annotated[Optional[Path], typer.Option(help="File to store AI narrative")] = None,
+    delta: Annotated[
+        Optional[Path], typer.Option(help="Delta from collect --delta-from to apply to --input")
+    ] = None,
+    history: Annotated[
+        Optional[Path], typer.Option(help="Utilization history from collect --history")
+    ] = None,
+    window_hours: Annotated[
+        float, typer.Option(help="History window used for the p50/p95 utilization")
+    ] = 168.0,
+    cache_dir: Annotated[
+        Optional[Path], typer.Option(help="Reuse power/cost results for unchanged inputs")
+    ] = None,
 ) -> None:
-    inventory = _load_inventory(input)
-    electricity = load_electricity_config(electricity_config)
-    optimizer_conf = load_optimizer_config(optimizer_config)
+    from .config import load_electricity_config, load_optimizer_config
+    from .consolidators import create_consolidator
+    from .history import PLANNING_PERCENTILE, load_history
+    from .reporters import iter_markdown_report, write_lines
+
+    inventory, applied = _load_with_delta(input, delta)
+    with phase("load_config"):
+        store = load_history(history) if history else None
+        electricity = load_electricity_config(electricity_config)
+        optimizer_conf = load_optimizer_config(optimizer_config)
 
     scenario_conf = optimizer_conf.get_scenario(scenario)
-    consolidator = HeuristicConsolidator(scenario_conf, electricity)
-    power_report = build_power_report(inventory)
-    cost_report = estimate_cost(power_report, electricity)
-    plan = consolidator.build_plan(inventory)
+    consolidator = create_consolidator(scenario_conf, electricity)
+    power_report, cost_report = _power_and_cost(
+        inventory, electricity, store, window_hours, cache_dir, input, history, applied
+    )
+    plan_inventory = _percentile_view(inventory, store, PLANNING_PERCENTILE, window_hours)
+    with phase("plan"):
+        plan = consolidator.build_plan(plan_inventory)
 
-    markdown = generate_markdown_report(inventory, power_report, cost_report, plan)
-    output.write_text(markdown)
-    console.print(f"Scenario report stored at {output}")
+    with phase("render"):
+        write_lines(iter_markdown_report(inventory, power_report, cost_report, plan), output)
+    _console().print(f"Scenario report stored at {output}")
 
     if ai_report:
+        from ai_providers import ProviderNotAvailable, get_provider
+
+        from .reporters import generate_ai_report
+
         try:
             provider = get_provider(ai_provider)
-            ai_content = generate_ai_report(provider, inventory, power_report, cost_report, plan)
+            with phase("ai_report"):
+                ai_content = generate_ai_report(
+                    provider, inventory, power_report, cost_report, plan
+                )
         except ProviderNotAvailable as exc:
-            console.print(f"[yellow]AI provider unavailable: {exc}")
+            _console().print(f"[yellow]AI provider unavailable: {exc}")
             return
         if ai_output:
             ai_output.write_text(ai_content)
-            console.print(f"AI narrative stored at {ai_output}")
+            _console().print(f"AI narrative stored at {ai_output}")
         else:
-            console.print("AI summary:\n" + ai_content)
+            _console().print("AI summary:\n" + ai_content)
+
+
+@app.command()
+def sweep(
+    input: Annotated[Path, typer.Option(help="Inventory (.json, .jsonl or .hcoi)")],
+    electricity_config: Annotated[Path, typer.Option(help="Electricity tariff configuration")],
+    optimizer_config: Annotated[Path, typer.Option(help="Optimizer config")] = Path(
+        "config/optimizer.example.yaml"
+    ),
+    scenario: Annotated[
+        str, typer.Option(help="Scenario providing the defaults for unswept parameters")
+    ] = "consolidate-low-util",
+    cpu_threshold: Annotated[
+        Optional[List[float]], typer.Option(help="CPU threshold values (repeatable)")
+    ] = None,
+    ram_threshold: Annotated[
+        Optional[List[float]], typer.Option(help="RAM threshold values (repeatable)")
+    ] = None,
+    max_node_utilization: Annotated[
+        Optional[List[float]], typer.Option(help="Max node utilization values (repeatable)")
+    ] = None,
+    workers: Annotated[Optional[int], typer.Option(help="Worker processes (default: CPUs)")] = None,
+    all_results: Annotated[
+        bool, typer.Option("--all", help="List dominated scenarios too, not just the Pareto front")
+    ] = False,
+    output: Annotated[Path, typer.Option(help="Markdown table output")] = Path("sweep.md"),
+) -> None:
+    from .config import load_electricity_config, load_optimizer_config
+    from .reporters import iter_sweep_report, write_lines
+    from .sweep import pareto_front, rank_results, run_sweep, scenario_grid
+
+    inventory = _load_inventory(input)
+    with phase("load_config"):
+        electricity = load_electricity_config(electricity_config)
+        base = load_optimizer_config(optimizer_config).get_scenario(scenario)
+    scenarios = scenario_grid(
+        base,
+        cpu_threshold=cpu_threshold or [],
+        ram_threshold=ram_threshold or [],
+        max_node_utilization=max_node_utilization or [],
+    )
+    with phase("sweep"):
+        results = run_sweep(inventory, electricity, scenarios, max_workers=workers)
+    front = pareto_front(results)
+    rows = front
+    if all_results:
+        rows = front + rank_results([result for result in results if result not in front])
+    with phase("render"):
+        write_lines(iter_sweep_report(rows, electricity.currency), output)
+    _console().print(
+        f"Evaluated {len(results)} scenarios ({len(front)} on the Pareto front); table at {output}"
+    )
+
+
+@app.command()
+def serve(
+    electricity_config: Annotated[Path, typer.Option(help="Electricity tariff configuration")],
+    input: Annotated[
+        Optional[Path], typer.Option(help="Inventory file to reload whenever it changes")
+    ] = None,
+    sources_config: Annotated[
+        Optional[Path], typer.Option(help="YAML list of sources to collect on every refresh")
+    ] = None,
+    optimizer_config: Annotated[Path, typer.Option(help="Optimizer config")] = Path(
+        "config/optimizer.example.yaml"
+    ),
+    scenario: Annotated[Optional[str], typer.Option(help="Scenario to keep a plan for")] = None,
+    interval: Annotated[float, typer.Option(help="Seconds between refreshes")] = 300.0,
+    host: Annotated[str, typer.Option(help="Address to listen on")] = "127.0.0.1",
+    port: Annotated[int, typer.Option(help="TCP port to listen on")] = 8787,
+    socket: Annotated[
+        Optional[Path], typer.Option(help="Listen on this Unix socket instead of TCP")
+    ] = None,
+) -> None:
+    import threading
+
+    from .collectors import collect_many
+    from .config import load_collection_config, load_electricity_config, load_optimizer_config
+    from .service import OptimizerService, create_server, file_source
+
+    if (input is None) == (sources_config is None):
+        raise typer.BadParameter("exactly one of --input or --sources-config is required")
+    with phase("load_config"):
+        electricity = load_electricity_config(electricity_config)
+        optimizer_conf = load_optimizer_config(optimizer_config)
+    if sources_config is not None:
+        collection = load_collection_config(sources_config)
+        specs = _source_specs(collection, optimizer_conf)
+        collect_sources = functools.partial(collect_many, specs, max_workers=collection.max_workers)
+
+        assign_profiles = _profile_assigner(optimizer_conf)
+
+        def source() -> Inventory:
+            return assign_profiles(collect_sources())
+
+    else:
+        source = file_source(input)
+    service = OptimizerService(
+        source, electricity, optimizer_conf.get_scenario(scenario) if scenario else None
+    )
+    service.refresh()
+
+    server = create_server(service, host=host, port=port, socket_path=socket)
+    stop = threading.Event()
+    threading.Thread(target=service.run_periodically, args=(interval, stop), daemon=True).start()
+    address = socket if socket is not None else f"http://{host}:{port}"
+    _console().print(f"Serving /summary, /nodes, /plan, /metrics and /health on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
 
 
 if __name__ == "__main__":
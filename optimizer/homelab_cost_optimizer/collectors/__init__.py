@@ -1,30 +1,93 @@
 from __future__ import annotations
 
-from typing import Dict, Type
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, Type
 
-from ..models import Inventory
+from ..models import Inventory, Node
 from .base import BaseCollector
-from .docker_collector import DockerCollector
-from .k8s_collector import KubernetesCollector
-from .libvirt_collector import LibvirtCollector
-from .proxmox_collector import ProxmoxCollector
 
 CollectorType = Type[BaseCollector]
 
-COLLECTOR_REGISTRY: Dict[str, CollectorType] = {
-    "proxmox": ProxmoxCollector,
-    "libvirt": LibvirtCollector,
-    "docker": DockerCollector,
-    "k8s": KubernetesCollector,
+# Entries are classes or "module:Class" paths imported on first use, so collecting from one
+# platform does not load the others' dependencies (requests for Proxmox, for example).
+COLLECTOR_REGISTRY: Dict[str, CollectorType | str] = {
+    "proxmox": "proxmox_collector:ProxmoxCollector",
+    "libvirt": "libvirt_collector:LibvirtCollector",
+    "docker": "docker_collector:DockerCollector",
+    "k8s": "k8s_collector:KubernetesCollector",
 }
 
 
-def collect(source: str, **kwargs) -> Inventory:
+def collector_class(source: str) -> CollectorType:
     source = source.lower()
     if source not in COLLECTOR_REGISTRY:
         raise KeyError(
             f"Unsupported collector '{source}'. Available: {', '.join(COLLECTOR_REGISTRY)}"
         )
-    collector_cls = COLLECTOR_REGISTRY[source]
-    collector: BaseCollector = collector_cls(**kwargs)
-    return collector.collect()
+    entry = COLLECTOR_REGISTRY[source]
+    if isinstance(entry, str):
+        module_name, _, class_name = entry.partition(":")
+        entry = getattr(importlib.import_module(f".{module_name}", __name__), class_name)
+    return entry
+
+
+def create_collector(source: str, **kwargs) -> BaseCollector:
+    return collector_class(source)(**kwargs)
+
+
+def collect(source: str, **kwargs) -> Inventory:
+    return create_collector(source, **kwargs).collect()
+
+
+async def acollect(source: str, **kwargs) -> Inventory:
+    return await create_collector(source, **kwargs).acollect()
+
+
+def merge_inventories(inventories: Iterable[Inventory]) -> Inventory:
+    """Combine inventories, keeping the first node seen for each node name."""
+    nodes: Dict[str, Node] = {}
+    workloads = []
+    for inventory in inventories:
+        for node in inventory.nodes:
+            nodes.setdefault(node.name, node)
+        workloads.extend(inventory.workloads)
+    return Inventory(nodes=list(nodes.values()), workloads=workloads)
+
+
+def collect_many(sources: List[Mapping[str, Any]], max_workers: int | None = None) -> Inventory:
+    """Run several collectors concurrently and merge their inventories.
+
+    Each entry holds a ``source`` key plus the keyword arguments for that collector. Collectors
+    spend their time waiting on subprocesses and HTTP calls, so a thread pool is sufficient.
+    Results are merged in the order the sources are listed, independent of completion order.
+    """
+    if not sources:
+        return Inventory(nodes=[], workloads=[])
+    with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as executor:
+        futures = [
+            executor.submit(
+                collect, spec["source"], **{k: v for k, v in spec.items() if k != "source"}
+            )
+            for spec in sources
+        ]
+        return merge_inventories(future.result() for future in futures)
+
+
+async def acollect_many(
+    sources: List[Mapping[str, Any]], max_concurrency: int | None = None
+) -> Inventory:
+    """Asyncio variant of :func:`collect_many` polling all sources from one event loop."""
+    import asyncio
+
+    if not sources:
+        return Inventory(nodes=[], workloads=[])
+    semaphore = asyncio.Semaphore(max_concurrency or len(sources))
+
+    async def run(spec: Mapping[str, Any]) -> Inventory:
+        async with semaphore:
+            return await acollect(
+                spec["source"], **{k: v for k, v in spec.items() if k != "source"}
+            )
+
+    return merge_inventories(await asyncio.gather(*(run(spec) for spec in sources)))
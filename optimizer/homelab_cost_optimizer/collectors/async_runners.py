@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import subprocess
+from typing import Awaitable, Callable, List
+
+AsyncRunner = Callable[[List[str]], Awaitable[str]]
+
+
+async def run_command(args: List[str]) -> str:
+    """Async counterpart of the collectors' ``subprocess.run`` runner."""
+    import asyncio
+
+    process = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode:
+        raise subprocess.CalledProcessError(
+            process.returncode, args, output=stdout.decode(), stderr=stderr.decode()
+        )
+    return stdout.decode()
+
+
+def threaded(runner: Callable[[List[str]], str]) -> AsyncRunner:
+    """Adapt a blocking runner (e.g. a test fake) to the async runner signature."""
+
+    async def run(args: List[str]) -> str:
+        import asyncio
+
+        return await asyncio.to_thread(runner, args)
+
+    return run
@@ -15,6 +15,16 @@ class BaseCollector(ABC):
     def collect(self) -> Inventory:  # pragma: no cover - interface definition
         """Collect inventory data."""
 
+    async def acollect(self) -> Inventory:
+        """Collect inventory data without blocking the event loop.
+
+        Collectors with native asyncio I/O override this; the default runs :meth:`collect` in a
+        worker thread so every collector can be awaited.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.collect)
+
     @staticmethod
     def _bytes_to_gb(value: float) -> float:
         return round(value / (1024**3), 2)
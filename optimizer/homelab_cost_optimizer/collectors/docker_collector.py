@@ -4,6 +4,7 @@ import subprocess
 from typing import Callable, List
 
 from ..models import Inventory, Node, PowerProfile, Workload
+from .async_runners import AsyncRunner, run_command, threaded
 from .base import BaseCollector
 
 
@@ -16,28 +17,38 @@ class DockerCollector(BaseCollector):
         host_name: str = "docker-host",
         host_cpu: float = 16,
         host_memory_gb: float = 64,
+        docker_host: str | None = None,
         runner: Callable[[List[str]], str] | None = None,
+        async_runner: AsyncRunner | None = None,
     ) -> None:
         super().__init__(power_profile)
         self.host_name = host_name
+        self.docker_host = docker_host
         self.host_cpu = host_cpu
         self.host_memory_gb = host_memory_gb
         self.runner = runner or self._run_command
+        self.async_runner = async_runner or (threaded(runner) if runner else run_command)
 
     def _run_command(self, args: List[str]) -> str:
         process = subprocess.run(args, check=True, capture_output=True, text=True)
         return process.stdout
 
     def collect(self) -> Inventory:
-        stats_output = self.runner(
-            [
-                "docker",
-                "stats",
-                "--no-stream",
-                "--format",
-                "{{.Container}},{{.CPUPerc}},{{.MemUsage}}",
-            ]
+        return self._inventory_from_stats(self.runner(self._stats_args()))
+
+    async def acollect(self) -> Inventory:
+        return self._inventory_from_stats(await self.async_runner(self._stats_args()))
+
+    def _stats_args(self) -> List[str]:
+        args = ["docker"]
+        if self.docker_host:
+            args.extend(["--host", self.docker_host])
+        args.extend(
+            ["stats", "--no-stream", "--format", "{{.Container}},{{.CPUPerc}},{{.MemUsage}}"]
         )
+        return args
+
+    def _inventory_from_stats(self, stats_output: str) -> Inventory:
         workloads = [self._parse_stats_line(line) for line in stats_output.splitlines() if line]
         node = Node(
             name=self.host_name,
@@ -5,6 +5,7 @@ import subprocess
 from typing import Callable, List
 
 from ..models import Inventory, Node, PowerProfile, Workload
+from .async_runners import AsyncRunner, run_command, threaded
 from .base import BaseCollector
 
 
@@ -16,10 +17,12 @@ class KubernetesCollector(BaseCollector):
         power_profile: PowerProfile,
         context: str | None = None,
         runner: Callable[[List[str]], str] | None = None,
+        async_runner: AsyncRunner | None = None,
     ) -> None:
         super().__init__(power_profile)
         self.context = context
         self.runner = runner or self._run_command
+        self.async_runner = async_runner or (threaded(runner) if runner else run_command)
 
     def _run_command(self, args: List[str]) -> str:
         process = subprocess.run(args, check=True, capture_output=True, text=True)
@@ -28,18 +31,33 @@ class KubernetesCollector(BaseCollector):
     def collect(self) -> Inventory:
         nodes_data = self._kubectl(["get", "nodes", "-o", "json"])
         pods_data = self._kubectl(["get", "pods", "-A", "-o", "json"])
+        return self._inventory_from(nodes_data, pods_data)
+
+    async def acollect(self) -> Inventory:
+        import asyncio
+
+        nodes_output, pods_output = await asyncio.gather(
+            self.async_runner(self._kubectl_args(["get", "nodes", "-o", "json"])),
+            self.async_runner(self._kubectl_args(["get", "pods", "-A", "-o", "json"])),
+        )
+        return self._inventory_from(json.loads(nodes_output), json.loads(pods_output))
+
+    def _inventory_from(self, nodes_data: dict, pods_data: dict) -> Inventory:
         nodes = [self._node_from_item(item) for item in nodes_data.get("items", [])]
         workloads = [self._pod_to_workload(item) for item in pods_data.get("items", [])]
         workloads = [w for w in workloads if w]
         return Inventory(nodes=nodes, workloads=workloads)
 
     def _kubectl(self, extra_args: List[str]) -> dict:
+        output = self.runner(self._kubectl_args(extra_args))
+        return json.loads(output)
+
+    def _kubectl_args(self, extra_args: List[str]) -> List[str]:
         args = ["kubectl"]
         if self.context:
             args.extend(["--context", self.context])
         args.extend(extra_args)
-        output = self.runner(args)
-        return json.loads(output)
+        return args
 
     def _node_from_item(self, item: dict) -> Node:
         capacity = item.get("status", {}).get("capacity", {})
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 import subprocess
-from typing import Callable, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
 
 from ..models import Inventory, Node, PowerProfile, Workload
+from .async_runners import AsyncRunner, run_command, threaded
 from .base import BaseCollector
 
+# virDomainState values as reported by `virsh domstats --state`, spelled like `virsh dominfo`.
+DOMAIN_STATES = {
+    "0": "no state",
+    "1": "running",
+    "2": "idle",
+    "3": "paused",
+    "4": "in shutdown",
+    "5": "shut off",
+    "6": "crashed",
+    "7": "pmsuspended",
+}
+
 
 class LibvirtCollector(BaseCollector):
     """Collect VM information via the `virsh` CLI."""
@@ -18,6 +32,9 @@ class LibvirtCollector(BaseCollector):
         host_cpu: float = 32,
         host_memory_gb: float = 128,
         runner: Callable[[List[str]], str] | None = None,
+        max_workers: int = 1,
+        batched: bool = False,
+        async_runner: AsyncRunner | None = None,
     ) -> None:
         super().__init__(power_profile)
         self.uri = uri
@@ -25,14 +42,40 @@ class LibvirtCollector(BaseCollector):
         self.host_cpu = host_cpu
         self.host_memory_gb = host_memory_gb
         self.runner = runner or self._run_command
+        self.async_runner = async_runner or (threaded(runner) if runner else run_command)
+        self.max_workers = max(1, max_workers)
+        self.batched = batched
 
     def _run_command(self, args: List[str]) -> str:
         process = subprocess.run(args, check=True, capture_output=True, text=True)
         return process.stdout
 
     def collect(self) -> Inventory:
-        domains = self._parse_list()
-        workloads = [self._dominfo_to_workload(name) for name in domains]
+        if self.batched:
+            workloads = self._domstats_workloads()
+        else:
+            workloads = self._dominfo_workloads(self._parse_list())
+        return self._host_inventory(workloads)
+
+    async def acollect(self) -> Inventory:
+        import asyncio
+
+        if self.batched:
+            output = await self.async_runner(self._domstats_args())
+            return self._host_inventory(self._workloads_from_domstats(output))
+
+        domains = self._domains_from_list(await self.async_runner(self._list_args()))
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(domain: str) -> Workload:
+            async with semaphore:
+                output = await self.async_runner(self._dominfo_args(domain))
+            return self._workload_from_dominfo(domain, output)
+
+        workloads = await asyncio.gather(*(fetch(domain) for domain in domains))
+        return self._host_inventory(list(workloads))
+
+    def _host_inventory(self, workloads: List[Workload]) -> Inventory:
         node = Node(
             name=self.host_name,
             kind="hypervisor",
@@ -43,9 +86,14 @@ class LibvirtCollector(BaseCollector):
         )
         return Inventory(nodes=[node], workloads=workloads)
 
+    def _list_args(self) -> List[str]:
+        return ["virsh", "-c", self.uri, "list", "--all"]
+
     def _parse_list(self) -> List[str]:
-        args = ["virsh", "-c", self.uri, "list", "--all"]
-        output = self.runner(args)
+        return self._domains_from_list(self.runner(self._list_args()))
+
+    @staticmethod
+    def _domains_from_list(output: str) -> List[str]:
         domains: List[str] = []
         for line in output.splitlines():
             stripped = line.strip()
@@ -58,9 +106,70 @@ class LibvirtCollector(BaseCollector):
                 domains.append(parts[1])
         return domains
 
+    def _dominfo_workloads(self, domains: List[str]) -> List[Workload]:
+        if self.max_workers == 1 or len(domains) < 2:
+            return [self._dominfo_to_workload(name) for name in domains]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(domains))) as executor:
+            return list(executor.map(self._dominfo_to_workload, domains))
+
+    def _domstats_args(self) -> List[str]:
+        return [
+            "virsh",
+            "-c",
+            self.uri,
+            "domstats",
+            "--state",
+            "--cpu-total",
+            "--balloon",
+            "--vcpu",
+        ]
+
+    def _domstats_workloads(self) -> List[Workload]:
+        return self._workloads_from_domstats(self.runner(self._domstats_args()))
+
+    def _workloads_from_domstats(self, output: str) -> List[Workload]:
+        return [
+            self._domstats_to_workload(domain, stats)
+            for domain, stats in self._parse_domstats(output).items()
+        ]
+
+    def _domstats_to_workload(self, domain: str, stats: Dict[str, str]) -> Workload:
+        mem_gb = round(float(stats.get("balloon.maximum", "0")) / (1024 * 1024), 2)
+        vcpus = stats.get("vcpu.current", stats.get("vcpu.maximum", "0"))
+        cpu_time_seconds = float(stats.get("cpu.time", "0")) / 1e9
+        return Workload(
+            name=domain,
+            workload_type="vm",
+            vcpus=float(vcpus),
+            memory_gb=mem_gb,
+            utilization_cpu=0.0,
+            utilization_memory=0.0,
+            node=self.host_name,
+            uptime_hours=cpu_time_seconds / 3600,
+            labels={"state": DOMAIN_STATES.get(stats.get("state.state", ""), "unknown")},
+        )
+
+    @staticmethod
+    def _parse_domstats(text: str) -> Dict[str, Dict[str, str]]:
+        domains: Dict[str, Dict[str, str]] = {}
+        current: Dict[str, str] | None = None
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("Domain:"):
+                name = stripped.split(":", 1)[1].strip().strip("'\"")
+                current = domains.setdefault(name, {})
+            elif current is not None and "=" in stripped:
+                key, value = stripped.split("=", 1)
+                current[key] = value
+        return domains
+
+    def _dominfo_args(self, domain: str) -> List[str]:
+        return ["virsh", "-c", self.uri, "dominfo", domain]
+
     def _dominfo_to_workload(self, domain: str) -> Workload:
-        args = ["virsh", "-c", self.uri, "dominfo", domain]
-        output = self.runner(args)
+        return self._workload_from_dominfo(domain, self.runner(self._dominfo_args(domain)))
+
+    def _workload_from_dominfo(self, domain: str, output: str) -> Workload:
         info = self._parse_dominfo(output)
         mem_value = info.get("Max memory", "0").split()[0]
         mem_gb = round(float(mem_value) / (1024 * 1024), 2)
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from statistics import fmean
 from typing import Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..models import Inventory, Node, PowerProfile, Workload
 from .base import BaseCollector
 
 LOGGER = logging.getLogger(__name__)
 
+RETRY_STATUSES = (500, 502, 503, 504)
+
 
 class ProxmoxCollector(BaseCollector):
     """Collect VM/node data from the Proxmox REST API."""
@@ -22,6 +28,12 @@ class ProxmoxCollector(BaseCollector):
         power_profile: PowerProfile,
         verify_ssl: bool = True,
         timeout: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        fetch_node_details: bool = False,
+        max_workers: int = 8,
+        rrd_timeframe: str = "hour",
+        session: requests.Session | None = None,
     ) -> None:
         super().__init__(power_profile)
         self.base_url = base_url.rstrip("/")
@@ -29,15 +41,34 @@ class ProxmoxCollector(BaseCollector):
         self.token_secret = token_secret
         self.verify_ssl = verify_ssl
         self.timeout = timeout
+        self.fetch_node_details = fetch_node_details
+        self.max_workers = max(1, max_workers)
+        self.rrd_timeframe = rrd_timeframe
+        self.session = session or self._build_session(retries, backoff_factor)
 
     def _headers(self) -> Dict[str, str]:
         return {"Authorization": f"PVEAPIToken={self.token_id}={self.token_secret}"}
 
+    def _build_session(self, retries: int, backoff_factor: float) -> requests.Session:
+        """Keep-alive session that retries idempotent GETs on transient 5xx/connection errors."""
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers, max_retries=retry)
+        session = requests.Session()
+        session.headers.update(self._headers())
+        session.verify = self.verify_ssl
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def _get(self, path: str) -> Dict:
         url = f"{self.base_url}{path}"
-        response = requests.get(
-            url, headers=self._headers(), verify=self.verify_ssl, timeout=self.timeout
-        )
+        response = self.session.get(url, timeout=self.timeout)
         response.raise_for_status()
         return response.json()
 
@@ -45,9 +76,65 @@ class ProxmoxCollector(BaseCollector):
         nodes_data = self._get("/api2/json/nodes").get("data", [])
         vms_data = self._get("/api2/json/cluster/resources?type=vm").get("data", [])
         nodes = self._parse_nodes(nodes_data)
+        if self.fetch_node_details and nodes:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(nodes))) as executor:
+                list(executor.map(self._apply_node_details, nodes))
         workloads = self._parse_workloads(vms_data)
         return Inventory(nodes=nodes, workloads=workloads)
 
+    async def acollect(self) -> Inventory:
+        import asyncio
+
+        nodes_response, vms_response = await asyncio.gather(
+            self._aget("/api2/json/nodes"), self._aget("/api2/json/cluster/resources?type=vm")
+        )
+        nodes = self._parse_nodes(nodes_response.get("data", []))
+        if self.fetch_node_details and nodes:
+            semaphore = asyncio.Semaphore(self.max_workers)
+
+            async def apply(node: Node) -> None:
+                async with semaphore:
+                    await asyncio.to_thread(self._apply_node_details, node)
+
+            await asyncio.gather(*(apply(node) for node in nodes))
+        workloads = self._parse_workloads(vms_response.get("data", []))
+        return Inventory(nodes=nodes, workloads=workloads)
+
+    async def _aget(self, path: str) -> Dict:
+        import asyncio
+
+        # requests has no asyncio API; the pooled session is shared by the worker threads.
+        return await asyncio.to_thread(self._get, path)
+
+    def _apply_node_details(self, node: Node) -> None:
+        """Refine a node with `/status` capacity and averaged RRD utilization."""
+        try:
+            status = self._get(f"/api2/json/nodes/{node.name}/status").get("data", {})
+            rrd = self._get(
+                f"/api2/json/nodes/{node.name}/rrddata?timeframe={self.rrd_timeframe}&cf=AVERAGE"
+            ).get("data", [])
+        except requests.RequestException as exc:
+            LOGGER.warning("Skipping details for Proxmox node %s: %s", node.name, exc)
+            return
+        cpus = status.get("cpuinfo", {}).get("cpus")
+        if cpus:
+            node.total_cpu = float(cpus)
+        memory_total = status.get("memory", {}).get("total")
+        if memory_total:
+            node.total_memory_gb = self._bytes_to_gb(float(memory_total))
+        if "loadavg" in status:
+            node.metadata["loadavg"] = [float(value) for value in status["loadavg"]]
+        cpu_samples = [float(point["cpu"]) for point in rrd if point.get("cpu") is not None]
+        mem_samples = [
+            float(point["memused"]) / float(point["memtotal"])
+            for point in rrd
+            if point.get("memused") is not None and point.get("memtotal")
+        ]
+        if cpu_samples:
+            node.metadata["cpu_utilization_avg"] = round(fmean(cpu_samples), 4)
+        if mem_samples:
+            node.metadata["memory_utilization_avg"] = round(fmean(mem_samples), 4)
+
     def _parse_nodes(self, data: List[Dict]) -> List[Node]:
         nodes = []
         for item in data:
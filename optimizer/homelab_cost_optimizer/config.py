@@ -1,18 +1,47 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import yaml
 
 from .models import PowerProfile
 
+# numpy is imported where the tariff arrays are built, so loading configs stays numpy-free
+if TYPE_CHECKING:
+    import numpy as np
+
+HOURS_PER_WEEK = 168
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+SIZING_MODES = ("allocated", "observed")
+
 
 @dataclass
 class ElectricityPeriod:
     name: str
     price_per_kwh: float
+    hours: List[str] = field(default_factory=list)
+    days: List[str] = field(default_factory=list)
+
+    def hour_mask(self) -> np.ndarray:
+        """Boolean mask over the ``HOURS_PER_WEEK`` hours (Monday 00:00 first) this period covers.
+
+        ``hours`` holds ``"HH:MM-HH:MM"`` ranges on whole hours; a range may wrap past midnight.
+        ``days`` restricts the period to the given weekdays (``mon`` .. ``sun``), default all.
+        """
+        import numpy as np
+
+        day_mask = np.zeros(24, dtype=bool)
+        for hour_range in self.hours:
+            start, end = _parse_hour_range(self.name, hour_range)
+            hours = np.arange(start, end if end > start else end + 24) % 24
+            day_mask[hours] = True
+        days = [_parse_weekday(self.name, day) for day in self.days] or range(7)
+        mask = np.zeros((7, 24), dtype=bool)
+        mask[list(days)] = day_mask
+        return mask.reshape(HOURS_PER_WEEK)
 
 
 @dataclass
@@ -21,7 +50,30 @@ class ElectricityConfig:
     price_per_kwh: float
     periods: List[ElectricityPeriod] = field(default_factory=list)
 
+    @property
+    def time_of_use(self) -> bool:
+        """True when at least one period is bound to specific hours."""
+        return any(period.hours for period in self.periods)
+
+    def hourly_prices(self) -> np.ndarray:
+        """Price per kWh for each hour of the week, Monday 00:00 first.
+
+        Hours not covered by a period use ``price_per_kwh``; later periods win on overlap.
+        Without time-of-use periods every hour has the effective price.
+        """
+        import numpy as np
+
+        if not self.time_of_use:
+            return np.full(HOURS_PER_WEEK, self.effective_price())
+        prices = np.full(HOURS_PER_WEEK, self.price_per_kwh)
+        for period in self.periods:
+            prices[period.hour_mask()] = period.price_per_kwh
+        return prices
+
     def effective_price(self) -> float:
+        """Average price per kWh, time-weighted when periods declare their hours."""
+        if self.time_of_use:
+            return float(self.hourly_prices().mean())
         if not self.periods:
             return self.price_per_kwh
         return sum(period.price_per_kwh for period in self.periods) / len(self.periods)
@@ -35,6 +87,9 @@ class ScenarioConfig:
     max_node_utilization: float
     cpu_headroom: float = 0.1
     ram_headroom: float = 0.1
+    sizing: str = "allocated"
+    solver: str = "heuristic"
+    time_budget_seconds: float = 5.0
 
 
 @dataclass
@@ -43,11 +98,30 @@ class ReportingConfig:
     enable_ai: bool = False
 
 
+@dataclass
+class ProfileRule:
+    """Assigns ``profile`` to nodes meeting every condition that is set.
+
+    ``name`` is a shell-style glob, ``metadata`` values are compared as strings and the size
+    bounds are inclusive.
+    """
+
+    profile: str
+    name: Optional[str] = None
+    kind: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    min_cpu: Optional[float] = None
+    max_cpu: Optional[float] = None
+    min_memory_gb: Optional[float] = None
+    max_memory_gb: Optional[float] = None
+
+
 @dataclass
 class OptimizerConfig:
     power_profiles: Dict[str, PowerProfile]
     scenarios: Dict[str, ScenarioConfig]
     reporting: ReportingConfig
+    profile_rules: List[ProfileRule] = field(default_factory=list)
 
     def get_power_profile(self, profile_name: str) -> PowerProfile:
         if profile_name not in self.power_profiles:
@@ -60,17 +134,65 @@ class OptimizerConfig:
         return self.scenarios[scenario_name]
 
 
+@dataclass
+class SourceConfig:
+    source: str
+    power_profile: str = "default"
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CollectionConfig:
+    sources: List[SourceConfig]
+    max_workers: Optional[int] = None
+
+
 def _read_yaml(path: str | Path) -> Dict:
     data = yaml.safe_load(Path(path).read_text())
     return data or {}
 
 
+def _parse_hour_range(period: str, hour_range: str) -> tuple[int, int]:
+    bounds = []
+    for part in hour_range.split("-"):
+        hours, _, minutes = part.strip().partition(":")
+        if not (hours.isdigit() and int(hours) <= 24 and minutes.isdigit() and len(minutes) == 2):
+            raise ValueError(
+                f"Period '{period}' has invalid hour range '{hour_range}' (expected HH:MM-HH:MM)"
+            )
+        if int(minutes):
+            raise ValueError(f"Period '{period}' hour range '{hour_range}' must use whole hours")
+        bounds.append(int(hours))
+    if len(bounds) != 2 or bounds[0] == 24:
+        raise ValueError(
+            f"Period '{period}' has invalid hour range '{hour_range}' (expected HH:MM-HH:MM)"
+        )
+    start, end = bounds
+    if start == end:
+        raise ValueError(f"Period '{period}' hour range '{hour_range}' is empty")
+    return start, end
+
+
+def _parse_weekday(period: str, day: str) -> int:
+    key = str(day).strip().lower()[:3]
+    if key not in WEEKDAYS:
+        raise ValueError(f"Period '{period}' has unknown weekday '{day}'")
+    return WEEKDAYS.index(key)
+
+
 def load_electricity_config(path: str | Path) -> ElectricityConfig:
     data = _read_yaml(path)
     periods = [
-        ElectricityPeriod(name=item["name"], price_per_kwh=float(item["price_per_kwh"]))
+        ElectricityPeriod(
+            name=item["name"],
+            price_per_kwh=float(item["price_per_kwh"]),
+            hours=list(item.get("hours", [])),
+            days=list(item.get("days", [])),
+        )
         for item in data.get("periods", [])
     ]
+    for period in periods:
+        period.hour_mask()  # fail on malformed hour ranges at load time
     return ElectricityConfig(
         currency=data.get("currency", "USD"),
         price_per_kwh=float(data.get("price_per_kwh", 0.2)),
@@ -78,6 +200,39 @@ def load_electricity_config(path: str | Path) -> ElectricityConfig:
     )
 
 
+def _scenario_sizing(scenario: str, sizing: str) -> str:
+    if sizing not in SIZING_MODES:
+        raise ValueError(f"Scenario '{scenario}' has unknown sizing '{sizing}'")
+    return sizing
+
+
+def _profile_rule(
+    index: int, item: Dict[str, Any], profiles: Dict[str, PowerProfile]
+) -> ProfileRule:
+    known = {rule_field.name for rule_field in fields(ProfileRule)}
+    unknown = set(item) - known
+    if unknown:
+        raise ValueError(
+            f"Power profile rule {index}: unknown field(s) {', '.join(sorted(unknown))}"
+        )
+    if item.get("profile") not in profiles:
+        raise ValueError(
+            f"Power profile rule {index}: unknown power profile {item.get('profile')!r}"
+        )
+    bounds = {
+        name: float(item[name])
+        for name in ("min_cpu", "max_cpu", "min_memory_gb", "max_memory_gb")
+        if item.get(name) is not None
+    }
+    return ProfileRule(
+        profile=item["profile"],
+        name=item.get("name"),
+        kind=item.get("kind"),
+        metadata=dict(item.get("metadata") or {}),
+        **bounds,
+    )
+
+
 def load_optimizer_config(path: str | Path) -> OptimizerConfig:
     data = _read_yaml(path)
     power_profiles = {
@@ -104,6 +259,9 @@ def load_optimizer_config(path: str | Path) -> OptimizerConfig:
             max_node_utilization=float(scenario.get("max_node_utilization", 0.75)),
             cpu_headroom=float(scenario.get("cpu_headroom", 0.1)),
             ram_headroom=float(scenario.get("ram_headroom", 0.1)),
+            sizing=_scenario_sizing(name, scenario.get("sizing", "allocated")),
+            solver=str(scenario.get("solver", "heuristic")).lower(),
+            time_budget_seconds=float(scenario.get("time_budget_seconds", 5.0)),
         )
         for name, scenario in data.get("scenarios", {}).items()
     }
@@ -119,8 +277,34 @@ def load_optimizer_config(path: str | Path) -> OptimizerConfig:
         markdown_template=reporting_data.get("markdown_template", "default"),
         enable_ai=bool(reporting_data.get("enable_ai", False)),
     )
+    profile_rules = [
+        _profile_rule(index, item, power_profiles)
+        for index, item in enumerate(data.get("power_profile_rules") or [], start=1)
+    ]
     return OptimizerConfig(
         power_profiles=power_profiles,
         scenarios=scenarios,
         reporting=reporting,
+        profile_rules=profile_rules,
+    )
+
+
+def load_collection_config(path: str | Path) -> CollectionConfig:
+    data = _read_yaml(path)
+    sources = []
+    for item in data.get("sources", []):
+        options = dict(item)
+        if "source" not in options:
+            raise ValueError("Collection source missing required field 'source'")
+        sources.append(
+            SourceConfig(
+                source=options.pop("source"),
+                power_profile=options.pop("power_profile", "default"),
+                options=options,
+            )
+        )
+    max_workers = data.get("max_workers")
+    return CollectionConfig(
+        sources=sources,
+        max_workers=int(max_workers) if max_workers is not None else None,
     )
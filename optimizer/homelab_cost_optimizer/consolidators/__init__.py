@@ -1,3 +1,27 @@
+from ..config import ElectricityConfig, ScenarioConfig
 from .heuristic_consolidator import HeuristicConsolidator
+from .optimizing_consolidator import OptimizingConsolidator
 
-__all__ = ["HeuristicConsolidator"]
+CONSOLIDATOR_REGISTRY = {
+    "heuristic": HeuristicConsolidator,
+    "branch-and-bound": OptimizingConsolidator,
+}
+
+
+def create_consolidator(
+    scenario: ScenarioConfig, electricity: ElectricityConfig
+) -> HeuristicConsolidator:
+    solver = scenario.solver.lower()
+    if solver not in CONSOLIDATOR_REGISTRY:
+        raise KeyError(
+            f"Unsupported solver '{solver}'. Available: {', '.join(CONSOLIDATOR_REGISTRY)}"
+        )
+    return CONSOLIDATOR_REGISTRY[solver](scenario, electricity)
+
+
+__all__ = [
+    "CONSOLIDATOR_REGISTRY",
+    "HeuristicConsolidator",
+    "OptimizingConsolidator",
+    "create_consolidator",
+]
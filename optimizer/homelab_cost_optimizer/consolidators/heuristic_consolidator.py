@@ -1,23 +1,153 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+import bisect
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from ..config import ElectricityConfig, ScenarioConfig
+from ..estimators.vectorized import MIN_UTILIZATION
+from ..frame import InventoryFrame
 from ..models import (
+    CapacityIndex,
     ConsolidationMove,
     ConsolidationPlan,
     Inventory,
     Node,
+    NodeUsage,
     Workload,
     group_workloads_by_node,
 )
 
+# Entries per bucket of the target index; a bucket splits once it holds twice as many
+TARGET_BUCKET_SIZE = 256
+# Slack on the utilization cutoff so rounding never hides a node that fits
+_CUTOFF_TOLERANCE = 1e-9
+
+
+class _UsageOverlay:
+    """Copy-on-write view of node usage for evaluating one node's evacuation.
+
+    Reads fall through to the committed usage; the first write to a node copies its entry into
+    the overlay, so a rollback costs nothing and a commit touches only the changed nodes.
+    """
+
+    def __init__(self, base: CapacityIndex) -> None:
+        self._base = base
+        self._changes: Dict[str, NodeUsage] = {}
+
+    def __getitem__(self, name: str) -> NodeUsage:
+        changed = self._changes.get(name)
+        return changed if changed is not None else self._base[name]
+
+    def get(self, name: str, default: NodeUsage) -> NodeUsage:
+        changed = self._changes.get(name)
+        return changed if changed is not None else self._base.get(name, default)
+
+    def add(self, name: str, cpu: float, ram: float) -> None:
+        entry = self._changes.get(name)
+        if entry is None:
+            current = self._base[name]
+            entry = self._changes[name] = NodeUsage(cpu=current.cpu, ram=current.ram)
+        entry.cpu += cpu
+        entry.ram += ram
+
+    def commit(self) -> None:
+        self._base.update(self._changes)
+        self._changes.clear()
+
+    def rollback(self) -> None:
+        self._changes.clear()
+
+
+class _TargetIndex:
+    """Nodes kept ordered by CPU utilization for target selection.
+
+    Entries are ``(utilization, position)`` so that ties resolve in inventory order, matching
+    a stable sort of the node list. They are held in sorted buckets of about
+    ``TARGET_BUCKET_SIZE``, so re-keying a node costs a bisect plus a shift within one bucket
+    rather than across the whole list. Moving a workload only re-keys the two affected nodes,
+    and re-keys since the last ``commit`` can be undone with ``rollback``.
+    """
+
+    def __init__(self, nodes: List[Node], usage: _UsageOverlay) -> None:
+        self._nodes = nodes
+        self._usage = usage
+        self._keys: Dict[str, Tuple[float, int]] = {}
+        self._undo: List[Tuple[str, Tuple[float, int]]] = []
+        for position, node in enumerate(nodes):
+            self._keys[node.name] = (self._utilization(node), position)
+        entries = sorted(self._keys.values())
+        self._buckets = [
+            entries[start : start + TARGET_BUCKET_SIZE]
+            for start in range(0, len(entries), TARGET_BUCKET_SIZE)
+        ]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self.max_total_cpu = max((node.total_cpu for node in nodes), default=0)
+
+    def _utilization(self, node: Node) -> float:
+        return self._usage[node.name].cpu / node.total_cpu if node.total_cpu else 0
+
+    def up_to(self, utilization: float):
+        """Nodes in order, stopping before the first one above ``utilization``."""
+        for bucket in self._buckets:
+            for key, position in bucket:
+                if key > utilization:
+                    return
+                yield self._nodes[position]
+
+    def update(self, node: Node) -> None:
+        old_key = self._keys.get(node.name)
+        if old_key is None:
+            return
+        new_key = (self._utilization(node), old_key[1])
+        if new_key == old_key:
+            return
+        self._undo.append((node.name, old_key))
+        self._rekey(node.name, old_key, new_key)
+
+    def remove(self, node: Node) -> None:
+        """Stop offering ``node`` as a target, e.g. once it is powered down."""
+        key = self._keys.pop(node.name, None)
+        if key is not None:
+            self._discard(key)
+
+    def commit(self) -> None:
+        self._undo.clear()
+
+    def rollback(self) -> None:
+        while self._undo:
+            name, old_key = self._undo.pop()
+            self._rekey(name, self._keys[name], old_key)
+
+    def _rekey(self, name: str, old_key: Tuple[float, int], new_key: Tuple[float, int]) -> None:
+        self._discard(old_key)
+        self._insert(new_key)
+        self._keys[name] = new_key
+
+    def _discard(self, key: Tuple[float, int]) -> None:
+        index = bisect.bisect_left(self._maxes, key)
+        bucket = self._buckets[index]
+        del bucket[bisect.bisect_left(bucket, key)]
+        if bucket:
+            self._maxes[index] = bucket[-1]
+        else:
+            del self._buckets[index]
+            del self._maxes[index]
 
-@dataclass
-class NodeUsage:
-    cpu: float
-    ram: float
+    def _insert(self, key: Tuple[float, int]) -> None:
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+        index = min(bisect.bisect_left(self._maxes, key), len(self._buckets) - 1)
+        bucket = self._buckets[index]
+        bisect.insort(bucket, key)
+        self._maxes[index] = bucket[-1]
+        if len(bucket) > 2 * TARGET_BUCKET_SIZE:
+            half = len(bucket) // 2
+            self._buckets[index : index + 1] = [bucket[:half], bucket[half:]]
+            self._maxes[index : index + 1] = [bucket[half - 1], bucket[-1]]
 
 
 class HeuristicConsolidator:
@@ -25,43 +155,123 @@ class HeuristicConsolidator:
         self.scenario = scenario
         self.electricity = electricity
 
-    def build_plan(self, inventory: Inventory) -> ConsolidationPlan:
-        usage = self._node_usage(inventory)
-        grouped = group_workloads_by_node(inventory.workloads)
+    def build_plan(self, inventory: Inventory | InventoryFrame) -> ConsolidationPlan:
+        usage = _UsageOverlay(self._node_usage(inventory))
+        index = _TargetIndex(inventory.nodes, usage)
+        workloads_on = self._workload_lookup(inventory)
         moves: List[ConsolidationMove] = []
         powered_down: List[str] = []
+        receivers: Set[str] = set()
         watts_saved = 0.0
 
         for node in inventory.nodes:
+            if node.name in receivers:
+                continue
             stats = usage.get(node.name, NodeUsage(cpu=0, ram=0))
             if not self._node_is_candidate(node, stats):
                 continue
-            workloads = list(grouped.get(node.name, []))
+            workloads = workloads_on(node.name)
             if not workloads:
                 continue
-            if self._relocate_workloads(node, workloads, inventory.nodes, usage, moves):
+            planned = len(moves)
+            if self._relocate_workloads(node, workloads, index, usage, moves):
                 powered_down.append(node.name)
                 watts_saved += node.power_profile.base_idle_watts
+                index.remove(node)
+                receivers.update(move.target_node for move in moves[planned:])
+
+        return self._make_plan(
+            moves,
+            powered_down,
+            watts_saved,
+            notes="Greedy bin-pack heuristic; validate before production changes.",
+        )
 
+    def _make_plan(
+        self,
+        moves: List[ConsolidationMove],
+        powered_down: List[str],
+        watts_saved: float,
+        notes: str,
+        optimality_gap: Optional[float] = None,
+    ) -> ConsolidationPlan:
         monthly_savings = round(watts_saved * 730 / 1000 * self.electricity.effective_price(), 2)
-        plan = ConsolidationPlan(
+        return ConsolidationPlan(
             moves=moves,
             powered_down_nodes=powered_down,
             estimated_watts_saved=round(watts_saved, 2),
             estimated_monthly_savings=monthly_savings,
-            notes="Greedy bin-pack heuristic; validate before production changes.",
+            notes=notes,
+            optimality_gap=optimality_gap,
         )
-        return plan
 
-    def _node_usage(self, inventory: Inventory) -> Dict[str, NodeUsage]:
-        usage: Dict[str, NodeUsage] = {}
+    def remaining_headroom(
+        self, inventory: Inventory | InventoryFrame, plan: ConsolidationPlan
+    ) -> float:
+        """Smallest spare share of CPU or RAM on any node that stays on after ``plan``."""
+        usage = self._node_usage(inventory)
+        for move in plan.moves:
+            usage.move(move.workload, move.source_node, move.target_node)
+        powered_down = set(plan.powered_down_nodes)
+        shares = [1.0]
         for node in inventory.nodes:
-            usage[node.name] = NodeUsage(cpu=0.0, ram=0.0)
-        for workload in inventory.workloads:
-            node_usage = usage.setdefault(workload.node, NodeUsage(cpu=0.0, ram=0.0))
-            node_usage.cpu += workload.vcpus
-            node_usage.ram += workload.memory_gb
-        return usage
+            if node.name in powered_down:
+                continue
+            stats = usage.get(node.name, NodeUsage(cpu=0, ram=0))
+            if node.total_cpu:
+                shares.append(1 - stats.cpu / node.total_cpu)
+            if node.total_memory_gb:
+                shares.append(1 - stats.ram / node.total_memory_gb)
+        return round(min(shares), 4)
+
+    def _node_usage(self, inventory: Inventory | InventoryFrame) -> CapacityIndex:
+        if isinstance(inventory, InventoryFrame):
+            return CapacityIndex(
+                inventory.nodes, usage=self._frame_usage(inventory), demand=self._demand
+            )
+        return CapacityIndex.from_inventory(inventory, demand=self._demand)
+
+    def _frame_usage(self, frame: InventoryFrame) -> Dict[str, NodeUsage]:
+        size = len(frame.node_names)
+        cpu_demand, ram_demand = frame.vcpus, frame.memory_gb
+        if self.scenario.sizing == "observed":
+            cpu_demand = cpu_demand * np.maximum(frame.utilization_cpu, MIN_UTILIZATION)
+            ram_demand = ram_demand * np.maximum(frame.utilization_memory, MIN_UTILIZATION)
+        cpu = np.bincount(frame.node_index, weights=cpu_demand, minlength=size)
+        ram = np.bincount(frame.node_index, weights=ram_demand, minlength=size)
+        return {
+            name: NodeUsage(cpu=node_cpu, ram=node_ram)
+            for name, node_cpu, node_ram in zip(
+                frame.node_names, cpu.tolist(), ram.tolist(), strict=True
+            )
+        }
+
+    @staticmethod
+    def _workload_lookup(
+        inventory: Inventory | InventoryFrame,
+    ) -> Callable[[str], List[Workload]]:
+        """Return a function listing the workloads hosted on a node.
+
+        Frames only materialize :class:`Workload` objects for nodes the planner evacuates.
+        """
+        if isinstance(inventory, InventoryFrame):
+            rows = inventory.rows_by_node()
+            return lambda name: [inventory.workload(row) for row in rows.get(name, ())]
+        grouped = group_workloads_by_node(inventory.workloads)
+        return lambda name: list(grouped.get(name, []))
+
+    def _demand(self, workload: Workload) -> Tuple[float, float]:
+        """CPU cores and GB of RAM a workload needs on its target node.
+
+        ``allocated`` sizing reserves the full allocation; ``observed`` sizing reserves what the
+        workload actually uses (e.g. its p95 from a utilization history), floored at 10%.
+        """
+        if self.scenario.sizing == "observed":
+            return (
+                workload.vcpus * max(workload.utilization_cpu, MIN_UTILIZATION),
+                workload.memory_gb * max(workload.utilization_memory, MIN_UTILIZATION),
+            )
+        return workload.vcpus, workload.memory_gb
 
     def _node_is_candidate(self, node: Node, usage: NodeUsage) -> bool:
         cpu_util = usage.cpu / node.total_cpu if node.total_cpu else 0
@@ -72,28 +282,40 @@ class HeuristicConsolidator:
         self,
         source_node: Node,
         workloads: List[Workload],
-        nodes: List[Node],
-        usage: Dict[str, NodeUsage],
+        index: _TargetIndex,
+        usage: _UsageOverlay,
         moves: List[ConsolidationMove],
     ) -> bool:
-        workloads_sorted = sorted(workloads, key=lambda w: (w.vcpus, w.memory_gb), reverse=True)
+        """Plan moves for every workload on the node, or leave usage and index untouched."""
+        workloads_sorted = sorted(workloads, key=self._demand, reverse=True)
+        tentative: List[ConsolidationMove] = []
         for workload in workloads_sorted:
-            destination = self._find_target_node(source_node, workload, nodes, usage)
+            destination = self._find_target_node(source_node, workload, index, usage)
             if not destination:
+                usage.rollback()
+                index.rollback()
                 return False
-            self._move_workload(workload, source_node, destination, usage, moves)
+            self._move_workload(workload, source_node, destination, usage, tentative)
+            index.update(source_node)
+            index.update(destination)
+        usage.commit()
+        index.commit()
+        moves.extend(tentative)
         return True
 
     def _find_target_node(
         self,
         source_node: Node,
         workload: Workload,
-        nodes: List[Node],
-        usage: Dict[str, NodeUsage],
+        index: _TargetIndex,
+        usage: _UsageOverlay,
     ) -> Node | None:
-        for node in sorted(
-            nodes, key=lambda n: usage[n.name].cpu / n.total_cpu if n.total_cpu else 0
-        ):
+        # A node more utilized than this cannot take the workload's CPU, even the largest one
+        cpu, _ = self._demand(workload)
+        limit = self.scenario.max_node_utilization + _CUTOFF_TOLERANCE
+        if index.max_total_cpu:
+            limit -= cpu / index.max_total_cpu
+        for node in index.up_to(limit):
             if node.name == source_node.name:
                 continue
             if self._fits(workload, node, usage[node.name]):
@@ -101,8 +323,9 @@ class HeuristicConsolidator:
         return None
 
     def _fits(self, workload: Workload, node: Node, usage: NodeUsage) -> bool:
-        projected_cpu = usage.cpu + workload.vcpus
-        projected_ram = usage.ram + workload.memory_gb
+        cpu, ram = self._demand(workload)
+        projected_cpu = usage.cpu + cpu
+        projected_ram = usage.ram + ram
         if projected_cpu / node.total_cpu > self.scenario.max_node_utilization:
             return False
         if projected_ram / node.total_memory_gb > self.scenario.max_node_utilization:
@@ -114,13 +337,12 @@ class HeuristicConsolidator:
         workload: Workload,
         source_node: Node,
         destination: Node,
-        usage: Dict[str, NodeUsage],
+        usage: _UsageOverlay,
         moves: List[ConsolidationMove],
     ) -> None:
-        usage[source_node.name].cpu -= workload.vcpus
-        usage[source_node.name].ram -= workload.memory_gb
-        usage[destination.name].cpu += workload.vcpus
-        usage[destination.name].ram += workload.memory_gb
+        cpu, ram = self._demand(workload)
+        usage.add(source_node.name, -cpu, -ram)
+        usage.add(destination.name, cpu, ram)
         moves.append(
             ConsolidationMove(
                 workload=workload, source_node=source_node.name, target_node=destination.name
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..frame import InventoryFrame
+from ..models import ConsolidationMove, ConsolidationPlan, Inventory, Node, Workload
+from .heuristic_consolidator import HeuristicConsolidator, NodeUsage
+
+_TOLERANCE = 1e-9
+
+
+@dataclass
+class _Candidate:
+    position: int
+    node: Node
+    workloads: List[Workload]
+    demands: List[Tuple[float, float]]
+
+
+# (candidate powered down, workload, position of the node it moves to)
+_Placement = Tuple[_Candidate, Workload, int]
+# Residual-capacity rows overwritten in place, with their previous values
+_UndoLog = List[Tuple[int, np.ndarray]]
+
+_UNDO = -1
+
+
+@dataclass
+class _Search:
+    deadline: float
+    upper_bound: int
+    best_size: int = 0
+    best_watts: float = 0.0
+    # None while the heuristic plan the search was seeded with is still the best found
+    best: Optional[Tuple[List[_Candidate], List[_Placement]]] = None
+    expired: bool = False
+
+    def offer(self, chosen: List[_Candidate], placements: List[_Placement], watts: float) -> None:
+        if len(chosen) > self.best_size or (
+            len(chosen) == self.best_size and watts > self.best_watts
+        ):
+            self.best_size, self.best_watts = len(chosen), watts
+            self.best = (list(chosen), list(placements))
+
+
+class OptimizingConsolidator(HeuristicConsolidator):
+    """Searches for the largest set of nodes that can be powered down together.
+
+    Nodes passing the scenario thresholds are explored with depth-first branch-and-bound
+    (power down first, then keep), starting from the greedy heuristic's plan as the incumbent.
+    A set is feasible when its workloads pack best-fit into the nodes that stay on without
+    exceeding ``max_node_utilization``. The search stops at ``scenario.time_budget_seconds``; the
+    plan then reports the relative gap to an upper bound on how many nodes could be powered down.
+    """
+
+    def build_plan(self, inventory: Inventory | InventoryFrame) -> ConsolidationPlan:
+        started = time.monotonic()
+        seed = super().build_plan(inventory)
+        usage = self._node_usage(inventory)
+        nodes = list(inventory.nodes)
+        limit = self.scenario.max_node_utilization
+        free = np.array(
+            [
+                (
+                    node.total_cpu * limit - usage.get(node.name, NodeUsage(0, 0)).cpu,
+                    node.total_memory_gb * limit - usage.get(node.name, NodeUsage(0, 0)).ram,
+                )
+                for node in nodes
+            ],
+            dtype=np.float64,
+        ).reshape(len(nodes), 2)
+
+        workloads_on = self._workload_lookup(inventory)
+        candidates: List[_Candidate] = []
+        for position, node in enumerate(nodes):
+            if not self._node_is_candidate(node, usage.get(node.name, NodeUsage(cpu=0, ram=0))):
+                continue
+            workloads = workloads_on(node.name)
+            if not workloads:
+                continue
+            candidate = _Candidate(
+                position, node, workloads, [self._demand(workload) for workload in workloads]
+            )
+            if self._pack([candidate], free) is not None:
+                candidates.append(candidate)
+        # Lightly loaded nodes first so the first dive resembles a good greedy plan.
+        candidates.sort(
+            key=lambda c: (sum(cpu for cpu, _ in c.demands), -c.node.power_profile.base_idle_watts)
+        )
+
+        idle_by_name = {node.name: node.power_profile.base_idle_watts for node in nodes}
+        seed_watts = sum((idle_by_name[name] for name in seed.powered_down_nodes), 0.0)
+        search = _Search(
+            deadline=started + self.scenario.time_budget_seconds,
+            upper_bound=max(
+                min(len(candidates), self._capacity_bound(candidates, free)),
+                len(seed.powered_down_nodes),
+            ),
+            best_size=len(seed.powered_down_nodes),
+            best_watts=seed_watts,
+        )
+        idle_watts = [c.node.power_profile.base_idle_watts for c in candidates]
+        remaining_watts = np.cumsum(idle_watts[::-1])[::-1].tolist() + [0.0]
+        self._search(candidates, free, remaining_watts, search)
+
+        if search.best is None:
+            moves, powered_down, watts = seed.moves, seed.powered_down_nodes, seed_watts
+        else:
+            chosen = sorted(search.best[0], key=lambda c: c.position)
+            moves = [
+                ConsolidationMove(
+                    workload=workload, source_node=source.name, target_node=target.name
+                )
+                for source, workload, target in self._placements(chosen, search.best[1], nodes)
+            ]
+            powered_down = [c.node.name for c in chosen]
+            watts = sum((c.node.power_profile.base_idle_watts for c in chosen), 0.0)
+        if search.expired:
+            found = search.best_size
+            gap = (search.upper_bound - found) / search.upper_bound if search.upper_bound else 0.0
+            status = f"time budget reached after {self.scenario.time_budget_seconds:g}s"
+        else:
+            gap = 0.0
+            status = "search complete"
+        return self._make_plan(
+            moves,
+            powered_down,
+            watts,
+            notes=(
+                f"Branch-and-bound bin packing ({status}, optimality gap {gap:.1%}); "
+                "validate before production changes."
+            ),
+            optimality_gap=round(gap, 4),
+        )
+
+    def _search(
+        self,
+        candidates: List[_Candidate],
+        free: np.ndarray,
+        remaining_watts: List[float],
+        search: _Search,
+    ) -> None:
+        """Depth-first search over ``candidates`` on an explicit stack.
+
+        Powering a node down places only its own workloads into the residual capacity left by
+        the nodes already chosen, and backtracking restores the rows that placement changed. The
+        chosen set is re-packed from scratch only when that fails or when earlier placements
+        landed on the node.
+        """
+        residual = free.copy()
+        chosen: List[_Candidate] = []
+        placements: List[_Placement] = []
+        watts = [0.0]
+        # per powered-down node: residual array and rows to restore, placements and their length
+        undo: List[Tuple[np.ndarray, _UndoLog, List[_Placement], int]] = []
+        stack = [0]  # depths to visit, or _UNDO to power the latest chosen node back on
+        while stack:
+            depth = stack.pop()
+            if depth == _UNDO:
+                residual, log, placements, size = undo.pop()
+                _revert(residual, log)
+                del placements[size:]
+                chosen.pop()
+                watts.pop()
+                continue
+            search.offer(chosen, placements, watts[-1])
+            if depth == len(candidates):
+                continue
+            if time.monotonic() > search.deadline:
+                search.expired = True
+                return
+            reachable = min(len(chosen) + len(candidates) - depth, search.upper_bound)
+            if reachable < search.best_size or (
+                reachable == search.best_size
+                and watts[-1] + remaining_watts[depth] <= search.best_watts
+            ):
+                continue
+            candidate = candidates[depth]
+            stack.append(depth + 1)  # keeping it on is explored after powering it down
+            log: _UndoLog = []
+            moved = None
+            if not (residual[candidate.position] < free[candidate.position]).any():
+                log.append((candidate.position, residual[candidate.position].copy()))
+                residual[candidate.position] = -np.inf
+                moved = self._place([candidate], residual, log)
+                if moved is None:
+                    _revert(residual, log)
+            if moved is not None:
+                undo.append((residual, log, placements, len(placements)))
+                placements.extend(moved)
+            else:
+                repacked = self._repack([*chosen, candidate], free)
+                if repacked is None:
+                    continue
+                undo.append((residual, [], placements, len(placements)))
+                placements, residual = repacked
+            chosen.append(candidate)
+            watts.append(watts[-1] + candidate.node.power_profile.base_idle_watts)
+            stack.append(_UNDO)
+            stack.append(depth + 1)
+
+    @staticmethod
+    def _capacity_bound(candidates: Sequence[_Candidate], free: np.ndarray) -> int:
+        """Most nodes that could go down if workloads were perfectly divisible.
+
+        Powering down a set removes its spare capacity and moves its load to the others, so the
+        spare capacity of the whole fleet must cover spare capacity plus load of the set.
+        """
+        if not candidates:
+            return 0
+        spare = np.maximum(free, 0.0)
+        slack = spare.sum(axis=0)
+        load = np.array([np.sum(c.demands, axis=0) for c in candidates])
+        sizes = spare[[c.position for c in candidates]] + load
+        bound = len(candidates)
+        for resource in range(2):
+            totals = np.cumsum(np.sort(sizes[:, resource]))
+            bound = min(bound, int(np.searchsorted(totals, slack[resource] + _TOLERANCE, "right")))
+        return bound
+
+    def _pack(self, down: Sequence[_Candidate], free: np.ndarray) -> Optional[List[_Placement]]:
+        """Best-fit decreasing placement of every workload on ``down`` into the other nodes."""
+        repacked = self._repack(down, free)
+        return repacked[0] if repacked is not None else None
+
+    def _repack(
+        self, down: Sequence[_Candidate], free: np.ndarray
+    ) -> Optional[Tuple[List[_Placement], np.ndarray]]:
+        residual = free.copy()
+        residual[[c.position for c in down]] = -np.inf
+        placements = self._place(down, residual)
+        return (placements, residual) if placements is not None else None
+
+    @staticmethod
+    def _place(
+        down: Sequence[_Candidate], residual: np.ndarray, log: Optional[_UndoLog] = None
+    ) -> Optional[List[_Placement]]:
+        """Place the workloads of ``down`` into ``residual`` in place, largest first, best fit.
+
+        Rows are recorded in ``log`` before they change; on failure ``residual`` is left partly
+        updated for the caller to restore.
+        """
+        items = sorted(
+            (
+                (demand, candidate, workload)
+                for candidate in down
+                for workload, demand in zip(candidate.workloads, candidate.demands, strict=True)
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        placements = []
+        for demand, candidate, workload in items:
+            fits = np.flatnonzero((residual >= np.asarray(demand) - _TOLERANCE).all(axis=1))
+            if not fits.size:
+                return None
+            target = int(fits[np.argmin(residual[fits, 0])])
+            if log is not None:
+                log.append((target, residual[target].copy()))
+            residual[target] -= demand
+            placements.append((candidate, workload, target))
+        return placements
+
+    @staticmethod
+    def _placements(
+        chosen: Sequence[_Candidate], placements: List[_Placement], nodes: Sequence[Node]
+    ) -> List[Tuple[Node, Workload, Node]]:
+        order = {id(candidate): index for index, candidate in enumerate(chosen)}
+        ordered = sorted(placements, key=lambda item: order[id(item[0])])
+        return [
+            (candidate.node, workload, nodes[target]) for candidate, workload, target in ordered
+        ]
+
+
+def _revert(residual: np.ndarray, log: _UndoLog) -> None:
+    for row, previous in reversed(log):
+        residual[row] = previous
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from .models import Inventory, Node, Workload, node_from_dict, workload_from_dict
+
+WorkloadKey = Tuple[str, str]
+
+
+def workload_key(workload: Workload) -> WorkloadKey:
+    """Workloads are identified by their node and name (VM, container or pod name per host)."""
+    return (workload.node, workload.name)
+
+
+def inventory_digest(inventory: Inventory) -> str:
+    payload = json.dumps(inventory.to_dict(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class InventoryDelta:
+    """Difference between a base inventory snapshot and a newer collection.
+
+    ``base_file_digest``, when set, is the SHA-256 of the base file's bytes; checking it against
+    the file is much cheaper than recomputing ``base_digest`` from the parsed inventory.
+    """
+
+    base_digest: str
+    added_nodes: List[Node] = field(default_factory=list)
+    changed_nodes: List[Node] = field(default_factory=list)
+    removed_nodes: List[str] = field(default_factory=list)
+    added_workloads: List[Workload] = field(default_factory=list)
+    changed_workloads: List[Workload] = field(default_factory=list)
+    removed_workloads: List[WorkloadKey] = field(default_factory=list)
+    base_file_digest: str = ""
+
+    def is_empty(self) -> bool:
+        return not (
+            self.added_nodes
+            or self.changed_nodes
+            or self.removed_nodes
+            or self.added_workloads
+            or self.changed_workloads
+            or self.removed_workloads
+        )
+
+    def touched_nodes(self) -> Set[str]:
+        """Names of nodes whose power draw or capacity may differ from the base."""
+        touched = {node.name for node in self.added_nodes + self.changed_nodes}
+        touched.update(self.removed_nodes)
+        touched.update(w.node for w in self.added_workloads + self.changed_workloads)
+        touched.update(node for node, _ in self.removed_workloads)
+        return touched
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "base_digest": self.base_digest,
+            "base_file_digest": self.base_file_digest,
+            "added_nodes": [Inventory._node_to_dict(node) for node in self.added_nodes],
+            "changed_nodes": [Inventory._node_to_dict(node) for node in self.changed_nodes],
+            "removed_nodes": list(self.removed_nodes),
+            "added_workloads": [asdict(workload) for workload in self.added_workloads],
+            "changed_workloads": [asdict(workload) for workload in self.changed_workloads],
+            "removed_workloads": [list(key) for key in self.removed_workloads],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InventoryDelta":
+        if "base_digest" not in data:
+            raise ValueError("Inventory delta missing required field 'base_digest'")
+        return cls(
+            base_digest=data["base_digest"],
+            added_nodes=[node_from_dict(item) for item in data.get("added_nodes", [])],
+            changed_nodes=[node_from_dict(item) for item in data.get("changed_nodes", [])],
+            removed_nodes=list(data.get("removed_nodes", [])),
+            added_workloads=[workload_from_dict(item) for item in data.get("added_workloads", [])],
+            changed_workloads=[
+                workload_from_dict(item) for item in data.get("changed_workloads", [])
+            ],
+            removed_workloads=[(node, name) for node, name in data.get("removed_workloads", [])],
+            base_file_digest=data.get("base_file_digest", ""),
+        )
+
+
+def diff_inventories(base: Inventory, current: Inventory, digest: bool = True) -> InventoryDelta:
+    """Changes from ``base`` to ``current``.
+
+    With ``digest=False`` the full hash of ``base`` is skipped and the delta carries an empty
+    ``base_digest``; that suits in-memory comparisons, but such a delta can only be applied with
+    ``verify=False``.
+    """
+    base_nodes = {node.name: node for node in base.nodes}
+    current_nodes = {node.name: node for node in current.nodes}
+    base_workloads = {workload_key(w): w for w in base.workloads}
+    current_workloads = {workload_key(w): w for w in current.workloads}
+    return InventoryDelta(
+        base_digest=inventory_digest(base) if digest else "",
+        added_nodes=[node for name, node in current_nodes.items() if name not in base_nodes],
+        changed_nodes=[
+            node
+            for name, node in current_nodes.items()
+            if name in base_nodes and base_nodes[name] != node
+        ],
+        removed_nodes=[name for name in base_nodes if name not in current_nodes],
+        added_workloads=[w for key, w in current_workloads.items() if key not in base_workloads],
+        changed_workloads=[
+            w
+            for key, w in current_workloads.items()
+            if key in base_workloads and base_workloads[key] != w
+        ],
+        removed_workloads=[key for key in base_workloads if key not in current_workloads],
+    )
+
+
+def apply_delta(base: Inventory, delta: InventoryDelta, verify: bool = True) -> Inventory:
+    """Return ``base`` with ``delta`` applied; base order is kept and additions are appended."""
+    if verify and inventory_digest(base) != delta.base_digest:
+        raise ValueError("Inventory delta was computed against a different base snapshot")
+    removed_nodes = set(delta.removed_nodes)
+    changed_nodes = {node.name: node for node in delta.changed_nodes}
+    nodes = [
+        changed_nodes.get(node.name, node) for node in base.nodes if node.name not in removed_nodes
+    ]
+    nodes.extend(delta.added_nodes)
+
+    removed_workloads = set(delta.removed_workloads)
+    changed_workloads = {workload_key(w): w for w in delta.changed_workloads}
+    workloads = [
+        changed_workloads.get(workload_key(w), w)
+        for w in base.workloads
+        if workload_key(w) not in removed_workloads
+    ]
+    workloads.extend(delta.added_workloads)
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def load_delta(path: Path) -> InventoryDelta:
+    return InventoryDelta.from_dict(json.loads(path.read_text()))
+
+
+def save_delta(delta: InventoryDelta, path: Path) -> None:
+    path.write_text(json.dumps(delta.to_dict(), indent=2))
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Collection, List, Optional
+
+import numpy as np
 
 from ..config import ElectricityConfig
 from .power_estimator import PowerReport
+from .vectorized import monthly_energy, time_of_use_energy
 
 
 @dataclass
@@ -25,12 +28,44 @@ class CostReport:
 
 
 def estimate_cost(
-    power_report: PowerReport, config: ElectricityConfig, monthly_hours: float = 730
+    power_report: PowerReport,
+    config: ElectricityConfig,
+    monthly_hours: float = 730,
+    hourly_watts: Optional[np.ndarray] = None,
 ) -> CostReport:
-    price = config.effective_price()
-    per_node = []
-    for entry in power_report.per_node:
-        kwh = round(entry.watts * monthly_hours / 1000, 2)
-        cost = round(kwh * price, 2)
-        per_node.append(CostBreakdown(node=entry.node.name, kwh_month=kwh, monthly_cost=cost))
+    """Price the report's steady draw, or ``hourly_watts`` (nodes x 168) against the tariff hours."""
+    if hourly_watts is None:
+        kwh, cost = monthly_energy(
+            power_report.watts_array(), config.effective_price(), monthly_hours
+        )
+    else:
+        energy, spend = time_of_use_energy(hourly_watts, config.hourly_prices(), monthly_hours)
+        kwh = [round(value, 2) for value in energy.tolist()]
+        cost = [round(value, 2) for value in spend.tolist()]
+    per_node = [
+        CostBreakdown(node=entry.node.name, kwh_month=entry_kwh, monthly_cost=entry_cost)
+        for entry, entry_kwh, entry_cost in zip(power_report.per_node, kwh, cost, strict=True)
+    ]
     return CostReport(currency=config.currency, per_node=per_node)
+
+
+def update_cost_report(
+    previous: CostReport,
+    power_report: PowerReport,
+    config: ElectricityConfig,
+    node_names: Collection[str],
+    monthly_hours: float = 730,
+) -> CostReport:
+    """Price only ``node_names`` and reuse ``previous`` (priced with ``config``) for the rest."""
+    touched = set(node_names)
+    reused = {item.node: item for item in previous.per_node if item.node not in touched}
+    stale = [entry for entry in power_report.per_node if entry.node.name not in reused]
+    fresh = estimate_cost(PowerReport(per_node=stale), config, monthly_hours)
+    priced = {item.node: item for item in fresh.per_node}
+    return CostReport(
+        currency=config.currency,
+        per_node=[
+            reused.get(entry.node.name) or priced[entry.node.name]
+            for entry in power_report.per_node
+        ],
+    )
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Collection, List
 
+import numpy as np
+
+from ..frame import InventoryFrame
 from ..models import Inventory, Node, Workload
+from .vectorized import WorkloadColumns, hourly_node_watts, node_watts, round_watts
 
 
 @dataclass
@@ -20,6 +24,11 @@ class PowerReport:
     def total_watts(self) -> float:
         return round(sum(item.watts for item in self.per_node), 2)
 
+    def watts_array(self) -> np.ndarray:
+        return np.fromiter(
+            (item.watts for item in self.per_node), dtype=np.float64, count=len(self.per_node)
+        )
+
 
 def estimate_node_power(node: Node, workloads: List[Workload]) -> NodePowerUsage:
     node_workloads = [w for w in workloads if w.node == node.name]
@@ -34,6 +43,42 @@ def estimate_node_power(node: Node, workloads: List[Workload]) -> NodePowerUsage
     return NodePowerUsage(node=node, watts=round(watts, 2))
 
 
-def build_power_report(inventory: Inventory) -> PowerReport:
-    per_node = [estimate_node_power(node, inventory.workloads) for node in inventory.nodes]
+def build_power_report(inventory: Inventory | InventoryFrame) -> PowerReport:
+    columns = WorkloadColumns.from_inventory(inventory)
+    watts = round_watts(node_watts(inventory.nodes, columns))
+    per_node = [
+        NodePowerUsage(node=node, watts=value)
+        for node, value in zip(inventory.nodes, watts, strict=True)
+    ]
     return PowerReport(per_node=per_node)
+
+
+def build_hourly_watts(
+    inventory: Inventory | InventoryFrame,
+    cpu_utilization: np.ndarray,
+    memory_utilization: np.ndarray,
+) -> np.ndarray:
+    """Node draw per hour (nodes x hours) for per-workload hourly utilization matrices."""
+    columns = WorkloadColumns.from_inventory(inventory)
+    return hourly_node_watts(inventory.nodes, columns, cpu_utilization, memory_utilization)
+
+
+def update_power_report(
+    previous: PowerReport, inventory: Inventory, node_names: Collection[str]
+) -> PowerReport:
+    """Recompute only ``node_names`` (e.g. ``InventoryDelta.touched_nodes()``) and reuse the rest."""
+    touched = set(node_names)
+    reused = {
+        entry.node.name: entry for entry in previous.per_node if entry.node.name not in touched
+    }
+    stale = [node for node in inventory.nodes if node.name not in reused]
+    fresh = build_power_report(
+        Inventory(
+            nodes=stale,
+            workloads=[w for w in inventory.workloads if w.node not in reused],
+        )
+    )
+    recomputed = {entry.node.name: entry for entry in fresh.per_node}
+    return PowerReport(
+        per_node=[reused.get(node.name) or recomputed[node.name] for node in inventory.nodes]
+    )
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..frame import InventoryFrame
+from ..models import Inventory, Node, Workload
+
+MIN_UTILIZATION = 0.1
+
+
+@dataclass
+class WorkloadColumns:
+    """Per-workload numeric columns with the owning node as an integer index.
+
+    ``node_index`` refers to positions in ``node_names``; workloads on nodes that are not part
+    of the inventory keep ``-1`` and are ignored by the estimators.
+    """
+
+    node_names: List[str]
+    node_index: np.ndarray
+    vcpus: np.ndarray
+    memory_gb: np.ndarray
+    utilization_cpu: np.ndarray
+    utilization_memory: np.ndarray
+
+    @classmethod
+    def from_inventory(cls, inventory: Inventory | InventoryFrame) -> "WorkloadColumns":
+        if isinstance(inventory, InventoryFrame):
+            return cls.from_frame(inventory)
+        return cls.from_workloads(inventory.nodes, inventory.workloads)
+
+    @classmethod
+    def from_frame(cls, frame: InventoryFrame) -> "WorkloadColumns":
+        known = frame.known_node_count
+        node_index = frame.node_index.astype(np.int64)
+        node_index[node_index >= known] = -1
+        return cls(
+            node_names=frame.node_names[:known],
+            node_index=node_index,
+            vcpus=frame.vcpus,
+            memory_gb=frame.memory_gb,
+            utilization_cpu=frame.utilization_cpu,
+            utilization_memory=frame.utilization_memory,
+        )
+
+    @classmethod
+    def from_workloads(
+        cls, nodes: Sequence[Node], workloads: Sequence[Workload]
+    ) -> "WorkloadColumns":
+        positions = node_positions(nodes)
+        count = len(workloads)
+
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=count)
+
+        node_index = np.fromiter(
+            (positions.get(w.node, -1) for w in workloads), dtype=np.int64, count=count
+        )
+        return cls(
+            node_names=list(positions),
+            node_index=node_index,
+            vcpus=column(w.vcpus for w in workloads),
+            memory_gb=column(w.memory_gb for w in workloads),
+            utilization_cpu=column(w.utilization_cpu for w in workloads),
+            utilization_memory=column(w.utilization_memory for w in workloads),
+        )
+
+
+def node_positions(nodes: Sequence[Node]) -> Dict[str, int]:
+    """Map each distinct node name to a dense integer index (first occurrence wins)."""
+    positions: Dict[str, int] = {}
+    for node in nodes:
+        positions.setdefault(node.name, len(positions))
+    return positions
+
+
+def weighted_load(columns: WorkloadColumns) -> Tuple[np.ndarray, np.ndarray]:
+    """Return per-node CPU cores and GB of RAM weighted by utilization (floored at 10%)."""
+    size = len(columns.node_names)
+    known = columns.node_index >= 0
+    index = columns.node_index[known]
+    cpu = columns.vcpus[known] * np.maximum(columns.utilization_cpu[known], MIN_UTILIZATION)
+    ram = columns.memory_gb[known] * np.maximum(columns.utilization_memory[known], MIN_UTILIZATION)
+    return (
+        np.bincount(index, weights=cpu, minlength=size),
+        np.bincount(index, weights=ram, minlength=size),
+    )
+
+
+def node_watts(nodes: Sequence[Node], columns: WorkloadColumns) -> np.ndarray:
+    """Estimate the draw of every node in ``nodes`` in a single pass over the workloads."""
+    cpu_load, ram_load = weighted_load(columns)
+    return _apply_profiles(nodes, columns, cpu_load, ram_load)
+
+
+def hourly_node_watts(
+    nodes: Sequence[Node],
+    columns: WorkloadColumns,
+    cpu_utilization: np.ndarray,
+    memory_utilization: np.ndarray,
+) -> np.ndarray:
+    """Estimate node draw per hour from ``(workloads, hours)`` utilization matrices.
+
+    Returns a ``(nodes, hours)`` array; column ``h`` equals :func:`node_watts` with the
+    workloads' utilization set to column ``h`` of the inputs.
+    """
+    size = len(columns.node_names)
+    known = columns.node_index >= 0
+    index = columns.node_index[known]
+    hours = cpu_utilization.shape[1]
+    cpu_load = np.zeros((size, hours))
+    ram_load = np.zeros((size, hours))
+    np.add.at(
+        cpu_load,
+        index,
+        columns.vcpus[known, None] * np.maximum(cpu_utilization[known], MIN_UTILIZATION),
+    )
+    np.add.at(
+        ram_load,
+        index,
+        columns.memory_gb[known, None] * np.maximum(memory_utilization[known], MIN_UTILIZATION),
+    )
+    return _apply_profiles(nodes, columns, cpu_load, ram_load)
+
+
+def _apply_profiles(
+    nodes: Sequence[Node], columns: WorkloadColumns, cpu_load: np.ndarray, ram_load: np.ndarray
+) -> np.ndarray:
+    positions = {name: position for position, name in enumerate(columns.node_names)}
+    index = np.fromiter((positions[node.name] for node in nodes), dtype=np.int64, count=len(nodes))
+    profiles = np.array(
+        [
+            (
+                node.power_profile.base_idle_watts,
+                node.power_profile.watts_per_cpu_core,
+                node.power_profile.watts_per_gb_ram,
+            )
+            for node in nodes
+        ],
+        dtype=np.float64,
+    ).reshape(len(nodes), 3, *([1] * (cpu_load.ndim - 1)))
+    return profiles[:, 0] + profiles[:, 1] * cpu_load[index] + profiles[:, 2] * ram_load[index]
+
+
+def monthly_energy(
+    watts: np.ndarray, price_per_kwh: float, monthly_hours: float
+) -> Tuple[List[float], List[float]]:
+    """Return rounded monthly kWh and cost per node for an array of wattages."""
+    kwh = [round(value, 2) for value in (watts * monthly_hours / 1000).tolist()]
+    cost = [round(value, 2) for value in (np.asarray(kwh) * price_per_kwh).tolist()]
+    return kwh, cost
+
+
+def time_of_use_energy(
+    hourly_watts: np.ndarray, hourly_prices: np.ndarray, monthly_hours: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Monthly kWh and cost for weekly power profiles under an hourly tariff.
+
+    ``hourly_watts`` has the hours of the week on its last axis and any leading shape (nodes, or
+    scenarios x nodes); the cost is a dot product with ``hourly_prices`` along that axis.
+    """
+    hours = hourly_prices.shape[-1]
+    scale = monthly_hours / 1000 / hours
+    return hourly_watts.sum(axis=-1) * scale, (hourly_watts @ hourly_prices) * scale
+
+
+def round_watts(watts: np.ndarray) -> List[float]:
+    return [round(value, 2) for value in watts.tolist()]
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Sequence, overload
+
+import numpy as np
+
+from .models import Inventory, Node, Workload
+
+FLOAT_COLUMNS = ("vcpus", "memory_gb", "utilization_cpu", "utilization_memory", "uptime_hours")
+
+
+class _StringTable:
+    """Interns strings into dense integer codes in insertion order."""
+
+    def __init__(self, values: Sequence[str] = ()) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+
+@dataclass
+class InventoryFrame:
+    """Columnar (struct-of-arrays) form of an :class:`Inventory`.
+
+    Nodes stay as :class:`Node` objects since clusters rarely have more than a few thousand of
+    them. Workloads are stored column-wise: numeric fields as ``float64`` arrays, the workload
+    type and owning node as integer codes into interned string tables, and labels as codes into a
+    table of distinct label sets (``-1`` when a workload has none).
+    ``node_names`` lists the distinct inventory node names first (so a code below
+    ``known_node_count`` is a known node) followed by names referenced only by workloads.
+    """
+
+    nodes: List[Node]
+    node_names: List[str]
+    workload_names: List[str]
+    workload_types: List[str]
+    type_codes: np.ndarray
+    node_index: np.ndarray
+    vcpus: np.ndarray
+    memory_gb: np.ndarray
+    utilization_cpu: np.ndarray
+    utilization_memory: np.ndarray
+    uptime_hours: np.ndarray
+    label_codes: np.ndarray
+    label_sets: List[Dict[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def from_inventory(cls, inventory: Inventory) -> "InventoryFrame":
+        builder = InventoryFrameBuilder()
+        for node in inventory.nodes:
+            builder.add_node(node)
+        for workload in inventory.workloads:
+            builder.add_workload(workload)
+        return builder.build()
+
+    def to_inventory(self) -> Inventory:
+        return Inventory(nodes=list(self.nodes), workloads=list(self.workloads))
+
+    @property
+    def workloads(self) -> "WorkloadView":
+        return WorkloadView(self)
+
+    @property
+    def known_node_count(self) -> int:
+        """Number of distinct node names that belong to inventory nodes."""
+        return len({node.name for node in self.nodes})
+
+    def workload(self, row: int) -> Workload:
+        return Workload(
+            name=self.workload_names[row],
+            workload_type=self.workload_types[self.type_codes[row]],
+            vcpus=float(self.vcpus[row]),
+            memory_gb=float(self.memory_gb[row]),
+            utilization_cpu=float(self.utilization_cpu[row]),
+            utilization_memory=float(self.utilization_memory[row]),
+            node=self.node_names[self.node_index[row]],
+            uptime_hours=float(self.uptime_hours[row]),
+            labels=dict(self.label_sets[code]) if (code := self.label_codes[row]) >= 0 else {},
+        )
+
+    def rows_by_node(self) -> Dict[str, np.ndarray]:
+        """Row indexes of workloads per node name, preserving inventory order within a node."""
+        order = np.argsort(self.node_index, kind="stable")
+        boundaries = np.flatnonzero(np.diff(self.node_index[order])) + 1
+        return {
+            self.node_names[self.node_index[rows[0]]]: rows
+            for rows in np.split(order, boundaries)
+            if len(rows)
+        }
+
+
+def as_inventory(inventory: Inventory | InventoryFrame) -> Inventory:
+    if isinstance(inventory, InventoryFrame):
+        return inventory.to_inventory()
+    return inventory
+
+
+class WorkloadView(Sequence[Workload]):
+    """Read-only sequence that materializes :class:`Workload` objects on access."""
+
+    def __init__(self, frame: InventoryFrame) -> None:
+        self._frame = frame
+
+    def __len__(self) -> int:
+        return len(self._frame.workload_names)
+
+    @overload
+    def __getitem__(self, index: int) -> Workload: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Workload]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._frame.workload(row) for row in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("workload index out of range")
+        return self._frame.workload(index)
+
+    def __iter__(self) -> Iterator[Workload]:
+        for row in range(len(self)):
+            yield self._frame.workload(row)
+
+
+class InventoryFrameBuilder:
+    """Accumulates nodes and workloads row by row and freezes them into an InventoryFrame."""
+
+    def __init__(self) -> None:
+        self.nodes: List[Node] = []
+        self._node_names = _StringTable()
+        self._types = _StringTable()
+        self._names: List[str] = []
+        self._type_codes: List[int] = []
+        self._node_codes: List[int] = []
+        self._columns: Dict[str, List[float]] = {name: [] for name in FLOAT_COLUMNS}
+        self._label_codes: List[int] = []
+        self._label_sets: List[Dict[str, str]] = []
+        self._label_lookup: Dict[tuple, int] = {}
+
+    def add_node(self, node: Node) -> None:
+        self.nodes.append(node)
+
+    def add_workload(self, workload: Workload) -> None:
+        self.add_row(
+            name=workload.name,
+            workload_type=workload.workload_type,
+            node=workload.node,
+            vcpus=workload.vcpus,
+            memory_gb=workload.memory_gb,
+            utilization_cpu=workload.utilization_cpu,
+            utilization_memory=workload.utilization_memory,
+            uptime_hours=workload.uptime_hours,
+            labels=workload.labels,
+        )
+
+    def add_row(
+        self,
+        name: str,
+        workload_type: str,
+        node: str,
+        vcpus: float,
+        memory_gb: float,
+        utilization_cpu: float,
+        utilization_memory: float,
+        uptime_hours: float = 0.0,
+        labels: Dict[str, str] | None = None,
+    ) -> None:
+        self._label_codes.append(self._label_code(labels) if labels else -1)
+        self._names.append(name)
+        self._type_codes.append(self._types.code(workload_type))
+        self._node_codes.append(self._node_names.code(node))
+        columns = self._columns
+        columns["vcpus"].append(vcpus)
+        columns["memory_gb"].append(memory_gb)
+        columns["utilization_cpu"].append(utilization_cpu)
+        columns["utilization_memory"].append(utilization_memory)
+        columns["uptime_hours"].append(uptime_hours)
+
+    def _label_code(self, labels: Dict[str, str]) -> int:
+        try:
+            key = tuple(sorted(labels.items()))
+            code = self._label_lookup.get(key)
+        except TypeError:  # unhashable label values are stored without sharing
+            key, code = None, None
+        if code is None:
+            code = len(self._label_sets)
+            self._label_sets.append(labels)
+            if key is not None:
+                self._label_lookup[key] = code
+        return code
+
+    def build(self) -> InventoryFrame:
+        # Re-code node references so inventory nodes come first, in inventory order.
+        table = _StringTable(node.name for node in self.nodes)
+        remap = np.array([table.code(name) for name in self._node_names.values], dtype=np.int32)
+        node_codes = np.asarray(self._node_codes, dtype=np.int32)
+        return InventoryFrame(
+            nodes=self.nodes,
+            node_names=table.values,
+            workload_names=self._names,
+            workload_types=self._types.values,
+            type_codes=np.asarray(self._type_codes, dtype=np.int32),
+            node_index=remap[node_codes],
+            label_codes=np.asarray(self._label_codes, dtype=np.int32),
+            label_sets=self._label_sets,
+            **{
+                name: np.asarray(values, dtype=np.float64) for name, values in self._columns.items()
+            },
+        )
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import HOURS_PER_WEEK
+from .delta import WorkloadKey, workload_key
+from .frame import InventoryFrame
+from .models import Inventory
+
+DEFAULT_RESOLUTION_SECONDS = 900.0
+DEFAULT_CAPACITY = 672  # one week of 15 minute buckets
+SAMPLE_DTYPE = np.float32
+COUNT_DTYPE = np.uint8  # samples averaged into one bucket, saturating at 255
+POWER_PERCENTILE = 50.0
+PLANNING_PERCENTILE = 95.0
+
+
+@dataclass
+class UtilizationHistory:
+    """Downsampled utilization samples per workload in a fixed-size ring of time buckets.
+
+    Every collect run lands in the bucket ``floor(timestamp / resolution_seconds)``; samples in
+    the same bucket are averaged and a new bucket overwrites the oldest one once ``capacity``
+    buckets are in use. ``cpu`` and ``memory`` have one row per entry in ``keys`` and one column
+    per ring slot, with ``NaN`` where a workload has no sample. Rows live in buffers that double
+    when full, and workloads without a sample anywhere in the ring are dropped.
+    """
+
+    resolution_seconds: float = DEFAULT_RESOLUTION_SECONDS
+    capacity: int = DEFAULT_CAPACITY
+    keys: List[WorkloadKey] = field(default_factory=list)
+    timestamps: Optional[np.ndarray] = None
+    cpu: Optional[np.ndarray] = None
+    memory: Optional[np.ndarray] = None
+    counts: Optional[np.ndarray] = None
+    head: int = -1
+
+    def __post_init__(self) -> None:
+        if self.resolution_seconds <= 0 or self.capacity <= 0:
+            raise ValueError("History resolution and capacity must be positive")
+        shape = (len(self.keys), self.capacity)
+        if self.timestamps is None:
+            self.timestamps = np.full(self.capacity, np.nan)
+        if self.cpu is None:
+            self.cpu = np.full(shape, np.nan, dtype=SAMPLE_DTYPE)
+        if self.memory is None:
+            self.memory = np.full(shape, np.nan, dtype=SAMPLE_DTYPE)
+        if self.counts is None:
+            self.counts = np.zeros(shape, dtype=COUNT_DTYPE)
+        # Stores written with 16-bit counts are converted on load
+        self.counts = np.minimum(self.counts, np.iinfo(COUNT_DTYPE).max).astype(COUNT_DTYPE)
+        # cpu, memory and counts are views of the first len(keys) rows of these buffers
+        self._buffers = (self.cpu, self.memory, self.counts)
+        self._rows: Dict[WorkloadKey, int] = {key: row for row, key in enumerate(self.keys)}
+
+    def __len__(self) -> int:
+        """Number of buckets holding samples."""
+        return int(np.count_nonzero(~np.isnan(self.timestamps)))
+
+    def record(
+        self, inventory: Inventory | InventoryFrame, timestamp: Optional[float] = None
+    ) -> None:
+        """Append the utilization of every workload in ``inventory`` as one sample."""
+        timestamp = time.time() if timestamp is None else timestamp
+        bucket_start = timestamp // self.resolution_seconds * self.resolution_seconds
+        latest = self.timestamps[self.head] if self.head >= 0 else None
+        if latest is not None and bucket_start < latest:
+            raise ValueError("Utilization samples must be recorded in time order")
+        opened = latest is None or bucket_start > latest
+        if opened:
+            self.head = (self.head + 1) % self.capacity
+            self.timestamps[self.head] = bucket_start
+            self.cpu[:, self.head] = np.nan
+            self.memory[:, self.head] = np.nan
+            self.counts[:, self.head] = 0
+
+        keys, cpu, memory = _samples(inventory)
+        rows = self._rows_for(keys, grow=True)
+        slot = self.head
+        seen = self.counts[rows, slot].astype(np.float32)
+        self.cpu[rows, slot] = np.where(
+            seen > 0, self.cpu[rows, slot] + (cpu - self.cpu[rows, slot]) / (seen + 1), cpu
+        )
+        self.memory[rows, slot] = np.where(
+            seen > 0,
+            self.memory[rows, slot] + (memory - self.memory[rows, slot]) / (seen + 1),
+            memory,
+        )
+        self.counts[rows, slot] = np.minimum(seen + 1, np.iinfo(COUNT_DTYPE).max)
+        if opened:
+            self._prune()
+
+    def percentile_columns(
+        self, q: float, window_seconds: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-row CPU and memory percentiles over the buckets in the window.
+
+        The window ends at the newest bucket. Rows without samples in the window are ``NaN``.
+        """
+        rows = len(self.keys)
+        cpu = np.full(rows, np.nan)
+        memory = np.full(rows, np.nan)
+        window = self._window(window_seconds)
+        if not rows or not window.any():
+            return cpu, memory
+        sampled = self.counts[:, window] > 0
+        present = sampled.any(axis=1)
+        if present.any():
+            cpu[present] = np.nanpercentile(self.cpu[np.ix_(present, window)], q, axis=1)
+            memory[present] = np.nanpercentile(self.memory[np.ix_(present, window)], q, axis=1)
+        return cpu, memory
+
+    def hourly_columns(
+        self, window_seconds: Optional[float] = None, utc_offset_seconds: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean CPU and memory utilization per row and hour of the week (Monday 00:00 first).
+
+        Returns two ``(rows, HOURS_PER_WEEK)`` arrays, ``NaN`` for hours without samples.
+        """
+        window = self._window(window_seconds)
+        hours = hour_of_week(self.timestamps[window] + utc_offset_seconds)
+        slots = np.zeros((hours.size, HOURS_PER_WEEK))
+        slots[np.arange(hours.size), hours] = 1.0
+
+        def hourly_mean(values: np.ndarray) -> np.ndarray:
+            block = values[:, window]
+            present = ~np.isnan(block)
+            totals = np.where(present, block, 0.0) @ slots
+            seen = present.astype(np.float64) @ slots
+            with np.errstate(invalid="ignore"):
+                return totals / seen
+
+        return hourly_mean(self.cpu), hourly_mean(self.memory)
+
+    def hourly_utilization(
+        self,
+        inventory: Inventory | InventoryFrame,
+        window_seconds: Optional[float] = None,
+        utc_offset_seconds: float = 0.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Hour-of-week utilization for each workload of ``inventory`` (workloads x 168).
+
+        Hours without samples use the workload's mean over the other hours, and workloads
+        without history use their snapshot utilization throughout.
+        """
+        cpu, memory = self.hourly_columns(window_seconds, utc_offset_seconds)
+        keys, snapshot_cpu, snapshot_memory = _samples(inventory)
+        rows = self._rows_for(keys, grow=False)
+        return _fill_hours(cpu, rows, snapshot_cpu), _fill_hours(memory, rows, snapshot_memory)
+
+    def percentiles(
+        self, q: float, window_seconds: Optional[float] = None
+    ) -> Dict[WorkloadKey, Tuple[float, float]]:
+        cpu, memory = self.percentile_columns(q, window_seconds)
+        return {
+            key: (float(cpu[row]), float(memory[row]))
+            for row, key in enumerate(self.keys)
+            if not np.isnan(cpu[row])
+        }
+
+    def with_percentile(
+        self,
+        inventory: Inventory | InventoryFrame,
+        q: float,
+        window_seconds: Optional[float] = None,
+    ) -> Inventory | InventoryFrame:
+        """Return ``inventory`` with workload utilization replaced by its ``q``-th percentile.
+
+        Workloads without history in the window keep their snapshot values.
+        """
+        cpu, memory = self.percentile_columns(q, window_seconds)
+        keys, snapshot_cpu, snapshot_memory = _samples(inventory)
+        rows = self._rows_for(keys, grow=False)
+        known = rows >= 0
+        new_cpu = snapshot_cpu.astype(np.float64)
+        new_memory = snapshot_memory.astype(np.float64)
+        new_cpu[known] = cpu[rows[known]]
+        new_memory[known] = memory[rows[known]]
+        missing = np.isnan(new_cpu)
+        new_cpu[missing] = snapshot_cpu[missing]
+        new_memory[missing] = snapshot_memory[missing]
+        if isinstance(inventory, InventoryFrame):
+            return replace(inventory, utilization_cpu=new_cpu, utilization_memory=new_memory)
+        workloads = [
+            replace(workload, utilization_cpu=workload_cpu, utilization_memory=workload_memory)
+            for workload, workload_cpu, workload_memory in zip(
+                inventory.workloads, new_cpu.tolist(), new_memory.tolist(), strict=True
+            )
+        ]
+        return Inventory(nodes=inventory.nodes, workloads=workloads)
+
+    def _window(self, window_seconds: Optional[float]) -> np.ndarray:
+        window = ~np.isnan(self.timestamps)
+        if window_seconds is not None and self.head >= 0:
+            window &= self.timestamps > self.timestamps[self.head] - window_seconds
+        return window
+
+    def _rows_for(self, keys: List[WorkloadKey], grow: bool) -> np.ndarray:
+        if grow:
+            new_keys = [key for key in dict.fromkeys(keys) if key not in self._rows]
+            if new_keys:
+                self._grow(new_keys)
+        return np.fromiter(
+            (self._rows.get(key, -1) for key in keys), dtype=np.int64, count=len(keys)
+        )
+
+    def _grow(self, new_keys: List[WorkloadKey]) -> None:
+        used = len(self.keys)
+        for key in new_keys:
+            self._rows[key] = len(self.keys)
+            self.keys.append(key)
+        rows = len(self.keys)
+        allocated = len(self._buffers[0])
+        if rows > allocated:
+            allocated = max(rows, 2 * allocated)
+            self._buffers = tuple(_resized(buffer, allocated, used) for buffer in self._buffers)
+        self._use_rows(rows)
+
+    def _prune(self) -> None:
+        """Drop workloads that have no sample left in the ring, i.e. none for a full window."""
+        kept = self.counts.any(axis=1)
+        if kept.all():
+            return
+        rows = int(np.count_nonzero(kept))
+        for view, buffer in zip((self.cpu, self.memory, self.counts), self._buffers, strict=True):
+            buffer[:rows] = view[kept]
+            buffer[rows : len(kept)] = _blank(buffer)
+        self.keys = [key for key, keep in zip(self.keys, kept.tolist(), strict=True) if keep]
+        self._rows = {key: row for row, key in enumerate(self.keys)}
+        self._use_rows(rows)
+
+    def _use_rows(self, rows: int) -> None:
+        self.cpu, self.memory, self.counts = (buffer[:rows] for buffer in self._buffers)
+
+
+def _resized(buffer: np.ndarray, rows: int, used: int) -> np.ndarray:
+    """``buffer`` reallocated with ``rows`` rows, copying the first ``used`` and blanking the rest."""
+    resized = np.full((rows, buffer.shape[1]), _blank(buffer), dtype=buffer.dtype)
+    resized[:used] = buffer[:used]
+    return resized
+
+
+def _blank(buffer: np.ndarray) -> float:
+    """Value of a slot without samples: ``NaN`` for utilization, zero for counts."""
+    return np.nan if np.issubdtype(buffer.dtype, np.floating) else 0
+
+
+def hour_of_week(timestamps: np.ndarray) -> np.ndarray:
+    """Hour of the week (0 = Monday 00:00) for epoch timestamps."""
+    seconds = np.asarray(timestamps, dtype=np.float64)
+    weekday = (seconds // 86400 + 3) % 7  # 1970-01-01 was a Thursday
+    return (weekday * 24 + seconds % 86400 // 3600).astype(np.int64)
+
+
+def _fill_hours(hourly: np.ndarray, rows: np.ndarray, snapshot: np.ndarray) -> np.ndarray:
+    result = np.repeat(np.asarray(snapshot, dtype=np.float64)[:, None], HOURS_PER_WEEK, axis=1)
+    known = rows >= 0
+    block = hourly[rows[known]]
+    present = ~np.isnan(block)
+    seen = present.sum(axis=1)
+    row_mean = np.where(
+        seen > 0, np.where(present, block, 0.0).sum(axis=1) / np.maximum(seen, 1), snapshot[known]
+    )
+    result[known] = np.where(present, block, row_mean[:, None])
+    return result
+
+
+def _samples(
+    inventory: Inventory | InventoryFrame,
+) -> Tuple[List[WorkloadKey], np.ndarray, np.ndarray]:
+    if isinstance(inventory, InventoryFrame):
+        node_names = inventory.node_names
+        keys = [
+            (node_names[code], name)
+            for code, name in zip(
+                inventory.node_index.tolist(), inventory.workload_names, strict=True
+            )
+        ]
+        return keys, inventory.utilization_cpu, inventory.utilization_memory
+    workloads = inventory.workloads
+    count = len(workloads)
+    return (
+        [workload_key(w) for w in workloads],
+        np.fromiter((w.utilization_cpu for w in workloads), dtype=np.float64, count=count),
+        np.fromiter((w.utilization_memory for w in workloads), dtype=np.float64, count=count),
+    )
+
+
+def load_history(path: Path) -> UtilizationHistory:
+    with np.load(path) as data:
+        return UtilizationHistory(
+            resolution_seconds=float(data["resolution_seconds"]),
+            capacity=int(data["capacity"]),
+            keys=list(zip(data["key_nodes"].tolist(), data["key_names"].tolist(), strict=True)),
+            timestamps=data["timestamps"],
+            cpu=data["cpu"],
+            memory=data["memory"],
+            counts=data["counts"],
+            head=int(data["head"]),
+        )
+
+
+def save_history(history: UtilizationHistory, path: Path) -> None:
+    """Write the store atomically so an interrupted collect run never truncates it."""
+    partial = path.with_name(path.name + ".partial")
+    with partial.open("wb") as handle:
+        np.savez(
+            handle,
+            resolution_seconds=history.resolution_seconds,
+            capacity=history.capacity,
+            head=history.head,
+            key_nodes=np.array([node for node, _ in history.keys], dtype=str),
+            key_names=np.array([name for _, name in history.keys], dtype=str),
+            timestamps=history.timestamps,
+            cpu=history.cpu,
+            memory=history.memory,
+            counts=history.counts,
+        )
+    os.replace(partial, path)
+
+
+def record_history(inventory: Inventory | InventoryFrame, path: Path) -> UtilizationHistory:
+    """Append ``inventory`` to the store at ``path``, creating it on first use."""
+    history = load_history(path) if path.exists() else UtilizationHistory()
+    history.record(inventory)
+    save_history(history, path)
+    return history
@@ -0,0 +1,194 @@
+"""Inventory snapshot files: JSON (``.json``), JSON Lines (``.jsonl``) or binary (``.hcoi``).
+
+JSON Lines files hold one ``{"record": "power_profile" | "node" | "workload", ...}`` object per
+line and are parsed incrementally into an :class:`InventoryFrame` without materializing the whole
+document. Power profiles come first, and nodes refer to them by name.
+
+Binary files start with ``BINARY_MAGIC`` and a little-endian ``uint64`` header length, followed by
+a JSON header (nodes, string tables, label sets and the column layout) and the raw workload
+columns, each aligned to ``BINARY_ALIGNMENT`` bytes. Loading memory-maps the file and exposes the
+numeric columns as read-only NumPy views without copying them.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+import numpy as np
+
+from .frame import InventoryFrame, InventoryFrameBuilder
+from .models import (
+    Inventory,
+    Node,
+    PowerProfileTable,
+    Workload,
+    node_from_dict,
+    power_profile_from_dict,
+    workload_from_dict,
+)
+
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+BINARY_SUFFIXES = {".hcoi"}
+BINARY_MAGIC = b"HCOINV1\n"
+BINARY_ALIGNMENT = 64
+BINARY_COLUMNS = {
+    "type_codes": "<i4",
+    "node_index": "<i4",
+    "label_codes": "<i4",
+    "vcpus": "<f8",
+    "memory_gb": "<f8",
+    "utilization_cpu": "<f8",
+    "utilization_memory": "<f8",
+    "uptime_hours": "<f8",
+}
+_HEADER_LENGTH = struct.Struct("<Q")
+
+
+def is_jsonl(path: Path) -> bool:
+    return path.suffix.lower() in JSONL_SUFFIXES
+
+
+def is_binary(path: Path) -> bool:
+    return path.suffix.lower() in BINARY_SUFFIXES
+
+
+def iter_jsonl_records(lines: Iterable[str]) -> Iterator[Node | Workload]:
+    """Yield nodes and workloads from JSON Lines text one record at a time."""
+    profiles = PowerProfileTable()
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        record = item.pop("record", None)
+        if record == "power_profile":
+            profiles.add(power_profile_from_dict(item))
+        elif record == "node":
+            yield node_from_dict(item, profiles)
+        elif record == "workload":
+            yield workload_from_dict(item)
+        else:
+            raise ValueError(f"Line {line_number}: unknown inventory record type {record!r}")
+
+
+def read_inventory_jsonl(path: Path) -> InventoryFrame:
+    builder = InventoryFrameBuilder()
+    with path.open() as handle:
+        for record in iter_jsonl_records(handle):
+            if isinstance(record, Node):
+                builder.add_node(record)
+            else:
+                builder.add_workload(record)
+    return builder.build()
+
+
+def write_inventory_jsonl(inventory: Inventory | InventoryFrame, path: Path) -> None:
+    profiles = PowerProfileTable.from_nodes(inventory.nodes)
+    with path.open("w") as handle:
+        for name, profile in profiles.to_dict().items():
+            handle.write(json.dumps({"record": "power_profile", "name": name, **profile}) + "\n")
+        for node in inventory.nodes:
+            node_dict = Inventory._node_to_dict(node, profiles)
+            handle.write(json.dumps({"record": "node", **node_dict}) + "\n")
+        for workload in inventory.workloads:
+            handle.write(json.dumps({"record": "workload", **asdict(workload)}) + "\n")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // BINARY_ALIGNMENT) * BINARY_ALIGNMENT
+
+
+def write_inventory_binary(inventory: Inventory | InventoryFrame, path: Path) -> None:
+    frame = (
+        inventory
+        if isinstance(inventory, InventoryFrame)
+        else InventoryFrame.from_inventory(inventory)
+    )
+    columns: Dict[str, np.ndarray] = {
+        name: np.ascontiguousarray(getattr(frame, name), dtype=dtype)
+        for name, dtype in BINARY_COLUMNS.items()
+    }
+    layout: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for name, column in columns.items():
+        offset = _aligned(offset)
+        layout[name] = {"dtype": BINARY_COLUMNS[name], "offset": offset}
+        offset += column.nbytes
+    profiles = PowerProfileTable.from_nodes(frame.nodes)
+    header = json.dumps(
+        {
+            "rows": len(frame.workload_names),
+            "power_profiles": profiles.to_dict(),
+            "nodes": [Inventory._node_to_dict(node, profiles) for node in frame.nodes],
+            "node_names": frame.node_names,
+            "workload_names": frame.workload_names,
+            "workload_types": frame.workload_types,
+            "label_sets": frame.label_sets,
+            "columns": layout,
+        }
+    ).encode()
+    data_start = _aligned(len(BINARY_MAGIC) + _HEADER_LENGTH.size + len(header))
+    with path.open("wb") as handle:
+        handle.write(BINARY_MAGIC)
+        handle.write(_HEADER_LENGTH.pack(len(header)))
+        handle.write(header)
+        for name, column in columns.items():
+            handle.seek(data_start + layout[name]["offset"])
+            handle.write(column.tobytes())
+
+
+def read_inventory_binary(path: Path) -> InventoryFrame:
+    """Memory-map a binary inventory; numeric columns are zero-copy, read-only views."""
+    with path.open("rb") as handle:
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    prefix = len(BINARY_MAGIC)
+    if buffer[:prefix] != BINARY_MAGIC:
+        raise ValueError(f"{path} is not a binary inventory file")
+    (header_length,) = _HEADER_LENGTH.unpack_from(buffer, prefix)
+    header_start = prefix + _HEADER_LENGTH.size
+    header = json.loads(buffer[header_start : header_start + header_length])
+    data_start = _aligned(header_start + header_length)
+    rows = header["rows"]
+    columns = {
+        name: (
+            np.frombuffer(
+                buffer, dtype=spec["dtype"], count=rows, offset=data_start + spec["offset"]
+            )
+            if rows
+            else np.empty(0, dtype=spec["dtype"])
+        )
+        for name, spec in header["columns"].items()
+    }
+    profiles = PowerProfileTable.from_dict(header.get("power_profiles", {}))
+    return InventoryFrame(
+        nodes=[node_from_dict(item, profiles) for item in header["nodes"]],
+        node_names=header["node_names"],
+        workload_names=header["workload_names"],
+        workload_types=header["workload_types"],
+        label_sets=header["label_sets"],
+        **columns,
+    )
+
+
+def load_inventory(path: Path) -> Inventory | InventoryFrame:
+    if is_binary(path):
+        return read_inventory_binary(path)
+    if is_jsonl(path):
+        return read_inventory_jsonl(path)
+    return Inventory.from_dict(json.loads(path.read_text()))
+
+
+def save_inventory(inventory: Inventory | InventoryFrame, path: Path) -> None:
+    if is_binary(path):
+        write_inventory_binary(inventory, path)
+        return
+    if is_jsonl(path):
+        write_inventory_jsonl(inventory, path)
+        return
+    if isinstance(inventory, InventoryFrame):
+        inventory = inventory.to_inventory()
+    path.write_text(json.dumps(inventory.to_dict(), indent=2))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import json
 from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 @dataclass
@@ -22,7 +23,10 @@ class Node:
     power_profile: PowerProfile
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def capacity_remaining(self, workloads: List[Workload]) -> Dict[str, float]:
+    def capacity_remaining(self, workloads: List[Workload] | CapacityIndex) -> Dict[str, float]:
+        """Free CPU and RAM; pass a :class:`CapacityIndex` to avoid scanning every workload."""
+        if isinstance(workloads, CapacityIndex):
+            return workloads.remaining(self)
         cpu_used = sum(w.vcpus for w in workloads if w.node == self.name)
         ram_used = sum(w.memory_gb for w in workloads if w.node == self.name)
         return {
@@ -50,63 +54,228 @@ class Inventory:
     workloads: List[Workload]
 
     def to_dict(self) -> Dict[str, Any]:
+        profiles = PowerProfileTable.from_nodes(self.nodes)
         return {
-            "nodes": [self._node_to_dict(node) for node in self.nodes],
+            "power_profiles": profiles.to_dict(),
+            "nodes": [self._node_to_dict(node, profiles) for node in self.nodes],
             "workloads": [asdict(workload) for workload in self.workloads],
         }
 
     @staticmethod
-    def _node_to_dict(node: Node) -> Dict[str, Any]:
-        node_dict = asdict(node)
-        node_dict["power_profile"] = asdict(node.power_profile)
-        return node_dict
+    def _node_to_dict(node: Node, profiles: Optional[PowerProfileTable] = None) -> Dict[str, Any]:
+        """Node fields with the power profile inlined, or named when ``profiles`` holds it."""
+        return {
+            "name": node.name,
+            "kind": node.kind,
+            "total_cpu": node.total_cpu,
+            "total_memory_gb": node.total_memory_gb,
+            "power_profile": (
+                profiles.reference(node.power_profile)
+                if profiles is not None
+                else asdict(node.power_profile)
+            ),
+            "metadata": dict(node.metadata),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Inventory":  # noqa: D401
-        nodes = []
-        for item in data.get("nodes", []):
-            if "name" not in item:
-                raise ValueError("Node missing required field 'name'")
-
-            profile_data = item.get("power_profile", {})
-            profile = PowerProfile(
-                name=profile_data.get("name", "default"),
-                base_idle_watts=float(profile_data.get("base_idle_watts", 60)),
-                watts_per_cpu_core=float(profile_data.get("watts_per_cpu_core", 10)),
-                watts_per_gb_ram=float(profile_data.get("watts_per_gb_ram", 1)),
-            )
-            nodes.append(
-                Node(
-                    name=item["name"],
-                    kind=item.get("kind", "unknown"),
-                    total_cpu=float(item.get("total_cpu", 0)),
-                    total_memory_gb=float(item.get("total_memory_gb", 0)),
-                    power_profile=profile,
-                    metadata=item.get("metadata", {}),
-                )
-            )
-
-        workloads = []
-        for item in data.get("workloads", []):
-            if "name" not in item:
-                raise ValueError("Workload missing required field 'name'")
-
-            workloads.append(
-                Workload(
-                    name=item["name"],
-                    workload_type=item.get("workload_type", "vm"),
-                    vcpus=float(item.get("vcpus", 0)),
-                    memory_gb=float(item.get("memory_gb", 0)),
-                    utilization_cpu=float(item.get("utilization_cpu", 0)),
-                    utilization_memory=float(item.get("utilization_memory", 0)),
-                    node=item.get("node", ""),
-                    uptime_hours=float(item.get("uptime_hours", 0)),
-                    labels=item.get("labels", {}),
-                )
-            )
+        profiles = PowerProfileTable.from_dict(data.get("power_profiles", {}))
+        nodes = [node_from_dict(item, profiles) for item in data.get("nodes", [])]
+        workloads = [workload_from_dict(item) for item in data.get("workloads", [])]
         return cls(nodes=nodes, workloads=workloads)
 
 
+class PowerProfileTable:
+    """Power profiles shared by reference between nodes, looked up by name (a flyweight).
+
+    Serialized inventories list each profile once under ``power_profiles`` and nodes name it.
+    Files with the profile inlined in every node still load, and identical inline profiles
+    resolve to one shared object.
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, PowerProfile]] = None) -> None:
+        self._named: Dict[str, PowerProfile] = dict(profiles or {})
+        self._inline: Dict[str, PowerProfile] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, Any]]) -> "PowerProfileTable":
+        return cls(
+            {name: power_profile_from_dict({**item, "name": name}) for name, item in data.items()}
+        )
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node]) -> "PowerProfileTable":
+        """Table of the first profile seen under each name; differing namesakes stay inline."""
+        table = cls()
+        for node in nodes:
+            table._named.setdefault(node.power_profile.name, node.power_profile)
+        return table
+
+    def __getitem__(self, name: str) -> PowerProfile:
+        return self._named[name]
+
+    def add(self, profile: PowerProfile) -> None:
+        self._named[profile.name] = profile
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {key: value for key, value in asdict(profile).items() if key != "name"}
+            for name, profile in self._named.items()
+        }
+
+    def reference(self, profile: PowerProfile) -> str | Dict[str, Any]:
+        """The profile's name when the table holds an equal profile under it, else the fields."""
+        named = self._named.get(profile.name)
+        if named is profile or named == profile:
+            return profile.name
+        return asdict(profile)
+
+    def resolve(self, value: str | Dict[str, Any] | None) -> PowerProfile:
+        """Profile for a node's serialized ``power_profile``: a name or inline fields."""
+        if isinstance(value, str):
+            if value not in self._named:
+                raise ValueError(f"Unknown power profile '{value}'")
+            return self._named[value]
+        key = json.dumps(value or {}, sort_keys=True)
+        profile = self._inline.get(key)
+        if profile is None:
+            profile = self._inline[key] = power_profile_from_dict(value or {})
+        return profile
+
+
+@dataclass
+class NodeUsage:
+    cpu: float
+    ram: float
+
+
+def _allocation(workload: Workload) -> Tuple[float, float]:
+    return workload.vcpus, workload.memory_gb
+
+
+class CapacityIndex:
+    """CPU and RAM in use per node, built once and updated as workloads come, go or move.
+
+    ``demand`` gives the ``(cpu, ram)`` a workload occupies and defaults to its allocation.
+    Node names that only appear on workloads are tracked too, without capacity.
+    """
+
+    def __init__(
+        self,
+        nodes: Sequence[Node],
+        usage: Optional[Dict[str, NodeUsage]] = None,
+        demand: Optional[Callable[[Workload], Tuple[float, float]]] = None,
+    ) -> None:
+        self._usage: Dict[str, NodeUsage] = {
+            node.name: NodeUsage(cpu=0.0, ram=0.0) for node in nodes
+        }
+        if usage:
+            self._usage.update(usage)
+        self._demand = demand or _allocation
+
+    @classmethod
+    def from_inventory(
+        cls,
+        inventory: Inventory,
+        demand: Optional[Callable[[Workload], Tuple[float, float]]] = None,
+    ) -> "CapacityIndex":
+        index = cls(inventory.nodes, demand=demand)
+        for workload in inventory.workloads:
+            index.add(workload)
+        return index
+
+    def __getitem__(self, name: str) -> NodeUsage:
+        return self._usage[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._usage
+
+    def get(self, name: str, default: Optional[NodeUsage] = None) -> Optional[NodeUsage]:
+        return self._usage.get(name, default)
+
+    def update(self, usage: Dict[str, NodeUsage]) -> None:
+        """Replace the usage entries of the given nodes."""
+        self._usage.update(usage)
+
+    def add(self, workload: Workload) -> None:
+        self._shift(workload.node, workload, 1.0)
+
+    def remove(self, workload: Workload) -> None:
+        self._shift(workload.node, workload, -1.0)
+
+    def move(self, workload: Workload, source_node: str, target_node: str) -> None:
+        """Account ``workload`` on ``target_node`` instead of ``source_node``.
+
+        The source is explicit because ``workload.node`` is left untouched: after one move it
+        no longer names the node the index has the workload on.
+        """
+        self._shift(source_node, workload, -1.0)
+        self._shift(target_node, workload, 1.0)
+
+    def remaining(self, node: Node) -> Dict[str, float]:
+        used = self._usage.get(node.name) or NodeUsage(cpu=0.0, ram=0.0)
+        return {
+            "cpu": max(node.total_cpu - used.cpu, 0.0),
+            "memory_gb": max(node.total_memory_gb - used.ram, 0.0),
+        }
+
+    def _shift(self, name: str, workload: Workload, sign: float) -> None:
+        cpu, ram = self._demand(workload)
+        entry = self._usage.get(name)
+        if entry is None:
+            entry = self._usage[name] = NodeUsage(cpu=0.0, ram=0.0)
+        entry.cpu += sign * cpu
+        entry.ram += sign * ram
+
+
+def power_profile_from_dict(item: Dict[str, Any]) -> PowerProfile:
+    return PowerProfile(
+        name=item.get("name", "default"),
+        base_idle_watts=float(item.get("base_idle_watts", 60)),
+        watts_per_cpu_core=float(item.get("watts_per_cpu_core", 10)),
+        watts_per_gb_ram=float(item.get("watts_per_gb_ram", 1)),
+        metadata=item.get("metadata", {}),
+    )
+
+
+def node_from_dict(item: Dict[str, Any], profiles: Optional[PowerProfileTable] = None) -> Node:
+    """Build a node; a ``power_profile`` given by name is looked up in ``profiles``."""
+    if "name" not in item:
+        raise ValueError("Node missing required field 'name'")
+
+    try:
+        profile = (profiles if profiles is not None else PowerProfileTable()).resolve(
+            item.get("power_profile")
+        )
+    except ValueError as exc:
+        raise ValueError(f"Node '{item['name']}': {exc}") from exc
+    return Node(
+        name=item["name"],
+        kind=item.get("kind", "unknown"),
+        total_cpu=float(item.get("total_cpu", 0)),
+        total_memory_gb=float(item.get("total_memory_gb", 0)),
+        power_profile=profile,
+        metadata=item.get("metadata", {}),
+    )
+
+
+def workload_from_dict(item: Dict[str, Any]) -> Workload:
+    if "name" not in item:
+        raise ValueError("Workload missing required field 'name'")
+
+    return Workload(
+        name=item["name"],
+        workload_type=item.get("workload_type", "vm"),
+        vcpus=float(item.get("vcpus", 0)),
+        memory_gb=float(item.get("memory_gb", 0)),
+        utilization_cpu=float(item.get("utilization_cpu", 0)),
+        utilization_memory=float(item.get("utilization_memory", 0)),
+        node=item.get("node", ""),
+        uptime_hours=float(item.get("uptime_hours", 0)),
+        labels=item.get("labels", {}),
+    )
+
+
 @dataclass
 class ConsolidationMove:
     workload: Workload
@@ -121,6 +290,7 @@ class ConsolidationPlan:
     estimated_watts_saved: float
     estimated_monthly_savings: float
     notes: Optional[str] = None
+    optimality_gap: Optional[float] = None
 
 
 def group_workloads_by_node(workloads: List[Workload]) -> Dict[str, List[Workload]]:
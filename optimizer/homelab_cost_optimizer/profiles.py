@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .config import ProfileRule
+from .models import Inventory, Node, PowerProfile
+
+
+@dataclass
+class _CompiledRule:
+    profile: PowerProfile
+    name_match: Optional[Callable[[str], object]]
+    metadata: Tuple[Tuple[str, str], ...]
+    cpu: Tuple[float, float]
+    memory_gb: Tuple[float, float]
+
+    @classmethod
+    def compile(cls, rule: ProfileRule, profile: PowerProfile) -> "_CompiledRule":
+        return cls(
+            profile=profile,
+            name_match=re.compile(fnmatch.translate(rule.name)).match if rule.name else None,
+            metadata=tuple((key, str(value)) for key, value in rule.metadata.items()),
+            cpu=(_bound(rule.min_cpu, float("-inf")), _bound(rule.max_cpu, float("inf"))),
+            memory_gb=(
+                _bound(rule.min_memory_gb, float("-inf")),
+                _bound(rule.max_memory_gb, float("inf")),
+            ),
+        )
+
+    def matches(self, node: Node) -> bool:
+        return (
+            self.cpu[0] <= node.total_cpu <= self.cpu[1]
+            and self.memory_gb[0] <= node.total_memory_gb <= self.memory_gb[1]
+            and (self.name_match is None or self.name_match(node.name) is not None)
+            and all(
+                key in node.metadata and str(node.metadata[key]) == value
+                for key, value in self.metadata
+            )
+        )
+
+
+def _bound(value: Optional[float], default: float) -> float:
+    return default if value is None else value
+
+
+class ProfileAssigner:
+    """Power profile rules compiled once into a lookup index; the first matching rule wins.
+
+    Rules are bucketed by ``kind`` up front, so a node is only tested against the rules for its
+    kind plus those without one, and name globs are compiled to regular expressions once.
+    Assigned profiles are the configured objects themselves, shared by every matching node.
+    """
+
+    def __init__(self, rules: Sequence[ProfileRule], profiles: Dict[str, PowerProfile]) -> None:
+        missing = sorted({rule.profile for rule in rules} - set(profiles))
+        if missing:
+            raise KeyError(f"Unknown power profile(s) in rules: {', '.join(missing)}")
+        compiled = [
+            (rule.kind, _CompiledRule.compile(rule, profiles[rule.profile])) for rule in rules
+        ]
+        self._any_kind: List[_CompiledRule] = [rule for kind, rule in compiled if kind is None]
+        self._by_kind: Dict[str, List[_CompiledRule]] = {
+            kind: [rule for rule_kind, rule in compiled if rule_kind in (None, kind)]
+            for kind in {kind for kind, _ in compiled if kind is not None}
+        }
+
+    def profile_for(self, node: Node) -> Optional[PowerProfile]:
+        for rule in self._by_kind.get(node.kind, self._any_kind):
+            if rule.matches(node):
+                return rule.profile
+        return None
+
+    def assign(self, node: Node) -> Node:
+        """``node`` with the profile of the first matching rule; unmatched nodes are unchanged."""
+        profile = self.profile_for(node)
+        if profile is None or profile is node.power_profile:
+            return node
+        return replace(node, power_profile=profile)
+
+    def apply(self, inventory: Inventory) -> Inventory:
+        return Inventory(
+            nodes=[self.assign(node) for node in inventory.nodes], workloads=inventory.workloads
+        )
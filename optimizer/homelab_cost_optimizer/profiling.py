@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import cProfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+PhaseHook = Callable[[str, float, Optional[int]], None]
+
+
+@dataclass
+class PhaseStats:
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+
+
+class Instrumentation:
+    """Wall time, call count and optionally peak traced memory per named pipeline phase.
+
+    ``hooks`` are called with ``(name, wall_seconds, peak_memory_bytes)`` as each phase ends.
+    With ``trace_memory`` the peak of a phase includes the phases nested in it; tracing slows
+    allocation-heavy code, so wall times are best taken from a run without it.
+    """
+
+    def __init__(self, trace_memory: bool = False, hooks: Sequence[PhaseHook] = ()) -> None:
+        self.trace_memory = trace_memory
+        self.hooks = list(hooks)
+        self.phases: Dict[str, PhaseStats] = {}
+        self.total_seconds = 0.0
+        self._started: Optional[float] = None
+        self._owns_tracing = False
+        self._peaks: List[int] = []
+
+    def start(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._started is not None:
+            self.total_seconds += time.perf_counter() - self._started
+            self._started = None
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            if self._peaks:  # keep the enclosing phase's peak before resetting for this one
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            peak = None
+            if tracing:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+            self._record(name, elapsed, peak)
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-ready totals, phases in the order they were first entered."""
+        return {
+            "total_seconds": self.total_seconds,
+            "trace_memory": self.trace_memory,
+            "phases": [asdict(stats) for stats in self.phases.values()],
+        }
+
+    def _record(self, name: str, elapsed: float, peak: Optional[int]) -> None:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats(name=name)
+        stats.calls += 1
+        stats.wall_seconds += elapsed
+        if peak is not None:
+            stats.peak_memory_bytes = max(stats.peak_memory_bytes or 0, peak)
+        for hook in self.hooks:
+            hook(name, elapsed, peak)
+
+
+_active: ContextVar[Optional[Instrumentation]] = ContextVar("instrumentation", default=None)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Record the enclosed block as phase ``name``; a no-op unless :func:`instrument` is active.
+
+    Also usable as a decorator.
+    """
+    instrumentation = _active.get()
+    if instrumentation is None:
+        yield
+        return
+    with instrumentation.phase(name):
+        yield
+
+
+@contextmanager
+def instrument(
+    trace_memory: bool = False, hooks: Sequence[PhaseHook] = ()
+) -> Iterator[Instrumentation]:
+    """Collect the :func:`phase` blocks run inside the ``with`` statement."""
+    instrumentation = Instrumentation(trace_memory=trace_memory, hooks=hooks)
+    token = _active.set(instrumentation)
+    instrumentation.start()
+    try:
+        yield instrumentation
+    finally:
+        instrumentation.stop()
+        _active.reset(token)
+
+
+@contextmanager
+def profile_to(path: Path) -> Iterator[cProfile.Profile]:
+    """Run the block under cProfile and write pstats data to ``path``."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
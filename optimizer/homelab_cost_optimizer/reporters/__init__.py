@@ -1,9 +1,26 @@
 from .ai_reporter import generate_ai_report
-from .markdown_reporter import generate_markdown_report
-from .text_reporter import generate_text_report
+from .markdown_reporter import (
+    generate_markdown_report,
+    generate_sweep_report,
+    iter_markdown_report,
+    iter_sweep_report,
+)
+from .prometheus_reporter import iter_prometheus_metrics
+from .stream import write_lines
+from .structured_reporter import STRUCTURED_WRITERS, iter_report_rows, write_structured_report
+from .text_reporter import generate_text_report, iter_text_report
 
 __all__ = [
     "generate_text_report",
     "generate_markdown_report",
     "generate_ai_report",
+    "generate_sweep_report",
+    "iter_text_report",
+    "iter_markdown_report",
+    "iter_sweep_report",
+    "write_lines",
+    "STRUCTURED_WRITERS",
+    "iter_report_rows",
+    "write_structured_report",
+    "iter_prometheus_metrics",
 ]
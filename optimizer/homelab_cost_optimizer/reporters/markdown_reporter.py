@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import List
+from typing import TYPE_CHECKING, Iterator, Sequence
 
 from ..estimators.cost_estimator import CostReport
 from ..estimators.power_estimator import PowerReport
 from ..models import ConsolidationPlan, Inventory
 
+# sweep pulls in the consolidators and process pool; only its result type is needed here
+if TYPE_CHECKING:
+    from ..sweep import SweepResult
+
 
 def generate_markdown_report(
     inventory: Inventory,
@@ -13,38 +17,68 @@ def generate_markdown_report(
     cost_report: CostReport,
     plan: ConsolidationPlan | None,
 ) -> str:
-    lines: List[str] = []
-    lines.append("# Homelab Cost Optimizer Summary")
-    lines.append("")
-    lines.append(f"**Nodes**: {len(inventory.nodes)} | **Workloads**: {len(inventory.workloads)}")
-    lines.append(
+    return "\n".join(iter_markdown_report(inventory, power_report, cost_report, plan))
+
+
+def iter_markdown_report(
+    inventory: Inventory,
+    power_report: PowerReport,
+    cost_report: CostReport,
+    plan: ConsolidationPlan | None,
+) -> Iterator[str]:
+    """Lines of :func:`generate_markdown_report`, produced one at a time."""
+    yield "# Homelab Cost Optimizer Summary"
+    yield ""
+    yield f"**Nodes**: {len(inventory.nodes)} | **Workloads**: {len(inventory.workloads)}"
+    yield (
         f"**Power draw**: {power_report.total_watts} W | **Monthly cost**: {cost_report.total_monthly_cost} {cost_report.currency}"
     )
-    lines.append("")
-    lines.append("## Per-node energy & cost")
-    lines.append("| Node | Watts | Monthly cost |")
-    lines.append("| --- | ---: | ---: |")
+    yield ""
+    yield "## Per-node energy & cost"
+    yield "| Node | Watts | Monthly cost |"
+    yield "| --- | ---: | ---: |"
     for power_entry, cost_entry in zip(power_report.per_node, cost_report.per_node, strict=True):
-        lines.append(
+        yield (
             f"| {power_entry.node.name} | {power_entry.watts} | {cost_entry.monthly_cost} {cost_report.currency} |"
         )
-    lines.append("")
+    yield ""
     if plan:
-        lines.append("## Consolidation scenario")
+        yield "## Consolidation scenario"
         nodes_line = f"**Nodes to power down**: {', '.join(plan.powered_down_nodes) or 'none'}"
         savings_line = f"**Estimated savings**: {plan.estimated_watts_saved} W / {plan.estimated_monthly_savings} {cost_report.currency} per month"
-        lines.append(nodes_line)
-        lines.append(savings_line)
+        yield nodes_line
+        yield savings_line
         if plan.moves:
-            lines.append("")
-            lines.append("### Proposed workload moves")
-            lines.append("| Workload | From | To |")
-            lines.append("| --- | --- | --- |")
+            yield ""
+            yield "### Proposed workload moves"
+            yield "| Workload | From | To |"
+            yield "| --- | --- | --- |"
             for move in plan.moves:
-                lines.append(f"| {move.workload.name} | {move.source_node} | {move.target_node} |")
+                yield f"| {move.workload.name} | {move.source_node} | {move.target_node} |"
         if plan.notes:
-            lines.append("")
-            lines.append(f"> {plan.notes}")
+            yield ""
+            yield f"> {plan.notes}"
     else:
-        lines.append("No consolidation scenario calculated in this run.")
-    return "\n".join(lines)
+        yield "No consolidation scenario calculated in this run."
+
+
+def generate_sweep_report(results: Sequence[SweepResult], currency: str) -> str:
+    return "\n".join(iter_sweep_report(results, currency))
+
+
+def iter_sweep_report(results: Sequence[SweepResult], currency: str) -> Iterator[str]:
+    yield "# Scenario sweep"
+    yield ""
+    yield (
+        "| CPU threshold | RAM threshold | Max utilization | Nodes down | Moves | Watts saved "
+        "| Monthly savings | Headroom |"
+    )
+    yield "| ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |"
+    for result in results:
+        scenario = result.scenario
+        yield (
+            f"| {scenario.cpu_threshold:g} | {scenario.ram_threshold:g} "
+            f"| {scenario.max_node_utilization:g} | {result.powered_down} | {result.moves} "
+            f"| {result.estimated_watts_saved} | {result.estimated_monthly_savings} {currency} "
+            f"| {result.headroom:.0%} |"
+        )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Iterator, Tuple
+
+from ..estimators.cost_estimator import CostReport
+from ..estimators.power_estimator import PowerReport
+from ..models import ConsolidationPlan
+
+METRIC_PREFIX = "homelab_cost_optimizer"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Sample = Tuple[Dict[str, str], float]
+
+
+def iter_prometheus_metrics(
+    power_report: PowerReport, cost_report: CostReport, plan: ConsolidationPlan | None
+) -> Iterator[str]:
+    """Prometheus text exposition lines for the reports and plan, ending with an empty line.
+
+    Joined with newlines this is a complete exposition, usable as a node_exporter textfile.
+    """
+    currency = {"currency": cost_report.currency}
+    nodes = [
+        ({"node": power.node.name, "kind": power.node.kind}, power, cost)
+        for power, cost in zip(power_report.per_node, cost_report.per_node, strict=True)
+    ]
+    yield from metric_family(
+        "node_power_watts",
+        "Estimated power draw per node.",
+        [(labels, power.watts) for labels, power, _ in nodes],
+    )
+    yield from metric_family(
+        "node_energy_kwh_month",
+        "Estimated monthly energy per node.",
+        [(labels, cost.kwh_month) for labels, _, cost in nodes],
+    )
+    yield from metric_family(
+        "node_monthly_cost",
+        "Estimated monthly electricity cost per node.",
+        [({**labels, **currency}, cost.monthly_cost) for labels, _, cost in nodes],
+    )
+    yield from metric_family(
+        "total_power_watts", "Estimated total power draw.", [({}, power_report.total_watts)]
+    )
+    yield from metric_family(
+        "total_monthly_cost",
+        "Estimated total monthly electricity cost.",
+        [(currency, cost_report.total_monthly_cost)],
+    )
+    if plan is not None:
+        powered_down = set(plan.powered_down_nodes)
+        yield from metric_family(
+            "node_power_down_candidate",
+            "1 if the consolidation plan powers the node down.",
+            [(labels, float(labels["node"] in powered_down)) for labels, _, _ in nodes],
+        )
+        yield from metric_family(
+            "plan_moves", "Workload moves in the consolidation plan.", [({}, len(plan.moves))]
+        )
+        yield from metric_family(
+            "plan_watts_saved",
+            "Projected power saved by the consolidation plan.",
+            [({}, plan.estimated_watts_saved)],
+        )
+        yield from metric_family(
+            "plan_monthly_savings",
+            "Projected monthly savings of the consolidation plan.",
+            [(currency, plan.estimated_monthly_savings)],
+        )
+        if plan.optimality_gap is not None:
+            yield from metric_family(
+                "plan_optimality_gap",
+                "Relative gap to the optimum when the solver ran out of time.",
+                [({}, plan.optimality_gap)],
+            )
+    yield ""
+
+
+def metric_family(
+    name: str, help_text: str, samples: Iterable[Sample], metric_type: str = "gauge"
+) -> Iterator[str]:
+    """``# HELP``/``# TYPE`` header and sample lines for ``METRIC_PREFIX``-prefixed ``name``."""
+    full_name = f"{METRIC_PREFIX}_{name}"
+    yield f"# HELP {full_name} {help_text}"
+    yield f"# TYPE {full_name} {metric_type}"
+    for labels, value in samples:
+        yield f"{full_name}{_format_labels(labels)} {_format_value(value)}"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
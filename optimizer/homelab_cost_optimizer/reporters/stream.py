@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from itertools import islice
+from pathlib import Path
+from typing import Iterable
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+_BATCH_LINES = 1024
+
+
+def write_lines(lines: Iterable[str], path: Path, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+    """Write ``lines`` separated by newlines as they are produced.
+
+    The file matches ``path.write_text("\\n".join(lines))`` byte for byte, without holding the
+    joined report in memory.
+    """
+    iterator = iter(lines)
+    with path.open("w", buffering=buffer_size) as handle:
+        batch = list(islice(iterator, _BATCH_LINES))
+        while batch:
+            handle.write("\n".join(batch))
+            batch = list(islice(iterator, _BATCH_LINES))
+            if batch:
+                handle.write("\n")
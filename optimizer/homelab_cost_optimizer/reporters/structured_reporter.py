@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+from ..estimators.cost_estimator import CostReport
+from ..estimators.power_estimator import PowerReport
+from ..models import ConsolidationPlan
+from .stream import DEFAULT_BUFFER_SIZE
+
+Row = Dict[str, Any]
+
+# Every row has a "record" of "node" or "move" and a subset of these columns; CSV and Parquet
+# leave the others empty so one file holds both record types with a stable schema.
+REPORT_FIELDS = (
+    "record",
+    "node",
+    "kind",
+    "watts",
+    "kwh_month",
+    "monthly_cost",
+    "currency",
+    "powered_down",
+    "workload",
+    "workload_type",
+    "vcpus",
+    "memory_gb",
+    "source_node",
+    "target_node",
+)
+PARQUET_BATCH_ROWS = 64 * 1024
+
+
+def iter_report_rows(
+    power_report: PowerReport, cost_report: CostReport, plan: ConsolidationPlan | None
+) -> Iterator[Row]:
+    """One row per node with its power and cost, then one row per suggested move."""
+    powered_down = set(plan.powered_down_nodes) if plan else set()
+    for power_entry, cost_entry in zip(power_report.per_node, cost_report.per_node, strict=True):
+        yield {
+            "record": "node",
+            "node": power_entry.node.name,
+            "kind": power_entry.node.kind,
+            "watts": power_entry.watts,
+            "kwh_month": cost_entry.kwh_month,
+            "monthly_cost": cost_entry.monthly_cost,
+            "currency": cost_report.currency,
+            "powered_down": power_entry.node.name in powered_down,
+        }
+    for move in plan.moves if plan else ():
+        yield {
+            "record": "move",
+            "workload": move.workload.name,
+            "workload_type": move.workload.workload_type,
+            "vcpus": move.workload.vcpus,
+            "memory_gb": move.workload.memory_gb,
+            "source_node": move.source_node,
+            "target_node": move.target_node,
+        }
+
+
+def write_jsonl_rows(rows: Iterable[Row], path: Path) -> None:
+    with path.open("w", buffering=DEFAULT_BUFFER_SIZE) as handle:
+        for row in rows:
+            handle.write(json.dumps(row) + "\n")
+
+
+def write_csv_rows(rows: Iterable[Row], path: Path) -> None:
+    with path.open("w", newline="", buffering=DEFAULT_BUFFER_SIZE) as handle:
+        writer = csv.DictWriter(handle, fieldnames=REPORT_FIELDS, restval="")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_parquet_rows(rows: Iterable[Row], path: Path) -> None:
+    """Write row groups of ``PARQUET_BATCH_ROWS``; needs the optional ``pyarrow`` package."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet output requires pyarrow (pip install homelab-cost-optimizer[parquet])"
+        ) from exc
+
+    numeric = ("watts", "kwh_month", "monthly_cost", "vcpus", "memory_gb")
+    types = {**dict.fromkeys(numeric, pa.float64()), "powered_down": pa.bool_()}
+    schema = pa.schema([(name, types.get(name, pa.string())) for name in REPORT_FIELDS])
+    iterator = iter(rows)
+    with pq.ParquetWriter(path, schema) as writer:
+        while batch := list(islice(iterator, PARQUET_BATCH_ROWS)):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+
+
+STRUCTURED_WRITERS: Dict[str, Callable[[Iterable[Row], Path], None]] = {
+    "jsonl": write_jsonl_rows,
+    "csv": write_csv_rows,
+    "parquet": write_parquet_rows,
+}
+
+
+def write_structured_report(
+    report_format: str,
+    power_report: PowerReport,
+    cost_report: CostReport,
+    plan: ConsolidationPlan | None,
+    path: Path,
+) -> None:
+    report_format = report_format.lower()
+    if report_format not in STRUCTURED_WRITERS:
+        raise KeyError(
+            f"Unsupported report format '{report_format}'. "
+            f"Available: {', '.join(STRUCTURED_WRITERS)}"
+        )
+    STRUCTURED_WRITERS[report_format](iter_report_rows(power_report, cost_report, plan), path)
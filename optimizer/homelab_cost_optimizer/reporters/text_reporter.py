@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator
 
 from ..estimators.cost_estimator import CostReport
 from ..estimators.power_estimator import PowerReport
@@ -13,33 +13,41 @@ def generate_text_report(
     cost_report: CostReport,
     plan: ConsolidationPlan | None,
 ) -> str:
-    lines: List[str] = []
-    lines.append("Homelab Cost Optimizer Report")
-    lines.append("================================")
-    lines.append(f"Nodes analyzed: {len(inventory.nodes)}")
-    lines.append(f"Workloads analyzed: {len(inventory.workloads)}")
-    lines.append("")
-    lines.append(f"Total power draw: {power_report.total_watts} W")
-    lines.append(f"Monthly cost: {cost_report.total_monthly_cost} {cost_report.currency}")
-    lines.append("")
-    lines.append("Per-node breakdown:")
+    return "\n".join(iter_text_report(inventory, power_report, cost_report, plan))
+
+
+def iter_text_report(
+    inventory: Inventory,
+    power_report: PowerReport,
+    cost_report: CostReport,
+    plan: ConsolidationPlan | None,
+) -> Iterator[str]:
+    """Lines of :func:`generate_text_report`, produced one at a time."""
+    yield "Homelab Cost Optimizer Report"
+    yield "================================"
+    yield f"Nodes analyzed: {len(inventory.nodes)}"
+    yield f"Workloads analyzed: {len(inventory.workloads)}"
+    yield ""
+    yield f"Total power draw: {power_report.total_watts} W"
+    yield f"Monthly cost: {cost_report.total_monthly_cost} {cost_report.currency}"
+    yield ""
+    yield "Per-node breakdown:"
     for power_entry, cost_entry in zip(power_report.per_node, cost_report.per_node, strict=True):
-        lines.append(
+        yield (
             f"- {power_entry.node.name}: {power_entry.watts} W / {cost_entry.monthly_cost} {cost_report.currency}/month"
         )
-    lines.append("")
+    yield ""
     if plan:
-        lines.append("Consolidation scenario:")
-        lines.append(f"- Nodes to power down: {', '.join(plan.powered_down_nodes) or 'none'}")
-        lines.append(
+        yield "Consolidation scenario:"
+        yield f"- Nodes to power down: {', '.join(plan.powered_down_nodes) or 'none'}"
+        yield (
             f"- Estimated savings: {plan.estimated_watts_saved} W (~{plan.estimated_monthly_savings} {cost_report.currency}/month)"
         )
         if plan.moves:
-            lines.append("Suggested moves:")
+            yield "Suggested moves:"
             for move in plan.moves:
-                lines.append(f"  * {move.workload.name}: {move.source_node} -> {move.target_node}")
+                yield f"  * {move.workload.name}: {move.source_node} -> {move.target_node}"
         if plan.notes:
-            lines.append(f"Note: {plan.notes}")
+            yield f"Note: {plan.notes}"
     else:
-        lines.append("No consolidation scenario calculated in this run.")
-    return "\n".join(lines)
+        yield "No consolidation scenario calculated in this run."
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import json
+import socketserver
+import stat
+import threading
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from .config import ElectricityConfig, ScenarioConfig
+from .consolidators import create_consolidator
+from .delta import diff_inventories
+from .estimators.cost_estimator import CostReport, estimate_cost, update_cost_report
+from .estimators.power_estimator import PowerReport, build_power_report, update_power_report
+from .frame import InventoryFrame, as_inventory
+from .inventory_io import load_inventory
+from .models import ConsolidationPlan, Inventory
+from .profiling import phase
+from .reporters.prometheus_reporter import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .reporters.prometheus_reporter import iter_prometheus_metrics, metric_family
+from .reporters.structured_reporter import iter_report_rows
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+JSON_CONTENT_TYPE = "application/json"
+
+# Returns the current inventory, or None when it is known not to have changed since the last call.
+InventorySource = Callable[[], Optional[Inventory | InventoryFrame]]
+
+
+@dataclass
+class ServiceState:
+    """One refresh's inventory, reports and plan with their JSON responses rendered up front."""
+
+    inventory: Inventory
+    power_report: PowerReport
+    cost_report: CostReport
+    plan: Optional[ConsolidationPlan]
+    generation: int
+    refreshed_at: float
+    # request path -> (content type, body)
+    responses: Dict[str, Tuple[str, bytes]] = field(default_factory=dict)
+
+
+class OptimizerService:
+    """Electricity and scenario settings plus the latest analysis, kept in memory between polls.
+
+    Each refresh diffs the new inventory against the previous one, re-estimates power and cost only
+    for the nodes the difference touches and rebuilds the plan only when something changed. Queries read
+    the current :class:`ServiceState`, which is replaced whole, so they never wait on a refresh.
+    """
+
+    def __init__(
+        self,
+        source: InventorySource,
+        electricity: ElectricityConfig,
+        scenario: Optional[ScenarioConfig] = None,
+    ) -> None:
+        self.source = source
+        self.electricity = electricity
+        self.scenario = scenario
+        self.state: Optional[ServiceState] = None
+        self.last_error: Optional[str] = None
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self) -> bool:
+        """Collect once and update the state; returns whether the inventory changed."""
+        with self._refresh_lock:
+            with phase("collect"):
+                collected = self.source()
+            if collected is None:
+                return False
+            inventory = as_inventory(collected)
+            previous = self.state
+            if previous is None:
+                with phase("power"):
+                    power_report = build_power_report(inventory)
+                with phase("cost"):
+                    cost_report = estimate_cost(power_report, self.electricity)
+            else:
+                with phase("diff_inventories"):
+                    delta = diff_inventories(previous.inventory, inventory, digest=False)
+                if delta.is_empty():
+                    return False
+                with phase("power"):
+                    power_report = update_power_report(
+                        previous.power_report, inventory, delta.touched_nodes()
+                    )
+                with phase("cost"):
+                    cost_report = update_cost_report(
+                        previous.cost_report, power_report, self.electricity, delta.touched_nodes()
+                    )
+            plan = None
+            if self.scenario is not None:
+                with phase("plan"):
+                    consolidator = create_consolidator(self.scenario, self.electricity)
+                    plan = consolidator.build_plan(inventory)
+            with phase("render"):
+                self.state = _render_state(
+                    inventory,
+                    power_report,
+                    cost_report,
+                    plan,
+                    generation=previous.generation + 1 if previous else 1,
+                )
+            return True
+
+    def refresh_safely(self) -> bool:
+        """:meth:`refresh`, recording the outcome in ``last_error`` before returning or raising.
+
+        A failed refresh keeps serving the previous state and is reported through ``/health``.
+        """
+        try:
+            changed = self.refresh()
+        except Exception as exc:
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            raise
+        self.last_error = None
+        return changed
+
+    def run_periodically(self, interval_seconds: float, stop: threading.Event) -> None:
+        """Refresh every ``interval_seconds`` until ``stop`` is set."""
+        while not stop.wait(interval_seconds):
+            try:
+                self.refresh_safely()
+            except Exception:  # the daemon outlives unreachable hosts and bad snapshots
+                pass
+
+    def health(self) -> Dict[str, Any]:
+        state = self.state
+        return {
+            "status": "ok" if state is not None and self.last_error is None else "degraded",
+            "generation": state.generation if state else 0,
+            "refreshed_at": state.refreshed_at if state else None,
+            "last_error": self.last_error,
+        }
+
+
+def file_source(path: Path) -> InventorySource:
+    """Reload the inventory at ``path`` whenever its modification time changes."""
+    last_modified: Optional[int] = None
+
+    def load() -> Optional[Inventory | InventoryFrame]:
+        nonlocal last_modified
+        modified = path.stat().st_mtime_ns
+        if modified == last_modified:
+            return None
+        inventory = load_inventory(path)
+        last_modified = modified
+        return inventory
+
+    return load
+
+
+def _render_state(
+    inventory: Inventory,
+    power_report: PowerReport,
+    cost_report: CostReport,
+    plan: Optional[ConsolidationPlan],
+    generation: int,
+) -> ServiceState:
+    refreshed_at = time.time()
+    rows = list(iter_report_rows(power_report, cost_report, plan))
+    node_rows = {row["node"]: row for row in rows if row["record"] == "node"}
+    plan_data = None
+    if plan is not None:
+        plan_data = {
+            "powered_down_nodes": plan.powered_down_nodes,
+            "estimated_watts_saved": plan.estimated_watts_saved,
+            "estimated_monthly_savings": plan.estimated_monthly_savings,
+            "notes": plan.notes,
+            "optimality_gap": plan.optimality_gap,
+            "moves": [row for row in rows if row["record"] == "move"],
+        }
+    summary = {
+        "generation": generation,
+        "refreshed_at": refreshed_at,
+        "nodes": len(inventory.nodes),
+        "workloads": len(inventory.workloads),
+        "total_watts": power_report.total_watts,
+        "monthly_cost": cost_report.total_monthly_cost,
+        "currency": cost_report.currency,
+        "powered_down_nodes": len(plan.powered_down_nodes) if plan else None,
+        "estimated_monthly_savings": plan.estimated_monthly_savings if plan else None,
+    }
+    return ServiceState(
+        inventory=inventory,
+        power_report=power_report,
+        cost_report=cost_report,
+        plan=plan,
+        generation=generation,
+        refreshed_at=refreshed_at,
+        responses={
+            "/summary": _json(summary),
+            "/nodes": _json(list(node_rows.values())),
+            "/plan": _json(plan_data),
+            **{f"/nodes/{name}": _json(row) for name, row in node_rows.items()},
+            "/metrics": (METRICS_CONTENT_TYPE, _metrics(power_report, cost_report, plan, summary)),
+        },
+    )
+
+
+def _json(value: Any) -> Tuple[str, bytes]:
+    return JSON_CONTENT_TYPE, json.dumps(value).encode()
+
+
+def _metrics(
+    power_report: PowerReport,
+    cost_report: CostReport,
+    plan: Optional[ConsolidationPlan],
+    summary: Dict[str, Any],
+) -> bytes:
+    service_lines = [
+        *metric_family(
+            "refresh_generation",
+            "Number of refreshes that changed the inventory.",
+            [({}, summary["generation"])],
+        ),
+        *metric_family(
+            "last_refresh_timestamp_seconds",
+            "Unix time of the last refresh that changed the inventory.",
+            [({}, summary["refreshed_at"])],
+        ),
+    ]
+    lines = [*service_lines, *iter_prometheus_metrics(power_report, cost_report, plan)]
+    return "\n".join(lines).encode()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server_version = "homelab-cost-optimizer"
+
+    def do_GET(self) -> None:
+        service: OptimizerService = self.server.service  # type: ignore[attr-defined]
+        path = unquote(urlsplit(self.path).path).rstrip("/")
+        if path == "/health":
+            self._send(HTTPStatus.OK, *_json(service.health()))
+            return
+        state = service.state
+        if state is None:
+            self._send(HTTPStatus.SERVICE_UNAVAILABLE, *_json({"error": "no inventory yet"}))
+        elif path in state.responses:
+            self._send(HTTPStatus.OK, *state.responses[path])
+        else:
+            self._send(HTTPStatus.NOT_FOUND, *_json({"error": f"no resource at {path}"}))
+
+    def do_POST(self) -> None:
+        service: OptimizerService = self.server.service  # type: ignore[attr-defined]
+        if urlsplit(self.path).path.rstrip("/") != "/refresh":
+            self._send(HTTPStatus.NOT_FOUND, *_json({"error": f"no resource at {self.path}"}))
+            return
+        try:
+            changed = service.refresh_safely()
+        except Exception:
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, *_json({"error": service.last_error}))
+            return
+        state = service.state
+        body = {"changed": changed, "generation": state.generation if state else 0}
+        self._send(HTTPStatus.OK, *_json(body))
+
+    def _send(self, status: HTTPStatus, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(
+    service: OptimizerService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[Path] = None,
+) -> socketserver.BaseServer:
+    """HTTP server for ``service`` on ``host``:``port``, or on a Unix socket at ``socket_path``.
+
+    A stale socket file left by a previous run is replaced.
+    """
+    if socket_path is not None:
+        if socket_path.exists() and stat.S_ISSOCK(socket_path.stat().st_mode):
+            socket_path.unlink()
+        server: socketserver.BaseServer = UnixHTTPServer(str(socket_path), _RequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _RequestHandler)
+    server.service = service  # type: ignore[attr-defined]
+    return server
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence
+
+from .config import ElectricityConfig, ScenarioConfig
+from .consolidators import create_consolidator
+from .frame import InventoryFrame
+from .models import Inventory
+
+SWEEP_PARAMETERS = ("cpu_threshold", "ram_threshold", "max_node_utilization")
+
+_worker_state: Dict[str, object] = {}
+
+
+@dataclass
+class SweepResult:
+    scenario: ScenarioConfig
+    powered_down: int
+    moves: int
+    estimated_watts_saved: float
+    estimated_monthly_savings: float
+    headroom: float
+
+    def dominates(self, other: "SweepResult") -> bool:
+        """Better or equal on savings, moves and headroom, and strictly better on one."""
+        mine = (self.estimated_monthly_savings, -self.moves, self.headroom)
+        theirs = (other.estimated_monthly_savings, -other.moves, other.headroom)
+        return all(a >= b for a, b in zip(mine, theirs, strict=True)) and mine != theirs
+
+
+def scenario_grid(base: ScenarioConfig, **values: Sequence[float]) -> List[ScenarioConfig]:
+    """Cartesian product of parameter values applied to ``base``; empty axes keep the base value."""
+    unknown = set(values) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameter(s): {', '.join(sorted(unknown))}")
+    axes = [(name, list(values[name])) for name in SWEEP_PARAMETERS if values.get(name)]
+    scenarios = []
+    for combination in itertools.product(*(axis for _, axis in axes)):
+        changes = dict(zip((name for name, _ in axes), combination, strict=True))
+        label = ",".join(f"{name}={value:g}" for name, value in changes.items())
+        scenarios.append(
+            replace(base, name=f"{base.name}[{label}]" if label else base.name, **changes)
+        )
+    return scenarios
+
+
+def run_sweep(
+    inventory: Inventory | InventoryFrame,
+    electricity: ElectricityConfig,
+    scenarios: Sequence[ScenarioConfig],
+    max_workers: Optional[int] = None,
+) -> List[SweepResult]:
+    """Plan every scenario, in worker processes when there is more than one to run.
+
+    The inventory is handed to each worker once, through the pool initializer, rather than with
+    every task; on fork-based platforms the workers share the parent's copy without pickling.
+    """
+    if max_workers == 1 or len(scenarios) <= 1:
+        _init_worker(inventory, electricity)
+        try:
+            return [_evaluate(scenario) for scenario in scenarios]
+        finally:
+            _worker_state.clear()
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(inventory, electricity)
+    ) as pool:
+        return list(pool.map(_evaluate, scenarios))
+
+
+def pareto_front(results: Sequence[SweepResult]) -> List[SweepResult]:
+    """Results not dominated by any other, highest savings first."""
+    return rank_results([r for r in results if not any(other.dominates(r) for other in results)])
+
+
+def rank_results(results: Sequence[SweepResult]) -> List[SweepResult]:
+    """Highest savings first, then fewest moves, then most headroom."""
+    return sorted(results, key=lambda r: (-r.estimated_monthly_savings, r.moves, -r.headroom))
+
+
+def _init_worker(inventory: Inventory | InventoryFrame, electricity: ElectricityConfig) -> None:
+    _worker_state["inventory"] = inventory
+    _worker_state["electricity"] = electricity
+
+
+def _evaluate(scenario: ScenarioConfig) -> SweepResult:
+    inventory = _worker_state["inventory"]
+    consolidator = create_consolidator(scenario, _worker_state["electricity"])
+    plan = consolidator.build_plan(inventory)
+    return SweepResult(
+        scenario=scenario,
+        powered_down=len(plan.powered_down_nodes),
+        moves=len(plan.moves),
+        estimated_watts_saved=plan.estimated_watts_saved,
+        estimated_monthly_savings=plan.estimated_monthly_savings,
+        headroom=consolidator.remaining_headroom(inventory, plan),
+    )
@@ -0,0 +1,27 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Usage: scripts/benchmark.sh [--save] [pytest args...]
+#   --save  record the run as this machine's baseline
+# Without --save the run is compared with the latest baseline and fails when any benchmark's
+# fastest round regresses by more than BENCHMARK_THRESHOLD (default 25%). Set BENCHMARK_MAX_WORKLOADS
+# (default 10000) to include the larger synthetic inventories, up to 1000000 workloads.
+
+ROOT=$(cd "$(dirname "$0")/.." && pwd)
+cd "$ROOT"
+
+STORAGE="file://benchmarks/baselines"
+# Garbage collection pauses depend on what earlier benchmarks left alive; keep it out of timings.
+OPTIONS=(--benchmark-storage="$STORAGE" --benchmark-disable-gc --benchmark-warmup=on)
+THRESHOLD="${BENCHMARK_THRESHOLD:-25%}"
+
+if [[ "${1:-}" == "--save" ]]; then
+  shift
+  pytest benchmarks "${OPTIONS[@]}" --benchmark-save=baseline "$@"
+elif compgen -G "benchmarks/baselines/*/*_baseline.json" >/dev/null; then
+  pytest benchmarks "${OPTIONS[@]}" --benchmark-compare \
+    --benchmark-compare-fail="min:$THRESHOLD" "$@"
+else
+  echo "no saved baseline; run scripts/benchmark.sh --save first" >&2
+  pytest benchmarks "${OPTIONS[@]}" "$@"
+fi
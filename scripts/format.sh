@@ -4,8 +4,8 @@ set -euo pipefail
 ROOT=$(cd "$(dirname "$0")/.." && pwd)
 cd "$ROOT"
 
-black optimizer ai_providers tests
-isort optimizer ai_providers tests
+black optimizer ai_providers tests benchmarks
+isort optimizer ai_providers tests benchmarks
 
 if command -v terraform >/dev/null 2>&1; then
   terraform fmt -recursive blueprints/terraform
@@ -5,8 +5,8 @@ ROOT=$(cd "$(dirname "$0")/.." && pwd)
 cd "$ROOT"
 
 ruff check .
-black --check optimizer ai_providers tests
-isort --check-only optimizer ai_providers tests
+black --check optimizer ai_providers tests benchmarks
+isort --check-only optimizer ai_providers tests benchmarks
 
 if command -v yamllint >/dev/null 2>&1; then
   yamllint .
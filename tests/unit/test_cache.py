@@ -0,0 +1,101 @@
+import os
+
+from homelab_cost_optimizer import cache as cache_module
+from homelab_cost_optimizer.cache import (
+    ENTRY_SUFFIX,
+    ResultCache,
+    cache_key,
+    reports_from_dict,
+    reports_to_dict,
+)
+from homelab_cost_optimizer.config import ElectricityConfig
+from homelab_cost_optimizer.estimators.cost_estimator import estimate_cost
+from homelab_cost_optimizer.estimators.power_estimator import build_power_report
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
+
+
+def _inventory() -> Inventory:
+    profile = PowerProfile(
+        name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+    )
+    node = Node(
+        name="node1", kind="hypervisor", total_cpu=8, total_memory_gb=32, power_profile=profile
+    )
+    workload = Workload(
+        name="vm1",
+        workload_type="vm",
+        vcpus=2,
+        memory_gb=2,
+        utilization_cpu=0.3,
+        utilization_memory=0.3,
+        node="node1",
+    )
+    return Inventory(nodes=[node], workloads=[workload])
+
+
+def _keys(directory) -> list:
+    return [path.name.removesuffix(ENTRY_SUFFIX) for path in directory.glob(f"*{ENTRY_SUFFIX}")]
+
+
+def test_cache_key_follows_file_content_and_settings(tmp_path, monkeypatch):
+    path = tmp_path / "inventory.json"
+    path.write_text("{}")
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+    key = cache_key([path, None], [electricity])
+
+    assert cache_key([path, None], [electricity]) == key
+    assert cache_key([path, None], [ElectricityConfig("USD", 0.3)]) != key
+    assert cache_key([None, path], [electricity]) != key
+    monkeypatch.setattr(cache_module, "CACHE_SCHEMA", cache_module.CACHE_SCHEMA + 1)
+    assert cache_key([path, None], [electricity]) != key
+    monkeypatch.undo()
+    path.write_text('{"nodes": []}')
+    assert cache_key([path, None], [electricity]) != key
+
+
+def test_reports_round_trip_through_cache(tmp_path):
+    inventory = _inventory()
+    power_report = build_power_report(inventory)
+    cost_report = estimate_cost(power_report, ElectricityConfig("USD", 0.2))
+    cache = ResultCache(tmp_path / "cache")
+    cache.put("abc", reports_to_dict(power_report, cost_report))
+
+    assert reports_from_dict(cache.get("abc"), inventory.nodes) == (power_report, cost_report)
+    assert cache.get("missing") is None
+    (tmp_path / "cache" / f"abc{ENTRY_SUFFIX}").write_text("{truncated")
+    assert cache.get("abc") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, max_entries=3)
+    for age, key in enumerate(["old", "used", "new"]):
+        cache.put(key, {"value": key})
+        os.utime(tmp_path / f"{key}{ENTRY_SUFFIX}", ns=(age * 10**9, age * 10**9))
+    cache.get("old")  # refreshes "old", so "used" is now the stalest entry
+    cache.put("newest", {"value": "newest"})
+
+    assert sorted(_keys(tmp_path)) == ["new", "newest", "old"]
+
+    small = ResultCache(tmp_path / "small", max_bytes=40)
+    small.put("a", {"value": "x" * 20})
+    small.put("b", {"value": "y" * 20})
+    assert _keys(tmp_path / "small") == ["b"]
+
+
+def test_cache_leaves_foreign_files_alone(tmp_path):
+    inventory = tmp_path / "inventory.json"
+    inventory.write_text('{"nodes": []}')
+    notes = tmp_path / "notes.json"
+    notes.write_text("{not json")
+    os.utime(inventory, ns=(0, 0))
+    os.utime(notes, ns=(0, 0))
+    cache = ResultCache(tmp_path, max_entries=1, max_bytes=1)
+    cache.put("a", {"value": 1})
+    cache.put("b", {"value": 2})
+    (tmp_path / f"b{ENTRY_SUFFIX}").write_text("{truncated")
+
+    assert cache.get("b") is None
+    assert cache.get("notes") is None
+    assert _keys(tmp_path) == []
+    assert inventory.read_text() == '{"nodes": []}'
+    assert notes.read_text() == "{not json"
@@ -95,3 +95,377 @@ def test_suggest_command(tmp_path):
     )
     assert result.exit_code == 0
     assert output.exists()
+
+
+def test_analyze_accepts_jsonl_inventory(tmp_path):
+    from homelab_cost_optimizer.inventory_io import save_inventory
+
+    _, electricity, optimizer = _write_files(tmp_path)
+    inventory_file = tmp_path / "inventory.jsonl"
+    save_inventory(_inventory(), inventory_file)
+    output = tmp_path / "report.md"
+    result = runner.invoke(
+        app,
+        [
+            "analyze",
+            "--input",
+            str(inventory_file),
+            "--electricity-config",
+            str(electricity),
+            "--optimizer-config",
+            str(optimizer),
+            "--scenario",
+            "consolidate-low-util",
+            "--report-format",
+            "markdown",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0
+    assert "**Nodes**: 1 | **Workloads**: 1" in output.read_text()
+
+
+def test_analyze_writes_csv_rows(tmp_path):
+    inventory_file, electricity, optimizer = _write_files(tmp_path)
+    output = tmp_path / "report.csv"
+    result = runner.invoke(
+        app,
+        [
+            "analyze",
+            "--input",
+            str(inventory_file),
+            "--electricity-config",
+            str(electricity),
+            "--optimizer-config",
+            str(optimizer),
+            "--report-format",
+            "CSV",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0
+    lines = output.read_text().splitlines()
+    assert lines[0].startswith("record,node,kind,watts,")
+    assert lines[1].startswith("node,node1,hypervisor,")
+
+
+def test_convert_command(tmp_path):
+    from homelab_cost_optimizer.inventory_io import load_inventory
+
+    inventory_file, _, _ = _write_files(tmp_path)
+    output = tmp_path / "inventory.hcoi"
+    result = runner.invoke(
+        app, ["convert", "--input", str(inventory_file), "--output", str(output)]
+    )
+    assert result.exit_code == 0
+    assert load_inventory(output).to_inventory() == _inventory()
+
+
+def test_collect_requires_a_source(tmp_path):
+    _, _, optimizer = _write_files(tmp_path)
+    result = runner.invoke(
+        app,
+        ["collect", "--output", str(tmp_path / "out.json"), "--optimizer-config", str(optimizer)],
+    )
+    assert result.exit_code != 0
+
+
+def test_collect_delta_round_trip(tmp_path, monkeypatch):
+    from homelab_cost_optimizer.collectors.docker_collector import DockerCollector
+
+    inventory_file, electricity, optimizer = _write_files(tmp_path)
+    current = _inventory()
+    current.workloads[0].utilization_cpu = 0.9
+    monkeypatch.setattr(DockerCollector, "collect", lambda self: current)
+    delta_file = tmp_path / "delta.json"
+    result = runner.invoke(
+        app,
+        [
+            "collect",
+            "--source",
+            "docker",
+            "--output",
+            str(delta_file),
+            "--delta-from",
+            str(inventory_file),
+            "--optimizer-config",
+            str(optimizer),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(delta_file.read_text())["changed_workloads"][0]["utilization_cpu"] == 0.9
+
+    output = tmp_path / "report.txt"
+    result = runner.invoke(
+        app,
+        [
+            "analyze",
+            "--input",
+            str(inventory_file),
+            "--delta",
+            str(delta_file),
+            "--electricity-config",
+            str(electricity),
+            "--optimizer-config",
+            str(optimizer),
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert output.exists()
+
+
+def test_sweep_command(tmp_path):
+    inventory_file, electricity, optimizer = _write_files(tmp_path)
+    output = tmp_path / "sweep.md"
+    result = runner.invoke(
+        app,
+        [
+            "sweep",
+            "--input",
+            str(inventory_file),
+            "--electricity-config",
+            str(electricity),
+            "--optimizer-config",
+            str(optimizer),
+            "--max-node-utilization",
+            "0.6",
+            "--max-node-utilization",
+            "0.9",
+            "--workers",
+            "1",
+            "--all",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert len(output.read_text().splitlines()) == 2 + 2 + 2
+
+
+def test_analyze_reuses_cached_reports(tmp_path, monkeypatch):
+    from homelab_cost_optimizer.estimators import power_estimator
+
+    inventory_file, electricity, optimizer = _write_files(tmp_path)
+    args = [
+        "analyze",
+        "--input",
+        str(inventory_file),
+        "--electricity-config",
+        str(electricity),
+        "--optimizer-config",
+        str(optimizer),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    first = tmp_path / "first.txt"
+    assert runner.invoke(app, args + ["--output", str(first)]).exit_code == 0
+
+    def fail(inventory):
+        raise AssertionError("power report should come from the cache")
+
+    monkeypatch.setattr(power_estimator, "build_power_report", fail)
+    second = tmp_path / "second.txt"
+    result = runner.invoke(app, args + ["--output", str(second)])
+    assert result.exit_code == 0, result.output
+    assert second.read_text() == first.read_text()
+
+
+def test_analyze_delta_updates_cached_base_reports(tmp_path, monkeypatch):
+    from dataclasses import replace
+
+    from homelab_cost_optimizer import delta as delta_module
+    from homelab_cost_optimizer.cache import file_digest
+    from homelab_cost_optimizer.estimators import power_estimator
+
+    inventory_file, electricity, optimizer = _write_files(tmp_path)
+    base = _inventory()
+    current = Inventory(
+        nodes=[*base.nodes, replace(base.nodes[0], name="node2")],
+        workloads=[*base.workloads, replace(base.workloads[0], name="vm2", node="node2")],
+    )
+    current_file = tmp_path / "current.json"
+    current_file.write_text(json.dumps(current.to_dict()))
+    delta = delta_module.diff_inventories(base, current)
+    delta.base_file_digest = file_digest(inventory_file)
+    delta_file = tmp_path / "delta.json"
+    delta_module.save_delta(delta, delta_file)
+
+    def analyze(input: Path, output: Path, *extra: str):
+        args = ["analyze", "--input", str(input), "--output", str(output)]
+        args += ["--electricity-config", str(electricity), "--optimizer-config", str(optimizer)]
+        args += ["--report-format", "jsonl", "--cache-dir", str(tmp_path / "cache"), *extra]
+        return runner.invoke(app, args)
+
+    expected = tmp_path / "expected.jsonl"
+    assert analyze(current_file, expected).exit_code == 0
+    assert analyze(inventory_file, tmp_path / "base.jsonl").exit_code == 0
+
+    estimated = []
+    build_power_report = power_estimator.build_power_report
+
+    def record(inventory):
+        estimated.extend(node.name for node in inventory.nodes)
+        return build_power_report(inventory)
+
+    def fail(inventory):
+        raise AssertionError("the base file digest should be checked instead")
+
+    monkeypatch.setattr(power_estimator, "build_power_report", record)
+    monkeypatch.setattr(delta_module, "inventory_digest", fail)
+    output = tmp_path / "delta.jsonl"
+    result = analyze(inventory_file, output, "--delta", str(delta_file))
+    assert result.exit_code == 0, result.output
+    assert estimated == ["node2"]
+    assert output.read_text() == expected.read_text()
+
+    inventory_file.write_text(json.dumps(current.to_dict()))
+    result = analyze(inventory_file, output, "--delta", str(delta_file))
+    assert isinstance(result.exception, ValueError)
+
+
+def test_analyze_writes_timings_and_profile(tmp_path):
+    import pstats
+
+    inventory_file, electricity, optimizer = _write_files(tmp_path)
+    timings = tmp_path / "timings.json"
+    profile = tmp_path / "analyze.prof"
+    result = runner.invoke(
+        app,
+        [
+            "--timings",
+            str(timings),
+            "--trace-memory",
+            "--profile",
+            str(profile),
+            "analyze",
+            "--input",
+            str(inventory_file),
+            "--electricity-config",
+            str(electricity),
+            "--optimizer-config",
+            str(optimizer),
+            "--scenario",
+            "consolidate-low-util",
+            "--output",
+            str(tmp_path / "report.txt"),
+        ],
+    )
+    assert result.exit_code == 0, result.stdout
+    summary = json.loads(timings.read_text())
+    phases = {entry["name"]: entry for entry in summary["phases"]}
+    assert summary["command"] == "analyze"
+    assert list(phases) == [
+        "load_inventory",
+        "load_config",
+        "power",
+        "cost",
+        "plan",
+        "render",
+    ]
+    assert all(entry["calls"] == 1 and entry["peak_memory_bytes"] > 0 for entry in phases.values())
+    assert summary["total_seconds"] >= sum(entry["wall_seconds"] for entry in phases.values())
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+def test_cli_defers_heavy_imports():
+    import os
+    import subprocess
+    import sys
+
+    root = Path(__file__).resolve().parents[2]
+    code = (
+        "import sys\n"
+        "from homelab_cost_optimizer import cli\n"
+        "imported = set(sys.modules)\n"
+        "from homelab_cost_optimizer.collectors import create_collector\n"
+        "from homelab_cost_optimizer.models import PowerProfile\n"
+        "create_collector('docker', power_profile=PowerProfile('p', 1, 1, 1))\n"
+        "print(' '.join(sorted(imported)))\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(root / "optimizer"), str(root)])}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    at_import, after_docker = (set(line.split()) for line in result.stdout.splitlines())
+    heavy = {"numpy", "requests", "yaml", "rich", "asyncio", "openai", "ai_providers"}
+    assert not at_import & heavy
+    assert not after_docker & {"requests", "asyncio", "openai", "ai_providers"}
+
+
+def test_docker_collect_to_json_does_not_import_numpy(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    root = Path(__file__).resolve().parents[2]
+    _, _, optimizer = _write_files(tmp_path)
+    output = tmp_path / "collected.json"
+    code = (
+        "import sys\n"
+        "from homelab_cost_optimizer.cli import app\n"
+        "from homelab_cost_optimizer.collectors.docker_collector import DockerCollector\n"
+        "DockerCollector._run_command = lambda self, args: 'abc,12.5%,512MiB / 2GiB\\n'\n"
+        f"app(['collect', '--source', 'docker', '--output', {str(output)!r},"
+        f" '--optimizer-config', {str(optimizer)!r}], standalone_mode=False)\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(root / "optimizer"), str(root)])}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    modules = set(result.stdout.splitlines()[-1].split())
+    assert "numpy" not in modules
+    assert json.loads(output.read_text())["workloads"][0]["name"] == "abc"
+
+
+def test_serve_requires_one_inventory_source(tmp_path):
+    inventory_file, electricity, _ = _write_files(tmp_path)
+    result = runner.invoke(app, ["serve", "--electricity-config", str(electricity)])
+    assert result.exit_code != 0
+    result = runner.invoke(
+        app,
+        [
+            "serve",
+            "--electricity-config",
+            str(electricity),
+            "--input",
+            str(inventory_file),
+            "--sources-config",
+            str(inventory_file),
+        ],
+    )
+    assert result.exit_code != 0
+    assert "exactly one of --input or --sources-config" in result.output
+
+
+def test_collect_applies_power_profile_rules(tmp_path, monkeypatch):
+    from homelab_cost_optimizer.collectors.docker_collector import DockerCollector
+
+    monkeypatch.setattr(DockerCollector, "collect", lambda self: _inventory())
+    optimizer = tmp_path / "optimizer.yaml"
+    optimizer.write_text(
+        "power_profiles:\n  default: {base_idle_watts: 60}\n  small: {base_idle_watts: 15}\n"
+        "power_profile_rules:\n  - {profile: small, max_cpu: 8}\n"
+    )
+    output = tmp_path / "inventory.json"
+    result = runner.invoke(
+        app,
+        [
+            "collect",
+            "--source",
+            "docker",
+            "--output",
+            str(output),
+            "--optimizer-config",
+            str(optimizer),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    data = json.loads(output.read_text())
+    assert data["nodes"][0]["power_profile"] == "small"
+    assert data["power_profiles"]["small"]["base_idle_watts"] == 15
@@ -103,3 +103,294 @@ def test_k8s_collector_parses(monkeypatch):
     inventory = collector.collect()
     assert inventory.nodes[0].total_cpu == 2
     assert inventory.workloads[0].node == "node1"
+
+
+def test_docker_collector_targets_remote_host():
+    calls = []
+
+    def fake_runner(args):
+        calls.append(args)
+        return "container1,5.0%,128MiB / 8GiB"
+
+    collector = DockerCollector(
+        power_profile=PROFILE, docker_host="ssh://admin@docker-01", runner=fake_runner
+    )
+    collector.collect()
+    assert calls[0][:4] == ["docker", "--host", "ssh://admin@docker-01", "stats"]
+
+
+def test_collect_many_merges_sources_concurrently(monkeypatch):
+    import threading
+
+    from homelab_cost_optimizer import collectors
+    from homelab_cost_optimizer.models import Inventory, Node, Workload
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    class FakeCollector:
+        def __init__(self, power_profile, host_name, shared="shared"):
+            self.power_profile = power_profile
+            self.host_name = host_name
+            self.shared = shared
+
+        def collect(self):
+            barrier.wait()  # all three collectors must be running at the same time
+            nodes = [
+                Node(self.host_name, "docker", 4, 8, self.power_profile),
+                Node(self.shared, "nas", 4, 8, self.power_profile, {"seen_by": self.host_name}),
+            ]
+            workload = Workload(
+                f"{self.host_name}-app", "container", 1, 1, 0.1, 0.1, self.host_name
+            )
+            return Inventory(nodes=nodes, workloads=[workload])
+
+    monkeypatch.setitem(collectors.COLLECTOR_REGISTRY, "fake", FakeCollector)
+    specs = [
+        {"source": "fake", "power_profile": PROFILE, "host_name": f"host{i}"} for i in range(3)
+    ]
+    inventory = collectors.collect_many(specs)
+
+    assert [node.name for node in inventory.nodes] == ["host0", "shared", "host1", "host2"]
+    assert inventory.nodes[1].metadata == {"seen_by": "host0"}
+    assert [w.name for w in inventory.workloads] == ["host0-app", "host1-app", "host2-app"]
+
+
+def test_libvirt_collector_parallel_dominfo_keeps_order():
+    import threading
+
+    list_output = " Id Name State\n---------\n" + "".join(f" {i} vm{i} running\n" for i in range(6))
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_runner(args):
+        if "list" in args:
+            return list_output
+        with lock:
+            active.append(args[-1])
+            peak.append(len(active))
+        threading.Event().wait(0.01)
+        with lock:
+            active.remove(args[-1])
+        return f"Name: {args[-1]}\nCPU(s): 2\nMax memory: 2097152 KiB\nState: running\nCPU time: 0.0s\n"
+
+    collector = LibvirtCollector(power_profile=PROFILE, runner=fake_runner, max_workers=3)
+    inventory = collector.collect()
+    assert [w.name for w in inventory.workloads] == [f"vm{i}" for i in range(6)]
+    assert 1 < max(peak) <= 3
+
+
+def test_libvirt_collector_batched_domstats():
+    domstats_output = """Domain: 'vm1'
+  state.state=1
+  state.reason=1
+  cpu.time=7200000000000
+  balloon.current=4194304
+  balloon.maximum=4194304
+  vcpu.current=2
+  vcpu.maximum=4
+
+Domain: 'vm2'
+  state.state=5
+  state.reason=0
+  balloon.maximum=2097152
+  vcpu.maximum=1
+"""
+    calls = []
+
+    def fake_runner(args):
+        calls.append(args)
+        return domstats_output
+
+    collector = LibvirtCollector(power_profile=PROFILE, runner=fake_runner, batched=True)
+    inventory = collector.collect()
+    assert len(calls) == 1 and "domstats" in calls[0]
+    vm1, vm2 = inventory.workloads
+    assert (vm1.name, vm1.vcpus, vm1.memory_gb, vm1.uptime_hours) == ("vm1", 2, 4, 2)
+    assert vm1.labels == {"state": "running"}
+    assert (vm2.vcpus, vm2.memory_gb, vm2.labels) == (1, 2, {"state": "shut off"})
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self.payload
+
+
+def test_proxmox_collector_fans_out_node_details():
+    import requests
+
+    responses = {
+        "/api2/json/nodes": {"data": [{"node": "pve1", "maxcpu": 4}, {"node": "pve2"}]},
+        "/api2/json/cluster/resources?type=vm": {"data": []},
+        "/api2/json/nodes/pve1/status": {
+            "data": {
+                "cpuinfo": {"cpus": 16},
+                "memory": {"total": 68719476736},
+                "loadavg": ["0.50", "0.40", "0.30"],
+            }
+        },
+        "/api2/json/nodes/pve1/rrddata?timeframe=hour&cf=AVERAGE": {
+            "data": [
+                {"cpu": 0.1, "memused": 8, "memtotal": 64},
+                {"cpu": 0.3, "memused": 24, "memtotal": 64},
+                {"cpu": None},
+            ]
+        },
+    }
+
+    class FakeSession:
+        def get(self, url, timeout):
+            path = url.removeprefix("https://pve.local:8006")
+            if path not in responses:
+                raise requests.ConnectionError(f"node offline: {path}")
+            return _FakeResponse(responses[path])
+
+    collector = ProxmoxCollector(
+        base_url="https://pve.local:8006",
+        token_id="user@pam!token",
+        token_secret="secret",
+        power_profile=PROFILE,
+        fetch_node_details=True,
+        session=FakeSession(),
+    )
+    pve1, pve2 = collector.collect().nodes
+    assert (pve1.total_cpu, pve1.total_memory_gb) == (16, 64)
+    assert pve1.metadata["cpu_utilization_avg"] == 0.2
+    assert pve1.metadata["memory_utilization_avg"] == 0.25
+    assert pve1.metadata["loadavg"] == [0.5, 0.4, 0.3]
+    assert "cpu_utilization_avg" not in pve2.metadata
+
+
+def test_proxmox_session_retries_transient_errors():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.headers["Authorization"])
+            status = 503 if len(hits) < 3 else 200
+            body = json.dumps({"data": []}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        collector = ProxmoxCollector(
+            base_url=f"http://127.0.0.1:{server.server_port}",
+            token_id="user@pam!token",
+            token_secret="secret",
+            power_profile=PROFILE,
+            backoff_factor=0,
+        )
+        assert collector._get("/api2/json/nodes") == {"data": []}
+    finally:
+        server.shutdown()
+    assert hits == ["PVEAPIToken=user@pam!token=secret"] * 3
+
+
+def test_async_runner_executes_subprocess():
+    import asyncio
+    import subprocess
+    import sys
+
+    import pytest
+    from homelab_cost_optimizer.collectors.async_runners import run_command
+
+    assert asyncio.run(run_command([sys.executable, "-c", "print('ok')"])).strip() == "ok"
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(run_command([sys.executable, "-c", "raise SystemExit(3)"]))
+
+
+def test_async_collectors_use_async_runners():
+    import asyncio
+
+    in_flight = []
+    peak = []
+
+    async def fake_virsh(args):
+        if "list" in args:
+            return " Id Name State\n---\n" + "".join(f" {i} vm{i} running\n" for i in range(5))
+        in_flight.append(args[-1])
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(args[-1])
+        return f"Name: {args[-1]}\nCPU(s): 1\nMax memory: 1048576 KiB\nState: running\n"
+
+    libvirt = LibvirtCollector(power_profile=PROFILE, async_runner=fake_virsh, max_workers=2)
+    inventory = asyncio.run(libvirt.acollect())
+    assert [w.name for w in inventory.workloads] == [f"vm{i}" for i in range(5)]
+    assert max(peak) == 2
+
+    async def fake_docker(args):
+        return "container1,5.0%,128MiB / 8GiB"
+
+    docker = DockerCollector(power_profile=PROFILE, async_runner=fake_docker)
+    assert asyncio.run(docker.acollect()).workloads[0].name == "container1"
+
+
+def test_acollect_adapts_sync_runners_and_collectors(monkeypatch):
+    import asyncio
+
+    from homelab_cost_optimizer import collectors
+    from homelab_cost_optimizer.collectors.base import BaseCollector
+    from homelab_cost_optimizer.models import Inventory, Node
+
+    nodes_json = {"items": [{"metadata": {"name": "node1"}, "status": {"capacity": {}}}]}
+
+    def fake_kubectl(args):
+        return json.dumps(nodes_json if "nodes" in args else {"items": []})
+
+    class SyncOnlyCollector(BaseCollector):
+        def collect(self):
+            return Inventory(nodes=[Node("nas", "nas", 4, 8, self.power_profile)], workloads=[])
+
+    monkeypatch.setitem(collectors.COLLECTOR_REGISTRY, "sync-only", SyncOnlyCollector)
+    inventory = asyncio.run(
+        collectors.acollect_many(
+            [
+                {"source": "k8s", "power_profile": PROFILE, "runner": fake_kubectl},
+                {"source": "sync-only", "power_profile": PROFILE},
+            ]
+        )
+    )
+    assert [node.name for node in inventory.nodes] == ["node1", "nas"]
+
+
+def test_proxmox_collect_does_not_import_asyncio():
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parents[2]
+    code = (
+        "import sys\n"
+        "from homelab_cost_optimizer.collectors import create_collector\n"
+        "from homelab_cost_optimizer.models import PowerProfile\n"
+        "collector = create_collector('proxmox', base_url='https://pve', token_id='id',"
+        " token_secret='secret', power_profile=PowerProfile('p', 1, 1, 1))\n"
+        "collector._get = lambda path: {'data': []}\n"
+        "collector.collect()\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(root / "optimizer"), str(root)])}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    assert "asyncio" not in result.stdout.split()
@@ -1,3 +1,6 @@
+from dataclasses import replace
+
+import pytest
 from homelab_cost_optimizer.config import ElectricityConfig, ScenarioConfig
 from homelab_cost_optimizer.consolidators.heuristic_consolidator import HeuristicConsolidator
 from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
@@ -52,3 +55,317 @@ def test_consolidator_moves_workloads():
     plan = consolidator.build_plan(inventory)
     assert plan.moves
     assert plan.estimated_monthly_savings >= 0
+
+
+def _reference_target(consolidator, source_node, workload, nodes, usage):
+    for node in sorted(nodes, key=lambda n: usage[n.name].cpu / n.total_cpu if n.total_cpu else 0):
+        if node.name == source_node.name:
+            continue
+        if consolidator._fits(workload, node, usage[node.name]):
+            return node
+    return None
+
+
+@pytest.mark.parametrize("bucket_size", [2, 256])
+def test_indexed_target_selection_matches_full_sort(monkeypatch, bucket_size):
+    import random
+
+    from homelab_cost_optimizer.consolidators import heuristic_consolidator
+
+    # Tiny buckets make every re-key split, empty or move entries across buckets
+    monkeypatch.setattr(heuristic_consolidator, "TARGET_BUCKET_SIZE", bucket_size)
+    rng = random.Random(7)
+    nodes = [
+        Node(
+            name=f"node{i}",
+            kind="hypervisor",
+            total_cpu=rng.choice([8, 16, 32]),
+            total_memory_gb=rng.choice([32, 64, 128]),
+            power_profile=PROFILE,
+        )
+        for i in range(40)
+    ]
+    workloads = [
+        Workload(
+            name=f"vm{i}",
+            workload_type="vm",
+            vcpus=rng.choice([1, 2, 4]),
+            memory_gb=rng.choice([2, 4, 8]),
+            utilization_cpu=0.2,
+            utilization_memory=0.2,
+            node=rng.choice(nodes).name,
+        )
+        for i in range(150)
+    ]
+    inventory = Inventory(nodes=nodes, workloads=workloads)
+    scenario = ScenarioConfig(
+        name="dense", cpu_threshold=0.4, ram_threshold=0.4, max_node_utilization=0.8
+    )
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+
+    indexed = HeuristicConsolidator(scenario, electricity).build_plan(inventory)
+
+    reference = HeuristicConsolidator(scenario, electricity)
+    powered_down = indexed.powered_down_nodes
+    monkeypatch.setattr(
+        reference,
+        "_find_target_node",
+        lambda source, workload, index, usage: _reference_target(
+            reference, source, workload, [n for n in nodes if n.name not in powered_down], usage
+        ),
+    )
+    expected = reference.build_plan(inventory)
+
+    assert expected.moves
+    assert [(m.workload.name, m.target_node) for m in indexed.moves] == [
+        (m.workload.name, m.target_node) for m in expected.moves
+    ]
+    assert indexed.powered_down_nodes == expected.powered_down_nodes
+
+
+def test_observed_sizing_packs_by_utilization():
+    inventory = build_inventory()
+    inventory.workloads.append(
+        Workload(
+            name="vm3",
+            workload_type="vm",
+            vcpus=6,
+            memory_gb=4,
+            utilization_cpu=0.2,
+            utilization_memory=0.3,
+            node="node2",
+        )
+    )
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+    allocated = ScenarioConfig(
+        name="allocated", cpu_threshold=0.6, ram_threshold=0.6, max_node_utilization=0.9
+    )
+    observed = replace(allocated, name="observed", sizing="observed")
+
+    assert not HeuristicConsolidator(allocated, electricity).build_plan(inventory).moves
+    plan = HeuristicConsolidator(observed, electricity).build_plan(inventory)
+    assert plan.powered_down_nodes
+
+
+def _random_inventory(seed: int, node_count: int, workload_count: int) -> Inventory:
+    import random
+
+    rng = random.Random(seed)
+    nodes = [
+        Node(
+            name=f"node{i}",
+            kind="hypervisor",
+            total_cpu=rng.choice([8, 16]),
+            total_memory_gb=rng.choice([32, 64]),
+            power_profile=PROFILE,
+        )
+        for i in range(node_count)
+    ]
+    workloads = [
+        Workload(
+            name=f"vm{i}",
+            workload_type="vm",
+            vcpus=rng.choice([1, 2, 4]),
+            memory_gb=rng.choice([2, 4, 8]),
+            utilization_cpu=0.2,
+            utilization_memory=0.2,
+            node=rng.choice(nodes).name,
+        )
+        for i in range(workload_count)
+    ]
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def _assert_plan_is_feasible(inventory: Inventory, plan, limit: float) -> None:
+    down = set(plan.powered_down_nodes)
+    placement = {(w.node, w.name): w.node for w in inventory.workloads}
+    for move in plan.moves:
+        assert move.target_node not in down
+        placement[(move.source_node, move.workload.name)] = move.target_node
+    for node in inventory.nodes:
+        hosted = [w for w in inventory.workloads if placement[(w.node, w.name)] == node.name]
+        if node.name in down:
+            assert not hosted
+        elif any(placement[(w.node, w.name)] != w.node for w in hosted):
+            assert sum(w.vcpus for w in hosted) <= node.total_cpu * limit
+            assert sum(w.memory_gb for w in hosted) <= node.total_memory_gb * limit
+
+
+def test_branch_and_bound_finds_the_largest_feasible_set():
+    from itertools import combinations
+
+    import numpy as np
+    from homelab_cost_optimizer.consolidators import OptimizingConsolidator
+    from homelab_cost_optimizer.consolidators.optimizing_consolidator import _Candidate
+
+    scenario = ScenarioConfig(
+        name="packed",
+        cpu_threshold=0.5,
+        ram_threshold=0.5,
+        max_node_utilization=0.85,
+        solver="branch-and-bound",
+    )
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+    consolidator = OptimizingConsolidator(scenario, electricity)
+    for seed in range(4):
+        inventory = _random_inventory(seed, node_count=10, workload_count=35)
+        plan = consolidator.build_plan(inventory)
+
+        assert plan.optimality_gap == 0.0
+        _assert_plan_is_feasible(inventory, plan, scenario.max_node_utilization)
+
+        usage = consolidator._node_usage(inventory)
+        workloads_on = consolidator._workload_lookup(inventory)
+        free = np.array(
+            [
+                (
+                    node.total_cpu * 0.85 - usage[node.name].cpu,
+                    node.total_memory_gb * 0.85 - usage[node.name].ram,
+                )
+                for node in inventory.nodes
+            ]
+        )
+        candidates = [
+            _Candidate(
+                position,
+                node,
+                workloads_on(node.name),
+                [consolidator._demand(w) for w in workloads_on(node.name)],
+            )
+            for position, node in enumerate(inventory.nodes)
+            if consolidator._node_is_candidate(node, usage[node.name]) and workloads_on(node.name)
+        ]
+        larger = range(len(plan.powered_down_nodes) + 1, len(candidates) + 1)
+        assert not any(
+            consolidator._pack(list(subset), free) is not None
+            for size in larger
+            for subset in combinations(candidates, size)
+        )
+
+
+def test_branch_and_bound_handles_thousands_of_candidates():
+    from homelab_cost_optimizer.consolidators import create_consolidator
+
+    scenario = ScenarioConfig(
+        name="fleet",
+        cpu_threshold=0.5,
+        ram_threshold=0.5,
+        max_node_utilization=0.85,
+        solver="branch-and-bound",
+        time_budget_seconds=1.0,
+    )
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+    inventory = _random_inventory(3, node_count=2500, workload_count=3000)
+    consolidator = create_consolidator(scenario, electricity)
+    usage = consolidator._node_usage(inventory)
+    hosting = {w.node for w in inventory.workloads}
+    candidates = [
+        node
+        for node in inventory.nodes
+        if node.name in hosting and consolidator._node_is_candidate(node, usage[node.name])
+    ]
+    assert len(candidates) > 1000  # deeper than the default recursion limit
+
+    plan = consolidator.build_plan(inventory)
+    heuristic = HeuristicConsolidator(scenario, electricity).build_plan(inventory)
+
+    assert len(plan.powered_down_nodes) >= len(heuristic.powered_down_nodes)
+    assert plan.optimality_gap is not None
+    _assert_plan_is_feasible(inventory, plan, scenario.max_node_utilization)
+
+
+def test_branch_and_bound_reports_gap_when_out_of_time():
+    from homelab_cost_optimizer.consolidators import create_consolidator
+
+    scenario = ScenarioConfig(
+        name="packed",
+        cpu_threshold=0.5,
+        ram_threshold=0.5,
+        max_node_utilization=0.85,
+        solver="branch-and-bound",
+        time_budget_seconds=0.0,
+    )
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+    plan = create_consolidator(scenario, electricity).build_plan(_random_inventory(1, 30, 100))
+
+    assert plan.optimality_gap is not None and plan.optimality_gap > 0
+    assert "time budget" in plan.notes
+
+    idle = create_consolidator(replace(scenario, cpu_threshold=0.0), electricity)
+    empty = idle.build_plan(_random_inventory(1, 30, 100))
+    assert empty.powered_down_nodes == []
+    assert isinstance(empty.estimated_watts_saved, float)
+    with pytest.raises(KeyError):
+        create_consolidator(replace(scenario, solver="ilp"), electricity)
+
+
+def test_failed_evacuation_is_rolled_back():
+    def vm(name: str, vcpus: float, node: str) -> Workload:
+        return Workload(
+            name=name,
+            workload_type="vm",
+            vcpus=vcpus,
+            memory_gb=4,
+            utilization_cpu=0.3,
+            utilization_memory=0.3,
+            node=node,
+        )
+
+    nodes = [
+        Node(
+            name="big", kind="hypervisor", total_cpu=16, total_memory_gb=64, power_profile=PROFILE
+        ),
+        Node(
+            name="small", kind="hypervisor", total_cpu=10, total_memory_gb=64, power_profile=PROFILE
+        ),
+    ]
+    inventory = Inventory(
+        nodes=nodes, workloads=[vm("vm1", 4, "big"), vm("vm2", 4, "big"), vm("vm3", 3, "small")]
+    )
+    scenario = ScenarioConfig(
+        name="consolidate", cpu_threshold=0.6, ram_threshold=0.6, max_node_utilization=0.8
+    )
+    plan = HeuristicConsolidator(scenario, ElectricityConfig("USD", 0.2)).build_plan(inventory)
+
+    # Only one of big's VMs fits on small; that partial move must not block small's evacuation.
+    assert [(m.workload.name, m.target_node) for m in plan.moves] == [("vm3", "big")]
+    assert plan.powered_down_nodes == ["small"]
+
+
+def test_heuristic_plans_are_feasible():
+    scenario = ScenarioConfig(
+        name="packed", cpu_threshold=0.5, ram_threshold=0.5, max_node_utilization=0.85
+    )
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+    for seed in range(4):
+        inventory = _random_inventory(seed, node_count=40, workload_count=150)
+        plan = HeuristicConsolidator(scenario, electricity).build_plan(inventory)
+        assert plan.powered_down_nodes
+        _assert_plan_is_feasible(inventory, plan, scenario.max_node_utilization)
+
+
+def test_capacity_index_tracks_workload_changes():
+    from homelab_cost_optimizer.models import CapacityIndex
+
+    inventory = _random_inventory(seed=7, node_count=6, workload_count=40)
+    index = CapacityIndex.from_inventory(inventory)
+    for node in inventory.nodes:
+        assert index.remaining(node) == pytest.approx(node.capacity_remaining(inventory.workloads))
+        assert node.capacity_remaining(index) == index.remaining(node)
+
+    moved, removed = inventory.workloads[0], inventory.workloads[1]
+    target = next(node.name for node in inventory.nodes if node.name != moved.node)
+    index.move(moved, moved.node, target)
+    index.remove(removed)
+    index.add(replace(removed, name="new", node="unknown"))
+    workloads = [replace(moved, node=target)] + inventory.workloads[2:]
+    for node in inventory.nodes:
+        assert index.remaining(node) == pytest.approx(node.capacity_remaining(workloads))
+    assert index["unknown"].cpu == removed.vcpus
+
+    # a second move starts from where the first one left the workload
+    final = next(node.name for node in inventory.nodes if node.name not in (moved.node, target))
+    index.move(moved, target, final)
+    workloads[0] = replace(moved, node=final)
+    for node in inventory.nodes:
+        assert index.remaining(node) == pytest.approx(node.capacity_remaining(workloads))
@@ -1,3 +1,4 @@
+import pytest
 from homelab_cost_optimizer.config import ElectricityConfig, ElectricityPeriod
 from homelab_cost_optimizer.estimators.cost_estimator import estimate_cost
 from homelab_cost_optimizer.estimators.power_estimator import estimate_node_power
@@ -69,3 +70,68 @@ def test_estimate_cost_periods():
     # Cost = 73 kWh * $0.15 = 10.95
     report = estimate_cost(power_report, config)
     assert report.total_monthly_cost == 10.95
+
+
+def test_time_of_use_prices_are_time_weighted(tmp_path):
+    from homelab_cost_optimizer.config import load_electricity_config
+
+    path = tmp_path / "electricity.yaml"
+    path.write_text("""
+        currency: EUR
+        price_per_kwh: 0.22
+        periods:
+          - name: peak
+            hours: ["08:00-22:00"]
+            price_per_kwh: 0.26
+          - name: offpeak
+            hours: ["22:00-08:00"]
+            price_per_kwh: 0.18
+          - name: weekend
+            hours: ["00:00-24:00"]
+            days: [sat, sun]
+            price_per_kwh: 0.10
+        """)
+    config = load_electricity_config(path)
+    prices = config.hourly_prices().reshape(7, 24)
+
+    assert prices[0, 7] == 0.18 and prices[0, 8] == 0.26 and prices[4, 22] == 0.18
+    assert (prices[5:] == 0.10).all()
+    expected = (5 * (14 * 0.26 + 10 * 0.18) + 2 * 24 * 0.10) / 168
+    assert config.effective_price() == pytest.approx(expected)
+
+
+def test_time_of_use_rejects_malformed_hours():
+    period = ElectricityPeriod("peak", 0.3, hours=["08:30-10:00"])
+    with pytest.raises(ValueError, match="whole hours"):
+        period.hour_mask()
+
+
+def test_estimate_cost_with_hourly_profile():
+    import numpy as np
+    from homelab_cost_optimizer.estimators.power_estimator import NodePowerUsage, PowerReport
+    from homelab_cost_optimizer.estimators.vectorized import time_of_use_energy
+
+    profile = PowerProfile("test", 50, 10, 1)
+    nodes = [Node("day", "server", 10, 32, profile), Node("night", "server", 10, 32, profile)]
+    power_report = PowerReport([NodePowerUsage(node, 100.0) for node in nodes])
+    config = ElectricityConfig(
+        "USD",
+        0.0,
+        [
+            ElectricityPeriod("day", 0.30, hours=["08:00-20:00"]),
+            ElectricityPeriod("night", 0.10, hours=["20:00-08:00"]),
+        ],
+    )
+    daytime = np.tile(np.r_[np.zeros(8), np.full(12, 200.0), np.zeros(4)], 7)
+    hourly_watts = np.vstack([daytime, np.roll(daytime, 12)])
+
+    report = estimate_cost(power_report, config, hourly_watts=hourly_watts)
+
+    assert [item.kwh_month for item in report.per_node] == [73.0, 73.0]
+    assert [item.monthly_cost for item in report.per_node] == [21.9, 7.3]
+    assert estimate_cost(power_report, config).total_monthly_cost == 29.2
+
+    scenarios = np.stack([hourly_watts, hourly_watts[::-1], hourly_watts * 0.5])
+    _, costs = time_of_use_energy(scenarios, config.hourly_prices(), 730)
+    assert costs.shape == (3, 2)
+    assert costs.sum(axis=1) == pytest.approx([29.2, 29.2, 14.6])
@@ -0,0 +1,98 @@
+from dataclasses import replace
+
+import pytest
+from homelab_cost_optimizer.config import ElectricityConfig
+from homelab_cost_optimizer.delta import (
+    InventoryDelta,
+    apply_delta,
+    diff_inventories,
+    load_delta,
+    save_delta,
+)
+from homelab_cost_optimizer.estimators.cost_estimator import estimate_cost, update_cost_report
+from homelab_cost_optimizer.estimators.power_estimator import (
+    build_power_report,
+    update_power_report,
+)
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+
+
+def _workload(name: str, node: str, utilization: float = 0.3) -> Workload:
+    return Workload(
+        name=name,
+        workload_type="vm",
+        vcpus=2,
+        memory_gb=4,
+        utilization_cpu=utilization,
+        utilization_memory=utilization,
+        node=node,
+    )
+
+
+def _base() -> Inventory:
+    nodes = [
+        Node(name=name, kind="hypervisor", total_cpu=8, total_memory_gb=32, power_profile=PROFILE)
+        for name in ("node1", "node2", "node3")
+    ]
+    workloads = [_workload(f"vm{i}", nodes[i % 3].name) for i in range(6)]
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def _current(base: Inventory) -> Inventory:
+    nodes = [node for node in base.nodes if node.name != "node3"]
+    nodes.append(replace(base.nodes[0], name="node4"))
+    workloads = [w for w in base.workloads if w.node != "node3" and w.name != "vm1"]
+    workloads[0] = replace(workloads[0], utilization_cpu=0.9)
+    workloads.append(_workload("vm9", "node4"))
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def test_diff_and_apply_reproduce_current_inventory(tmp_path):
+    base = _base()
+    current = _current(base)
+    delta = diff_inventories(base, current)
+
+    assert [node.name for node in delta.added_nodes] == ["node4"]
+    assert delta.removed_nodes == ["node3"]
+    assert [w.name for w in delta.changed_workloads] == ["vm0"]
+    assert ("node2", "vm1") in delta.removed_workloads
+    assert delta.touched_nodes() == {"node1", "node2", "node3", "node4"}
+
+    path = tmp_path / "delta.json"
+    save_delta(delta, path)
+    assert apply_delta(base, load_delta(path)) == current
+    assert diff_inventories(current, current).is_empty()
+
+    undigested = diff_inventories(base, current, digest=False)
+    assert undigested.base_digest == "" and undigested.touched_nodes() == delta.touched_nodes()
+    assert apply_delta(base, undigested, verify=False) == current
+
+
+def test_apply_delta_rejects_a_different_base():
+    base = _base()
+    delta = diff_inventories(base, _current(base))
+    other = Inventory(nodes=base.nodes, workloads=base.workloads[1:])
+    with pytest.raises(ValueError):
+        apply_delta(other, delta)
+    with pytest.raises(ValueError):
+        InventoryDelta.from_dict({"added_nodes": []})
+
+
+def test_update_power_report_matches_full_rebuild():
+    base = _base()
+    current = _current(base)
+    delta = diff_inventories(base, current)
+
+    updated = update_power_report(build_power_report(base), current, delta.touched_nodes())
+    assert updated == build_power_report(current)
+
+    electricity = ElectricityConfig(currency="EUR", price_per_kwh=0.3)
+    previous = estimate_cost(build_power_report(base), electricity)
+    priced = update_cost_report(previous, updated, electricity, delta.touched_nodes())
+    assert priced == estimate_cost(updated, electricity)
+    reused = update_cost_report(previous, build_power_report(base), electricity, {"node1"})
+    assert reused == previous and reused.per_node[2] is previous.per_node[2]
@@ -31,3 +31,42 @@ def test_power_and_cost_estimation():
     electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
     cost_report = estimate_cost(power_report, electricity, monthly_hours=10)
     assert cost_report.total_monthly_cost > 0
+
+
+def test_power_report_matches_per_node_estimate():
+    from homelab_cost_optimizer.estimators.power_estimator import estimate_node_power
+
+    profile = PowerProfile(
+        name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+    )
+    nodes = [
+        Node(
+            name=f"node{i}",
+            kind="hypervisor",
+            total_cpu=8,
+            total_memory_gb=64,
+            power_profile=profile,
+        )
+        for i in range(3)
+    ]
+    workloads = [
+        Workload(
+            name=f"vm{i}",
+            workload_type="vm",
+            vcpus=1 + i % 3,
+            memory_gb=2 + i % 5,
+            utilization_cpu=(i % 7) / 10,
+            utilization_memory=(i % 4) / 10,
+            node=f"node{i % 4}",  # node3 is not part of the inventory
+        )
+        for i in range(40)
+    ]
+    report = build_power_report(Inventory(nodes=nodes, workloads=workloads))
+    expected = [estimate_node_power(node, workloads).watts for node in nodes]
+    assert [entry.watts for entry in report.per_node] == expected
+
+    electricity = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+    cost_report = estimate_cost(report, electricity)
+    for entry, cost in zip(report.per_node, cost_report.per_node, strict=True):
+        assert cost.kwh_month == round(entry.watts * 730 / 1000, 2)
+        assert cost.monthly_cost == round(cost.kwh_month * 0.2, 2)
@@ -0,0 +1,64 @@
+from homelab_cost_optimizer.config import ElectricityConfig, ScenarioConfig
+from homelab_cost_optimizer.consolidators.heuristic_consolidator import HeuristicConsolidator
+from homelab_cost_optimizer.estimators.power_estimator import build_power_report
+from homelab_cost_optimizer.frame import InventoryFrame
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=50, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+
+
+def _inventory() -> Inventory:
+    nodes = [
+        Node(
+            name=f"node{i}",
+            kind="hypervisor",
+            total_cpu=32,
+            total_memory_gb=128,
+            power_profile=PROFILE,
+            metadata={"rack": str(i)},
+        )
+        for i in range(4)
+    ]
+    workloads = [
+        Workload(
+            name=f"app{i}",
+            workload_type="pod" if i % 2 else "vm",
+            vcpus=1 + i % 3,
+            memory_gb=2.5 + i % 4,
+            utilization_cpu=(i % 5) / 10,
+            utilization_memory=(i % 3) / 10,
+            node=f"node{i % 5}",  # node4 only exists as a workload reference
+            uptime_hours=i * 1.5,
+            labels={"team": "web"} if i % 4 == 0 else {},
+        )
+        for i in range(25)
+    ]
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def test_frame_round_trip_is_lossless():
+    inventory = _inventory()
+    frame = InventoryFrame.from_inventory(inventory)
+
+    assert frame.node_names[:4] == [node.name for node in inventory.nodes]
+    assert frame.workload_types == ["vm", "pod"]
+    assert len(frame.workloads) == len(inventory.workloads)
+    assert frame.workloads[-1] == inventory.workloads[-1]
+    assert frame.to_inventory() == inventory
+
+
+def test_estimators_and_consolidator_accept_frames():
+    inventory = _inventory()
+    frame = InventoryFrame.from_inventory(inventory)
+
+    assert build_power_report(frame) == build_power_report(inventory)
+
+    scenario = ScenarioConfig(
+        name="consolidate", cpu_threshold=0.5, ram_threshold=0.5, max_node_utilization=0.9
+    )
+    consolidator = HeuristicConsolidator(scenario, ElectricityConfig("USD", 0.2))
+    from_frame = consolidator.build_plan(frame)
+    assert from_frame.moves
+    assert from_frame == consolidator.build_plan(inventory)
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from homelab_cost_optimizer.frame import InventoryFrame
+from homelab_cost_optimizer.history import UtilizationHistory, load_history, save_history
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+
+
+def _inventory(utilization: float, extra: bool = False) -> Inventory:
+    node = Node(
+        name="node1", kind="hypervisor", total_cpu=8, total_memory_gb=32, power_profile=PROFILE
+    )
+    names = ["vm1", "vm2"] + (["vm3"] if extra else [])
+    workloads = [
+        Workload(
+            name=name,
+            workload_type="vm",
+            vcpus=2,
+            memory_gb=4,
+            utilization_cpu=utilization,
+            utilization_memory=utilization / 2,
+            node="node1",
+        )
+        for name in names
+    ]
+    return Inventory(nodes=[node], workloads=workloads)
+
+
+def test_percentiles_over_recorded_samples():
+    history = UtilizationHistory(resolution_seconds=60, capacity=100)
+    for minute in range(20):
+        history.record(_inventory(minute / 20), timestamp=minute * 60)
+
+    cpu, memory = history.percentiles(50)[("node1", "vm1")]
+    assert cpu == pytest.approx(np.percentile(np.arange(20) / 20, 50), abs=1e-6)
+    assert memory == pytest.approx(cpu / 2, abs=1e-6)
+    recent, _ = history.percentiles(50, window_seconds=5 * 60)[("node1", "vm1")]
+    assert recent == pytest.approx(0.85, abs=1e-6)
+
+
+def test_samples_in_one_bucket_are_averaged_and_ring_wraps():
+    history = UtilizationHistory(resolution_seconds=60, capacity=3)
+    history.record(_inventory(0.2), timestamp=0)
+    history.record(_inventory(0.4), timestamp=30)
+    assert len(history) == 1
+    assert history.percentiles(50)[("node1", "vm1")][0] == pytest.approx(0.3)
+
+    for minute in range(1, 5):
+        history.record(_inventory(0.9, extra=minute == 4), timestamp=minute * 60)
+    assert len(history) == 3
+    assert history.percentiles(0)[("node1", "vm1")][0] == pytest.approx(0.9)
+    assert ("node1", "vm3") in history.percentiles(50)
+
+    with pytest.raises(ValueError):
+        history.record(_inventory(0.1), timestamp=0)
+
+
+def test_with_percentile_handles_inventory_and_frame(tmp_path):
+    history = UtilizationHistory(resolution_seconds=60, capacity=10)
+    for minute, utilization in enumerate([0.1, 0.2, 0.9]):
+        history.record(_inventory(utilization), timestamp=minute * 60)
+    path = tmp_path / "history.npz"
+    save_history(history, path)
+    history = load_history(path)
+
+    current = _inventory(0.5, extra=True)
+    peak = history.with_percentile(current, 100)
+    assert [w.utilization_cpu for w in peak.workloads] == pytest.approx([0.9, 0.9, 0.5])
+
+    frame_peak = history.with_percentile(InventoryFrame.from_inventory(current), 100)
+    assert frame_peak.to_inventory() == peak
+
+
+def test_hourly_utilization_by_hour_of_week():
+    from homelab_cost_optimizer.history import hour_of_week
+
+    monday = 4 * 86400  # 1970-01-05 was a Monday
+    assert hour_of_week(np.array([monday, monday + 86400 + 3 * 3600])).tolist() == [0, 27]
+
+    history = UtilizationHistory(resolution_seconds=3600, capacity=10)
+    history.record(_inventory(0.2), timestamp=monday + 9 * 3600)
+    history.record(_inventory(0.8), timestamp=monday + 10 * 3600)
+
+    cpu, memory = history.hourly_utilization(_inventory(0.5, extra=True))
+    assert cpu.shape == (3, 168)
+    assert cpu[0, 9] == pytest.approx(0.2) and cpu[0, 10] == pytest.approx(0.8)
+    assert cpu[0, 100] == pytest.approx(0.5)  # mean of the sampled hours
+    assert (cpu[2] == 0.5).all() and (memory[2] == 0.25).all()
+
+
+def test_rows_grow_in_place_and_vanished_workloads_are_pruned(tmp_path):
+    history = UtilizationHistory(resolution_seconds=60, capacity=3)
+    history.record(_inventory(0.2), timestamp=0)
+    history.record(_inventory(0.2, extra=True), timestamp=60)
+    buffer = history.cpu.base
+    assert history.keys == [("node1", "vm1"), ("node1", "vm2"), ("node1", "vm3")]
+    assert buffer is not None and buffer.shape[0] == 4  # doubled from two rows
+
+    # vm3 is missing for a full ring, so its last sample is overwritten and the row dropped
+    for minute in range(2, 5):
+        history.record(_inventory(0.4), timestamp=minute * 60)
+    assert history.keys == [("node1", "vm1"), ("node1", "vm2")]
+    assert history.cpu.shape == (2, 3) and history.counts.shape == (2, 3)
+    assert set(history.percentiles(50)) == {("node1", "vm1"), ("node1", "vm2")}
+    history.record(_inventory(0.4, extra=True), timestamp=300)
+    assert history.cpu.base is buffer  # vm3 is back in a spare row, without reallocating
+    assert np.isnan(history.cpu[2]).sum() == 2  # and that row starts blank
+
+    path = tmp_path / "history.npz"
+    save_history(history, path)
+    loaded = load_history(path)
+    assert loaded.keys == history.keys and loaded.counts.dtype == np.uint8
+    np.testing.assert_array_equal(loaded.cpu, history.cpu)
+
+
+def test_load_history_converts_wide_counts(tmp_path):
+    history = UtilizationHistory(resolution_seconds=60, capacity=2)
+    history.record(_inventory(0.2), timestamp=0)
+    history.counts = np.full(history.counts.shape, 1000, dtype=np.uint16)
+    path = tmp_path / "history.npz"
+    save_history(history, path)
+    assert load_history(path).counts.tolist() == [[255, 255], [255, 255]]
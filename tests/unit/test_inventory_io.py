@@ -0,0 +1,81 @@
+import pytest
+from homelab_cost_optimizer.frame import InventoryFrame
+from homelab_cost_optimizer.inventory_io import iter_jsonl_records, load_inventory, save_inventory
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+
+
+def _inventory() -> Inventory:
+    nodes = [
+        Node(
+            name="node1", kind="hypervisor", total_cpu=8, total_memory_gb=32, power_profile=PROFILE
+        )
+    ]
+    workloads = [
+        Workload(
+            name=f"vm{i}",
+            workload_type="vm",
+            vcpus=2,
+            memory_gb=4,
+            utilization_cpu=0.3,
+            utilization_memory=0.3,
+            node="node1",
+            labels={"tier": "db"} if i == 0 else {},
+        )
+        for i in range(3)
+    ]
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def test_jsonl_round_trip(tmp_path):
+    inventory = _inventory()
+    path = tmp_path / "inventory.jsonl"
+    save_inventory(inventory, path)
+
+    assert len(path.read_text().splitlines()) == 5  # profile, node and three workloads
+    loaded = load_inventory(path)
+    assert isinstance(loaded, InventoryFrame)
+    assert loaded.to_inventory() == inventory
+
+
+def test_json_files_still_load_as_inventory(tmp_path):
+    inventory = _inventory()
+    path = tmp_path / "inventory.json"
+    save_inventory(inventory, path)
+    assert load_inventory(path) == inventory
+
+
+def test_jsonl_rejects_unknown_records():
+    lines = ['{"record": "node", "name": "node1"}', "", '{"record": "switch", "name": "sw1"}']
+    with pytest.raises(ValueError, match="Line 3: unknown inventory record type 'switch'"):
+        list(iter_jsonl_records(lines))
+
+
+def test_binary_round_trip_is_memory_mapped(tmp_path):
+    inventory = _inventory()
+    path = tmp_path / "inventory.hcoi"
+    save_inventory(inventory, path)
+
+    loaded = load_inventory(path)
+    assert isinstance(loaded, InventoryFrame)
+    assert not loaded.vcpus.flags.owndata
+    assert not loaded.vcpus.flags.writeable
+    assert loaded.to_inventory() == inventory
+
+
+def test_binary_handles_empty_inventory(tmp_path):
+    path = tmp_path / "empty.hcoi"
+    save_inventory(Inventory(nodes=[], workloads=[]), path)
+    assert load_inventory(path).to_inventory() == Inventory(nodes=[], workloads=[])
+
+
+def test_binary_rejects_foreign_files(tmp_path):
+    from homelab_cost_optimizer.inventory_io import read_inventory_binary
+
+    path = tmp_path / "inventory.hcoi"
+    path.write_bytes(b"not an inventory")
+    with pytest.raises(ValueError, match="not a binary inventory file"):
+        read_inventory_binary(path)
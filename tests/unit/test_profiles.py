@@ -0,0 +1,123 @@
+import json
+
+import pytest
+from homelab_cost_optimizer.config import ProfileRule, load_optimizer_config
+from homelab_cost_optimizer.inventory_io import load_inventory, save_inventory
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile
+from homelab_cost_optimizer.profiles import ProfileAssigner
+
+DEFAULT = PowerProfile(
+    name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+PROFILES = {
+    "default": DEFAULT,
+    "rack": PowerProfile(
+        name="rack", base_idle_watts=120, watts_per_cpu_core=8, watts_per_gb_ram=0.4
+    ),
+    "mini": PowerProfile(
+        name="mini", base_idle_watts=12, watts_per_cpu_core=4, watts_per_gb_ram=0.3
+    ),
+    "gpu": PowerProfile(name="gpu", base_idle_watts=90, watts_per_cpu_core=9, watts_per_gb_ram=0.5),
+}
+
+
+def _node(name: str, kind: str = "hypervisor", cpu: float = 8, memory_gb: float = 32, **metadata):
+    return Node(name, kind, cpu, memory_gb, DEFAULT, metadata=metadata)
+
+
+def test_first_matching_rule_assigns_shared_profile():
+    assigner = ProfileAssigner(
+        [
+            ProfileRule(profile="gpu", metadata={"gpu": True}),
+            ProfileRule(profile="rack", name="pve-*", kind="hypervisor", min_cpu=32),
+            ProfileRule(profile="mini", kind="docker-host", max_memory_gb=16),
+        ],
+        PROFILES,
+    )
+    inventory = Inventory(
+        nodes=[
+            _node("pve-1", cpu=64),
+            _node("pve-2", cpu=64),
+            _node("pve-small", cpu=16),
+            _node("nuc", kind="docker-host", memory_gb=16),
+            _node("nuc-big", kind="docker-host", memory_gb=64),
+            _node("pve-gpu", cpu=64, gpu=True),
+        ],
+        workloads=[],
+    )
+    assigned = assigner.apply(inventory)
+    names = [node.power_profile.name for node in assigned.nodes]
+    assert names == ["rack", "rack", "default", "mini", "default", "gpu"]
+    assert assigned.nodes[0].power_profile is assigned.nodes[1].power_profile is PROFILES["rack"]
+    assert assigned.nodes[2] is inventory.nodes[2]
+
+    with pytest.raises(KeyError, match="missing"):
+        ProfileAssigner([ProfileRule(profile="missing")], PROFILES)
+
+
+def test_inventory_lists_each_profile_once(tmp_path):
+    assigner = ProfileAssigner([ProfileRule(profile="rack", name="pve-*")], PROFILES)
+    inventory = assigner.apply(
+        Inventory(nodes=[_node(f"pve-{i}") for i in range(3)] + [_node("nuc")], workloads=[])
+    )
+    data = inventory.to_dict()
+    assert set(data["power_profiles"]) == {"rack", "default"}
+    assert [node["power_profile"] for node in data["nodes"]] == ["rack"] * 3 + ["default"]
+
+    loaded = Inventory.from_dict(json.loads(json.dumps(data)))
+    assert loaded == inventory
+    assert loaded.nodes[0].power_profile is loaded.nodes[2].power_profile
+
+    for suffix in (".jsonl", ".hcoi"):
+        path = tmp_path / f"inventory{suffix}"
+        save_inventory(inventory, path)
+        nodes = load_inventory(path).nodes
+        assert nodes == inventory.nodes
+        assert nodes[0].power_profile is nodes[1].power_profile
+
+
+def test_inline_profiles_still_load_and_are_shared():
+    inline = {
+        "name": "rack",
+        "base_idle_watts": 120,
+        "watts_per_cpu_core": 8,
+        "watts_per_gb_ram": 0.4,
+    }
+    data = {"nodes": [{"name": f"n{i}", "power_profile": dict(inline)} for i in range(2)]}
+    nodes = Inventory.from_dict(data).nodes
+    assert nodes[0].power_profile == PROFILES["rack"]
+    assert nodes[0].power_profile is nodes[1].power_profile
+
+    with pytest.raises(ValueError, match="Node 'n0': Unknown power profile 'rack'"):
+        Inventory.from_dict({"nodes": [{"name": "n0", "power_profile": "rack"}]})
+
+
+def test_conflicting_profile_names_stay_inline():
+    other = PowerProfile(
+        name="default", base_idle_watts=30, watts_per_cpu_core=5, watts_per_gb_ram=1
+    )
+    inventory = Inventory(nodes=[_node("a"), Node("b", "hypervisor", 8, 32, other)], workloads=[])
+    data = inventory.to_dict()
+    assert data["nodes"][0]["power_profile"] == "default"
+    assert data["nodes"][1]["power_profile"]["base_idle_watts"] == 30
+    assert Inventory.from_dict(data) == inventory
+
+
+def test_optimizer_config_loads_profile_rules(tmp_path):
+    path = tmp_path / "optimizer.yaml"
+    path.write_text(
+        "power_profiles:\n  rack: {base_idle_watts: 120}\n"
+        "power_profile_rules:\n"
+        "  - {profile: rack, name: 'pve-*', min_cpu: 32, metadata: {rack: a}}\n"
+    )
+    rules = load_optimizer_config(path).profile_rules
+    assert rules == [
+        ProfileRule(profile="rack", name="pve-*", metadata={"rack": "a"}, min_cpu=32.0)
+    ]
+
+    path.write_text("power_profile_rules:\n  - {profile: rack}\n")
+    with pytest.raises(ValueError, match="rule 1: unknown power profile 'rack'"):
+        load_optimizer_config(path)
+    path.write_text("power_profile_rules:\n  - {profile: default, label: x}\n")
+    with pytest.raises(ValueError, match="rule 1: unknown field"):
+        load_optimizer_config(path)
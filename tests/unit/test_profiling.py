@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+from homelab_cost_optimizer.profiling import Instrumentation, instrument, phase
+
+
+def test_phases_are_no_ops_without_instrumentation():
+    with phase("idle"):
+        pass
+
+    @phase("decorated")
+    def work():
+        return 42
+
+    assert work() == 42
+
+
+def test_instrument_counts_calls_and_nested_peaks():
+    seen = []
+
+    @phase("inner")
+    def allocate(size):
+        return bytearray(size)
+
+    with instrument(trace_memory=True, hooks=[lambda *args: seen.append(args[0])]) as timings:
+        with phase("outer"):
+            allocate(4 * 2**20)
+            allocate(1 * 2**20)
+        with pytest.raises(RuntimeError), phase("failing"):
+            raise RuntimeError("boom")
+
+    inner, outer, failing = (timings.phases[name] for name in ("inner", "outer", "failing"))
+    assert (inner.calls, outer.calls, failing.calls) == (2, 1, 1)
+    assert inner.peak_memory_bytes >= 4 * 2**20
+    assert outer.peak_memory_bytes >= inner.peak_memory_bytes
+    assert outer.wall_seconds >= inner.wall_seconds
+    assert seen == ["inner", "inner", "outer", "failing"]
+    assert [entry["name"] for entry in timings.summary()["phases"]] == list(timings.phases)
+
+
+def test_wall_time_only_by_default():
+    timings = Instrumentation()
+    timings.start()
+    with timings.phase("load"):
+        pass
+    timings.stop()
+    assert timings.phases["load"].peak_memory_bytes is None
+    assert timings.total_seconds >= timings.phases["load"].wall_seconds
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import replace
+
+import pytest
+from homelab_cost_optimizer.config import ElectricityConfig, ScenarioConfig
+from homelab_cost_optimizer.estimators.cost_estimator import estimate_cost
+from homelab_cost_optimizer.estimators.power_estimator import build_power_report
+from homelab_cost_optimizer.models import (
+    ConsolidationMove,
+    ConsolidationPlan,
+    Inventory,
+    Node,
+    PowerProfile,
+    Workload,
+)
+from homelab_cost_optimizer.reporters import (
+    generate_markdown_report,
+    generate_sweep_report,
+    generate_text_report,
+    iter_markdown_report,
+    iter_prometheus_metrics,
+    iter_report_rows,
+    iter_sweep_report,
+    iter_text_report,
+    write_lines,
+    write_structured_report,
+)
+from homelab_cost_optimizer.reporters.prometheus_reporter import metric_family
+from homelab_cost_optimizer.reporters.structured_reporter import REPORT_FIELDS
+from homelab_cost_optimizer.sweep import SweepResult
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+
+
+def _report_inputs(move_count: int):
+    nodes = [Node(f"node{i}", "hypervisor", 16, 64, PROFILE) for i in range(3)]
+    workloads = [
+        Workload(f"vm{i}", "vm", 1, 2, 0.1, 0.2, nodes[i % 3].name) for i in range(move_count)
+    ]
+    inventory = Inventory(nodes=nodes, workloads=workloads)
+    power_report = build_power_report(inventory)
+    cost_report = estimate_cost(power_report, ElectricityConfig(currency="EUR", price_per_kwh=0.3))
+    plan = ConsolidationPlan(
+        moves=[ConsolidationMove(w, w.node, "node0") for w in workloads],
+        powered_down_nodes=["node1", "node2"],
+        estimated_watts_saved=120.0,
+        estimated_monthly_savings=26.28,
+        notes="validate first",
+    )
+    return inventory, power_report, cost_report, plan
+
+
+@pytest.mark.parametrize("move_count", [0, 1, 1020, 2500])
+@pytest.mark.parametrize(
+    "generate, iterate",
+    [(generate_text_report, iter_text_report), (generate_markdown_report, iter_markdown_report)],
+)
+def test_streamed_reports_match_joined_reports(tmp_path, move_count, generate, iterate):
+    inputs = _report_inputs(move_count)
+    joined, streamed = tmp_path / "joined", tmp_path / "streamed"
+    joined.write_text(generate(*inputs))
+    write_lines(iterate(*inputs), streamed, buffer_size=4096)
+    assert streamed.read_bytes() == joined.read_bytes()
+
+    inventory, power_report, cost_report, _ = inputs
+    joined.write_text(generate(inventory, power_report, cost_report, None))
+    write_lines(iterate(inventory, power_report, cost_report, None), streamed)
+    assert streamed.read_bytes() == joined.read_bytes()
+
+
+def test_streamed_sweep_report_and_edge_cases(tmp_path):
+    scenario = ScenarioConfig(
+        name="s", cpu_threshold=0.2, ram_threshold=0.3, max_node_utilization=0.8
+    )
+    results = [SweepResult(scenario, i % 4, i, 60.0 * i, 1.5 * i, 0.25) for i in range(1500)]
+    path = tmp_path / "sweep.md"
+    write_lines(iter_sweep_report(results, "USD"), path)
+    assert path.read_text() == generate_sweep_report(results, "USD")
+
+    for lines in ([], [""], ["", ""], ["a", "", "b"], ["x"] * 1024, ["x"] * 1025):
+        write_lines(iter(lines), path)
+        assert path.read_text() == "\n".join(lines)
+
+
+def test_structured_reports_hold_node_and_move_rows(tmp_path):
+    _, power_report, cost_report, plan = _report_inputs(2)
+    rows = list(iter_report_rows(power_report, cost_report, plan))
+    assert [row["record"] for row in rows] == ["node"] * 3 + ["move"] * 2
+    assert rows[1] == {
+        "record": "node",
+        "node": "node1",
+        "kind": "hypervisor",
+        "watts": power_report.per_node[1].watts,
+        "kwh_month": cost_report.per_node[1].kwh_month,
+        "monthly_cost": cost_report.per_node[1].monthly_cost,
+        "currency": "EUR",
+        "powered_down": True,
+    }
+    assert rows[4]["source_node"] == "node1" and rows[4]["target_node"] == "node0"
+
+    jsonl = tmp_path / "report.jsonl"
+    write_structured_report("jsonl", power_report, cost_report, plan, jsonl)
+    assert [json.loads(line) for line in jsonl.read_text().splitlines()] == rows
+
+    csv_path = tmp_path / "report.csv"
+    write_structured_report("CSV", power_report, cost_report, None, csv_path)
+    with csv_path.open(newline="") as handle:
+        table = list(csv.DictReader(handle))
+    assert list(table[0]) == list(REPORT_FIELDS)
+    assert [row["node"] for row in table] == ["node0", "node1", "node2"]
+    assert table[0]["powered_down"] == "False" and table[0]["workload"] == ""
+
+    with pytest.raises(KeyError):
+        write_structured_report("xml", power_report, cost_report, plan, tmp_path / "x")
+
+
+def test_parquet_report_round_trips(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    _, power_report, cost_report, plan = _report_inputs(3)
+    path = tmp_path / "report.parquet"
+    write_structured_report("parquet", power_report, cost_report, plan, path)
+    table = parquet.read_table(path)
+    assert table.column_names == list(REPORT_FIELDS)
+    assert table.column("record").to_pylist() == ["node"] * 3 + ["move"] * 3
+
+
+def test_prometheus_metrics_exposition():
+    inventory, power_report, cost_report, plan = _report_inputs(2)
+    inventory.nodes[2] = replace(inventory.nodes[2], name='rack "b"\\2')
+    power_report = build_power_report(inventory)
+    text = "\n".join(iter_prometheus_metrics(power_report, cost_report, plan))
+    lines = text.splitlines()
+
+    assert text.endswith("\n")
+    assert "# TYPE homelab_cost_optimizer_node_power_watts gauge" in lines
+    watts = power_report.per_node[0].watts
+    assert (
+        f'homelab_cost_optimizer_node_power_watts{{node="node0",kind="hypervisor"}} {watts!r}'
+        in lines
+    )
+    assert 'node="rack \\"b\\"\\\\2"' in text
+    assert (
+        'homelab_cost_optimizer_node_power_down_candidate{node="node1",kind="hypervisor"} 1.0'
+        in lines
+    )
+    assert "homelab_cost_optimizer_plan_moves 2.0" in lines
+    assert 'homelab_cost_optimizer_plan_monthly_savings{currency="EUR"} 26.28' in lines
+    assert "plan_optimality_gap" not in text
+
+    without_plan = list(iter_prometheus_metrics(power_report, cost_report, None))
+    assert not any("plan" in line or "candidate" in line for line in without_plan)
+
+
+def test_prometheus_special_values():
+    lines = list(
+        metric_family("x", "help", [({}, float("inf")), ({}, float("-inf")), ({}, float("nan"))])
+    )
+    assert lines[2:] == [
+        "homelab_cost_optimizer_x +Inf",
+        "homelab_cost_optimizer_x -Inf",
+        "homelab_cost_optimizer_x NaN",
+    ]
+
+
+def test_reporters_do_not_import_the_sweep_runner():
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parents[2]
+    code = (
+        "import sys\n"
+        "import homelab_cost_optimizer.reporters\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(root / "optimizer"), str(root)])}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    modules = set(result.stdout.split())
+    assert not modules & {"homelab_cost_optimizer.sweep", "concurrent.futures"}
@@ -0,0 +1,161 @@
+import json
+import os
+import socket
+import threading
+import urllib.error
+import urllib.request
+from dataclasses import replace
+
+import pytest
+from homelab_cost_optimizer.config import ElectricityConfig, ScenarioConfig
+from homelab_cost_optimizer.estimators.power_estimator import build_power_report
+from homelab_cost_optimizer.inventory_io import save_inventory
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
+from homelab_cost_optimizer.service import OptimizerService, create_server, file_source
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=60, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+ELECTRICITY = ElectricityConfig(currency="EUR", price_per_kwh=0.3)
+SCENARIO = ScenarioConfig(
+    name="low", cpu_threshold=0.5, ram_threshold=0.5, max_node_utilization=0.9
+)
+
+
+def _inventory(utilization: float = 0.1) -> Inventory:
+    nodes = [
+        Node(name=name, kind="hypervisor", total_cpu=16, total_memory_gb=64, power_profile=PROFILE)
+        for name in ("node1", "node2", "node3")
+    ]
+    workloads = [
+        Workload(f"vm{i}", "vm", 2, 4, utilization, utilization, nodes[i % 3].name)
+        for i in range(6)
+    ]
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def test_refresh_recomputes_only_touched_nodes():
+    changed = _inventory()
+    changed.workloads[0] = replace(changed.workloads[0], utilization_cpu=0.9)
+    snapshots = iter([_inventory(), None, _inventory(), changed])
+    service = OptimizerService(lambda: next(snapshots), ELECTRICITY, SCENARIO)
+
+    assert service.refresh()
+    first = service.state
+    assert first.generation == 1 and first.plan is not None
+    assert not service.refresh()  # source reports no change
+    assert not service.refresh()  # same inventory collected again
+    assert service.state is first
+
+    assert service.refresh()
+    second = service.state
+    assert second.generation == 2
+    assert second.power_report == build_power_report(changed)
+    assert second.power_report.per_node[0] is not first.power_report.per_node[0]
+    reused = zip(second.power_report.per_node[1:], first.power_report.per_node[1:], strict=True)
+    assert all(new is old for new, old in reused)
+
+
+def test_file_source_reloads_on_change(tmp_path):
+    path = tmp_path / "inventory.json"
+    save_inventory(_inventory(), path)
+    source = file_source(path)
+    assert source() == _inventory()
+    assert source() is None
+    modified = path.stat().st_mtime_ns
+    save_inventory(_inventory(0.5), path)
+    os.utime(path, ns=(modified, modified + 1_000_000_000))
+    assert source() == _inventory(0.5)
+
+
+@pytest.fixture
+def served():
+    service = OptimizerService(lambda: _inventory(), ELECTRICITY, SCENARIO)
+    service.refresh()
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield service, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url: str | urllib.request.Request):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_http_api_serves_rendered_state(served):
+    service, base = served
+    status, summary = _get(base + "/summary")
+    assert status == 200
+    assert summary["nodes"] == 3 and summary["workloads"] == 6
+    assert summary["total_watts"] == service.state.power_report.total_watts
+    assert summary["currency"] == "EUR"
+
+    status, node = _get(base + "/nodes/node2")
+    assert status == 200 and node["node"] == "node2" and node["record"] == "node"
+    assert len(_get(base + "/nodes")[1]) == 3
+    plan = _get(base + "/plan")[1]
+    assert plan["powered_down_nodes"] == service.state.plan.powered_down_nodes
+    assert _get(base + "/health")[1]["status"] == "ok"
+    assert _get(base + "/nodes/missing")[0] == 404
+
+    with urllib.request.urlopen(base + "/metrics", timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        metrics = response.read().decode()
+    assert "homelab_cost_optimizer_refresh_generation 1.0" in metrics.splitlines()
+    assert 'homelab_cost_optimizer_node_power_watts{node="node2",kind="hypervisor"}' in metrics
+    assert service.state.responses["/metrics"][1] == metrics.encode()
+
+    request = urllib.request.Request(base + "/refresh", method="POST")
+    with urllib.request.urlopen(request, timeout=5) as response:
+        assert json.loads(response.read()) == {"changed": False, "generation": 1}
+
+
+def test_failed_refresh_is_reported(served):
+    service, base = served
+    source = service.source
+
+    def unreachable():
+        raise ConnectionError("pve unreachable")
+
+    service.source = unreachable
+    request = urllib.request.Request(base + "/refresh", method="POST")
+    status, body = _get(request)
+    assert status == 500
+    assert body == {"error": "ConnectionError: pve unreachable"}
+    health = _get(base + "/health")[1]
+    assert health["status"] == "degraded"
+    assert health["last_error"] == "ConnectionError: pve unreachable"
+    assert _get(base + "/summary")[0] == 200  # the previous state is still served
+
+    service.source = source
+    assert _get(request)[0] == 200
+    assert _get(base + "/health")[1] == {**health, "status": "ok", "last_error": None}
+
+
+def test_unix_socket_server(tmp_path):
+    service = OptimizerService(lambda: _inventory(), ELECTRICITY)
+    path = tmp_path / "optimizer.sock"
+    server = create_server(service, socket_path=path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(path))
+            client.sendall(b"GET /summary HTTP/1.0\r\n\r\n")
+            response = b"".join(iter(lambda: client.recv(4096), b""))
+        assert response.startswith(b"HTTP/1.0 503")
+        service.refresh()
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(path))
+            client.sendall(b"GET /plan HTTP/1.0\r\n\r\n")
+            response = b"".join(iter(lambda: client.recv(4096), b""))
+        assert response.startswith(b"HTTP/1.0 200")
+        assert response.endswith(b"null")
+    finally:
+        server.shutdown()
+        server.server_close()
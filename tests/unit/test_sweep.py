@@ -0,0 +1,79 @@
+import pytest
+from homelab_cost_optimizer.config import ElectricityConfig, ScenarioConfig
+from homelab_cost_optimizer.consolidators import HeuristicConsolidator
+from homelab_cost_optimizer.models import Inventory, Node, PowerProfile, Workload
+from homelab_cost_optimizer.sweep import (
+    SweepResult,
+    pareto_front,
+    run_sweep,
+    scenario_grid,
+)
+
+PROFILE = PowerProfile(
+    name="default", base_idle_watts=50, watts_per_cpu_core=10, watts_per_gb_ram=1
+)
+BASE = ScenarioConfig(name="base", cpu_threshold=0.3, ram_threshold=0.3, max_node_utilization=0.7)
+ELECTRICITY = ElectricityConfig(currency="USD", price_per_kwh=0.2)
+
+
+def _inventory() -> Inventory:
+    nodes = [
+        Node(
+            name=f"node{i}",
+            kind="hypervisor",
+            total_cpu=16,
+            total_memory_gb=64,
+            power_profile=PROFILE,
+        )
+        for i in range(4)
+    ]
+    workloads = [
+        Workload(
+            name=f"vm{i}",
+            workload_type="vm",
+            vcpus=2,
+            memory_gb=4,
+            utilization_cpu=0.3,
+            utilization_memory=0.3,
+            node=nodes[i % 4].name,
+        )
+        for i in range(10)
+    ]
+    return Inventory(nodes=nodes, workloads=workloads)
+
+
+def test_scenario_grid_is_a_cartesian_product():
+    scenarios = scenario_grid(BASE, cpu_threshold=[0.2, 0.4], max_node_utilization=[0.6, 0.8, 0.9])
+
+    assert len(scenarios) == 6
+    assert {(s.cpu_threshold, s.max_node_utilization) for s in scenarios} == {
+        (c, m) for c in (0.2, 0.4) for m in (0.6, 0.8, 0.9)
+    }
+    assert all(s.ram_threshold == 0.3 for s in scenarios)
+    assert scenarios[0].name == "base[cpu_threshold=0.2,max_node_utilization=0.6]"
+    with pytest.raises(ValueError):
+        scenario_grid(BASE, solver=[1.0])
+
+
+def test_process_pool_sweep_matches_serial_plans():
+    inventory = _inventory()
+    scenarios = scenario_grid(BASE, max_node_utilization=[0.5, 0.7, 0.9])
+
+    parallel = run_sweep(inventory, ELECTRICITY, scenarios, max_workers=2)
+
+    assert parallel == run_sweep(inventory, ELECTRICITY, scenarios, max_workers=1)
+    for result, scenario in zip(parallel, scenarios, strict=True):
+        plan = HeuristicConsolidator(scenario, ELECTRICITY).build_plan(inventory)
+        assert result.scenario == scenario
+        assert result.moves == len(plan.moves)
+        assert result.estimated_monthly_savings == plan.estimated_monthly_savings
+
+
+def test_pareto_front_drops_dominated_results():
+    def result(savings: float, moves: int, headroom: float) -> SweepResult:
+        return SweepResult(BASE, 1, moves, savings * 10, savings, headroom)
+
+    best = result(10, 2, 0.3)
+    cautious = result(5, 1, 0.5)
+    dominated = result(5, 3, 0.2)
+    assert pareto_front([dominated, cautious, best]) == [best, cautious]
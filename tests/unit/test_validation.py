@@ -24,3 +24,35 @@ def test_inventory_valid():
     assert inv.nodes[0].name == "node1"
     assert len(inv.workloads) == 1
     assert inv.workloads[0].name == "app1"
+
+
+def test_collection_config_requires_source(tmp_path):
+    from homelab_cost_optimizer.config import load_collection_config
+
+    path = tmp_path / "sources.yaml"
+    path.write_text("sources:\n  - host_name: kvm-01\n")
+    with pytest.raises(ValueError, match="missing required field 'source'"):
+        load_collection_config(path)
+
+
+def test_collection_config_splits_options(tmp_path):
+    from homelab_cost_optimizer.config import load_collection_config
+
+    path = tmp_path / "sources.yaml"
+    path.write_text(
+        "max_workers: 2\nsources:\n  - source: libvirt\n    uri: qemu+ssh://kvm-01/system\n"
+    )
+    config = load_collection_config(path)
+    assert config.max_workers == 2
+    assert config.sources[0].source == "libvirt"
+    assert config.sources[0].power_profile == "default"
+    assert config.sources[0].options == {"uri": "qemu+ssh://kvm-01/system"}
+
+
+def test_optimizer_config_rejects_unknown_sizing(tmp_path):
+    from homelab_cost_optimizer.config import load_optimizer_config
+
+    path = tmp_path / "optimizer.yaml"
+    path.write_text("scenarios:\n  packed:\n    sizing: peak\n")
+    with pytest.raises(ValueError, match="unknown sizing 'peak'"):
+        load_optimizer_config(path)